@@ -1,42 +1,186 @@
 import dash
 from dash import Dash, dcc, html, Input, Output, State, dash_table, MATCH, ALL
-import pandas as pd
+import functools
+import logging
 import os
+import threading
 from datetime import datetime, timedelta
 
-from config import DATA_DIR
-from contracts.contract_manager import ContractManager
-from data.trade_processor import TradeProcessor
+from config import (BACKGROUND_CACHE_DIR, BACKGROUND_CALLBACKS, BACKGROUND_JOB_THREADS, DATA_DIR, INGEST_LOCK_FILE,
+                    INGEST_WATCHER_ENABLED, PROFILE_REQUESTS)
+from data.data_index import get_data_index
+from logging_config import configure_logging
+from monitoring.profiling import RequestProfiler
+from monitoring.routes import register_monitoring_routes
+from monitoring.timing import timed
 from notes.note_manager import NoteManager
 from notes.trade_note_manager import TradeNoteManager
-from ui.dashboard_components import DashboardComponents
-try:
-    from ui.monthly_summary import MonthlySummaryComponents
-    MONTHLY_SUMMARY_AVAILABLE = True
-except ImportError as e:
-    print(f"Warning: Monthly summary dependencies missing: {e}")
-    from ui.monthly_fallback import MonthlyFallback
-    MONTHLY_SUMMARY_AVAILABLE = False
+from storage.file_lock import hold_process_lock
+from ui.render_cache import RenderCache
+
+logger = logging.getLogger(__name__)
+
+# pandas, plotly and the parsing/report modules are imported on first use, so
+# the server can answer its first request without loading them. The daily-view
+# stack is warmed in the background once the server is up.
+
+PROGRESS_VISIBLE = {'display': 'flex', 'alignItems': 'center', 'gap': '12px', 'margin': '20px',
+                    'color': 'var(--text-secondary)'}
+PROGRESS_HIDDEN = {'display': 'none'}
+
+
+def _create_background_manager():
+    """Thread-pool job manager for the monthly/range jobs, or None to run them inside the request."""
+    if not BACKGROUND_CALLBACKS:
+        return None
+    try:
+        import diskcache
+        from ui.background_jobs import ThreadJobManager
+        return ThreadJobManager(diskcache.Cache(BACKGROUND_CACHE_DIR), BACKGROUND_JOB_THREADS)
+    except ImportError as e:
+        logger.warning('Background callbacks disabled, dependencies missing: %s', e)
+        return None
+
 
 class TradingDashboard:
     def __init__(self):
+        configure_logging()
+        os.makedirs(DATA_DIR, exist_ok=True)
         self.app = Dash(__name__)
         self.app.config.suppress_callback_exceptions = True
+        self.background_manager = _create_background_manager()
         
-        # Initialize managers
-        self.contract_manager = ContractManager()
-        self.trade_processor = TradeProcessor(self.contract_manager)
+        # Lightweight managers; the rest are built on first use (see _component)
         self.note_manager = NoteManager()
-        self.trade_note_manager = TradeNoteManager()
+        self.data_index = get_data_index()
+        self._components = {}
+        self._components_lock = threading.RLock()
         
-        if MONTHLY_SUMMARY_AVAILABLE:
-            self.monthly_summary = MonthlySummaryComponents()
-        else:
-            self.monthly_summary = MonthlyFallback()
+        # Rendered daily dashboards, dropped whenever that day's trade analysis is saved
+        self.render_cache = RenderCache()
+        TradeNoteManager.add_save_listener(self.render_cache.invalidate_dates)
         
         # Setup layout and callbacks
         self._setup_layout()
         self._setup_callbacks()
+        register_monitoring_routes(self.app.server, profiler=RequestProfiler() if PROFILE_REQUESTS else None)
+    
+    def _callback(self, *args, **kwargs):
+        """app.callback that also records the callback's latency under callback.<name>."""
+        register = self.app.callback(*args, **kwargs)
+        
+        def decorator(func):
+            return register(timed(f'callback.{func.__name__}')(func))
+        return decorator
+    
+    def _job_callback(self, output, inputs, progress_id, **kwargs):
+        """Register a heavy view's callback, run as a background job when a manager is available.
+        
+        The function is called as func(report, *input values), where
+        report(done, total) drives the <progress_id> bar. A newer request for
+        the same view, or switching tabs, cancels the running job at its next
+        report. Without a manager it runs in the request and progress is not
+        shown.
+        """
+        def decorator(func):
+            if self.background_manager is None:
+                return self._callback(output, inputs, **kwargs)(
+                    functools.wraps(func)(lambda *values: func(lambda done, total: None, *values)))
+            
+            @functools.wraps(func)
+            def job(set_progress, *values):
+                def report(done, total):
+                    set_progress((done, max(total, 1), f"{done} of {total} days processed"))
+                return func(report, *values)
+            
+            return self._callback(
+                output, inputs,
+                background=True,
+                manager=self.background_manager,
+                interval=500,
+                progress=[Output(progress_id, 'value'), Output(progress_id, 'max'),
+                          Output(f'{progress_id}-label', 'children')],
+                progress_default=(0, 1, ''),
+                running=[(Output(f'{progress_id}-container', 'style'), PROGRESS_VISIBLE, PROGRESS_HIDDEN)],
+                cancel=[Input('main-tabs', 'value')],
+                **kwargs
+            )(job)
+        return decorator
+    
+    @staticmethod
+    def _create_progress(progress_id):
+        """Hidden progress bar shown while a background job runs."""
+        return html.Div([
+            html.Progress(id=progress_id, value=0, max=1, style={'width': '240px'}),
+            html.Span(id=f'{progress_id}-label')
+        ], id=f'{progress_id}-container', style=PROGRESS_HIDDEN)
+    
+    def _component(self, name, factory):
+        """Return the manager called name, building it with factory() on first use."""
+        component = self._components.get(name)
+        if component is None:
+            with self._components_lock:
+                component = self._components.get(name)
+                if component is None:
+                    component = self._components[name] = factory()
+        return component
+    
+    @property
+    def contract_manager(self):
+        def create():
+            from contracts.contract_manager import ContractManager
+            return ContractManager()
+        return self._component('contract_manager', create)
+    
+    @property
+    def trade_note_manager(self):
+        # Opening the trade journal can migrate it, so wait until it is needed
+        return self._component('trade_note_manager', TradeNoteManager)
+    
+    @property
+    def trade_processor(self):
+        def create():
+            from data.trade_processor import TradeProcessor
+            return TradeProcessor(self.contract_manager)
+        return self._component('trade_processor', create)
+    
+    @property
+    def day_store(self):
+        def create():
+            from data.day_store import DayTradesStore
+            return DayTradesStore(self.trade_processor, self.data_index)
+        return self._component('day_store', create)
+    
+    @property
+    def ingest_service(self):
+        def create():
+            from data.ingest_service import IngestService
+            return IngestService()
+        return self._component('ingest_service', create)
+    
+    @property
+    def monthly_summary(self):
+        def create():
+            try:
+                from ui.monthly_summary import MonthlySummaryComponents
+            except ImportError as e:
+                logger.warning('Monthly summary dependencies missing: %s', e)
+                from ui.monthly_fallback import MonthlyFallback
+                return MonthlyFallback()
+            return MonthlySummaryComponents()
+        return self._component('monthly_summary', create)
+    
+    @property
+    def range_summary(self):
+        """RangeSummaryComponents, or False when its dependencies are missing."""
+        def create():
+            try:
+                from ui.range_summary import RangeSummaryComponents
+            except ImportError as e:
+                logger.warning('Range summary dependencies missing: %s', e)
+                return False
+            return RangeSummaryComponents()
+        return self._component('range_summary', create)
     
     def _setup_layout(self):
 
@@ -45,6 +189,8 @@ class TradingDashboard:
             dcc.Store(id='current-date', data=today),
             dcc.Store(id='current-year', data=datetime.now().year),
             dcc.Store(id='current-month', data=datetime.now().month),
+            # Unsaved trade notes/colors from trade-card pages that are no longer shown
+            dcc.Store(id='trade-analysis-drafts', data={}),
             dcc.Tabs(id='main-tabs', value='daily-tab', style={
                 'backgroundColor': 'var(--bg-primary)',
                 'borderRadius': 'var(--radius-large)',
@@ -98,105 +244,135 @@ class TradingDashboard:
                     'color': 'var(--text-primary)',
                     'border': '1px solid var(--border-color)'
                 }, children=[
+                    dcc.Store(id='monthly-request'),
+                    self._create_progress('monthly-progress'),
                     html.Div(id='monthly-content', children=[
                         html.Div("🔄 Loading monthly summary...", 
                                className='loading-spinner')
                     ])
                 ]),
+                dcc.Tab(label='📈 Performance', value='range-tab', style={
+                    'backgroundColor': 'var(--bg-secondary)',
+                    'color': 'var(--text-primary)',
+                    'border': '1px solid var(--border-color)'
+                }, children=[
+                    html.Div(id='range-tab-body'),
+                    dcc.Store(id='range-tab-built', data=False),
+                    dcc.Store(id='range-request')
+                ]),
                 dcc.Tab(label='⚙️ Contract Manager', value='contracts-tab', style={
                     'backgroundColor': 'var(--bg-secondary)',
                     'color': 'var(--text-primary)',
                     'border': '1px solid var(--border-color)'
                 }, children=[
-                    html.Div([
-                        html.H3("⚙️ Contract Configuration", 
-                               style={'marginBottom': '24px', 'color': 'var(--text-primary)'}),
-                        
-                        # Modern contract input form
-                        html.Div([
-                            html.Div([
-                                html.Label("📋 Contract Symbol", 
-                                         style={'fontWeight': '600', 'marginBottom': '8px', 
-                                               'color': 'var(--text-primary)'}),
-                                dcc.Input(
-                                    id='contract-name',
-                                    placeholder='ES, GC, NQ, etc.',
-                                    style={'width': '100%'}
-                                )
-                            ], className='col-md-4'),
-                            
-                            html.Div([
-                                html.Label("💰 Tick Value ($)", 
-                                         style={'fontWeight': '600', 'marginBottom': '8px', 
-                                               'color': 'var(--text-primary)'}),
-                                dcc.Input(
-                                    id='tick-value',
-                                    type='number',
-                                    placeholder='12.50',
-                                    style={'width': '100%'}
-                                )
-                            ], className='col-md-4'),
-                            
-                            html.Div([
-                                html.Label("📏 Tick Size", 
-                                         style={'fontWeight': '600', 'marginBottom': '8px', 
-                                               'color': 'var(--text-primary)'}),
-                                dcc.Input(
-                                    id='tick-size',
-                                    type='number',
-                                    step=0.01,
-                                    placeholder='0.25',
-                                    style={'width': '100%'}
-                                )
-                            ], className='col-md-4')
-                        ], className='row', style={'marginBottom': '20px'}),
-                        
-                        html.Button('💾 Save Contract', id='save-contract', n_clicks=0,
-                                  className='profit-button', 
-                                  style={'marginBottom': '20px'}),
-                        
-                        html.Div(id='contract-status', 
-                               style={'margin': '16px 0', 'color': 'var(--profit-green)', 
-                                     'fontWeight': '600'}),
-                        
-                        html.H4("📊 Saved Contracts", 
-                               style={'marginTop': '32px', 'marginBottom': '16px', 
-                                     'color': 'var(--text-primary)'}),
-                        dash_table.DataTable(
-                            id='contracts-table',
-                            columns=[
-                                {'name': '📋 Contract', 'id': 'name'},
-                                {'name': '💰 Tick Value', 'id': 'tick_value'},
-                                {'name': '📏 Tick Size', 'id': 'tick_size'}
-                            ],
-                            style_cell={
-                                'textAlign': 'center',
-                                'backgroundColor': 'var(--bg-secondary)',
-                                'color': 'var(--text-primary)',
-                                'border': 'none',
-                                'padding': '12px'
-                            },
-                            style_header={
-                                'backgroundColor': 'var(--bg-tertiary)',
-                                'color': 'var(--text-primary)',
-                                'fontWeight': '600',
-                                'textTransform': 'uppercase',
-                                'fontSize': '14px',
-                                'letterSpacing': '0.5px'
-                            },
-                            style_data={
-                                'backgroundColor': 'var(--bg-secondary)',
-                                'color': 'var(--text-secondary)',
-                                'borderBottom': '1px solid var(--bg-tertiary)'
-                            }
-                        )
-                    ], className='trading-card')
+                    html.Div(id='contracts-tab-body'),
+                    dcc.Store(id='contracts-tab-built', data=False)
                 ])
             ])
         ], style={'backgroundColor': 'var(--bg-primary)', 'minHeight': '100vh', 'padding': '20px'})
     
+    def _create_range_tab(self):
+        """Range controls and the performance view placeholder."""
+        if not self.range_summary:
+            return html.P("Range analytics dependencies are not installed")
+        return html.Div([
+            self.range_summary.create_range_controls(),
+            self._create_progress('range-progress'),
+            html.Div(id='range-content')
+        ])
+    
+    def _create_contracts_tab(self):
+        """Contract configuration form and the saved contracts table."""
+        return html.Div([
+            html.H3("⚙️ Contract Configuration", 
+                   style={'marginBottom': '24px', 'color': 'var(--text-primary)'}),
+            
+            # Modern contract input form
+            html.Div([
+                html.Div([
+                    html.Label("📋 Contract Symbol", 
+                             style={'fontWeight': '600', 'marginBottom': '8px', 
+                                   'color': 'var(--text-primary)'}),
+                    dcc.Input(
+                        id='contract-name',
+                        placeholder='ES, GC, NQ, etc.',
+                        style={'width': '100%'}
+                    )
+                ], className='col-md-4'),
+                
+                html.Div([
+                    html.Label("💰 Tick Value ($)", 
+                             style={'fontWeight': '600', 'marginBottom': '8px', 
+                                   'color': 'var(--text-primary)'}),
+                    dcc.Input(
+                        id='tick-value',
+                        type='number',
+                        placeholder='12.50',
+                        style={'width': '100%'}
+                    )
+                ], className='col-md-4'),
+                
+                html.Div([
+                    html.Label("📏 Tick Size", 
+                             style={'fontWeight': '600', 'marginBottom': '8px', 
+                                   'color': 'var(--text-primary)'}),
+                    dcc.Input(
+                        id='tick-size',
+                        type='number',
+                        step=0.01,
+                        placeholder='0.25',
+                        style={'width': '100%'}
+                    )
+                ], className='col-md-4')
+            ], className='row', style={'marginBottom': '20px'}),
+            
+            html.Button('💾 Save Contract', id='save-contract', n_clicks=0,
+                      className='profit-button', 
+                      style={'marginBottom': '20px'}),
+            
+            html.Div(id='contract-status', 
+                   style={'margin': '16px 0', 'color': 'var(--profit-green)', 
+                         'fontWeight': '600'}),
+            
+            html.H4("📊 Saved Contracts", 
+                   style={'marginTop': '32px', 'marginBottom': '16px', 
+                         'color': 'var(--text-primary)'}),
+            dash_table.DataTable(
+                id='contracts-table',
+                columns=[
+                    {'name': '📋 Contract', 'id': 'name'},
+                    {'name': '💰 Tick Value', 'id': 'tick_value'},
+                    {'name': '📏 Tick Size', 'id': 'tick_size'}
+                ],
+                style_cell={
+                    'textAlign': 'center',
+                    'backgroundColor': 'var(--bg-secondary)',
+                    'color': 'var(--text-primary)',
+                    'border': 'none',
+                    'padding': '12px'
+                },
+                style_header={
+                    'backgroundColor': 'var(--bg-tertiary)',
+                    'color': 'var(--text-primary)',
+                    'fontWeight': '600',
+                    'textTransform': 'uppercase',
+                    'fontSize': '14px',
+                    'letterSpacing': '0.5px'
+                },
+                style_data={
+                    'backgroundColor': 'var(--bg-secondary)',
+                    'color': 'var(--text-secondary)',
+                    'borderBottom': '1px solid var(--bg-tertiary)'
+                }
+            )
+        ], className='trading-card')
+    
     def _setup_callbacks(self):
-        @self.app.callback(
+        # Tab bodies other than the daily view are built the first time they are opened
+        for tab, create in (('range-tab', self._create_range_tab), ('contracts-tab', self._create_contracts_tab)):
+            self._setup_tab_body(tab, create)
+        
+        @self._callback(
             [Output('current-date', 'data'),
              Output('date-display', 'children')],
             [Input('prev-day', 'n_clicks'),
@@ -220,7 +396,7 @@ class TradingDashboard:
 
             return new_dt.strftime('%Y-%m-%d'), f"Current Date: {new_dt.strftime('%Y-%m-%d')}"
 
-        @self.app.callback(
+        @self._callback(
             [Output('dashboard-content', 'children'),
              Output('notes-input', 'value')],
             [Input('current-date', 'data')]
@@ -230,26 +406,13 @@ class TradingDashboard:
 
         #This is the rithmic version
         def update_dashboard(date_str):
-            # Try multiple file patterns and formats (same as monthly summary)
-            possible_files = [
-                f'{date_str}.csv',
-                f'trades_{date_str}.csv', 
-                f'{date_str}.xls',
-                f'trades_{date_str}.xls',
-                f'{date_str}.xlsx',
-                f'trades_{date_str}.xlsx'
-            ]
-            
-            file_found = None
-            for filename in possible_files:
-                file_path = os.path.join(DATA_DIR, filename)
-                if os.path.exists(file_path):
-                    file_found = file_path
-                    print(f"DEBUG: Found file for {date_str}: {filename}")
-                    break
+            # Look the date up in the DATA_DIR index (same as monthly summary)
+            file_found = self.data_index.find(date_str)
+            if file_found:
+                logger.debug('Found file for %s: %s', date_str, os.path.basename(file_found))
             
             if not file_found:
-                print(f"DEBUG: No trading file found for {date_str}")
+                logger.debug('No trading file found for %s', date_str)
                 note = self.note_manager.load_notes(date_str)
                 return html.Div([
                     html.H3("No trading data available for this date", 
@@ -258,36 +421,51 @@ class TradingDashboard:
                            style={'textAlign': 'center', 'color': '#95a5a6'}),
                     html.P("Available files in your trading_data folder:", 
                            style={'textAlign': 'center', 'color': '#95a5a6', 'marginTop': '20px'}),
-                    html.Pre([f for f in os.listdir(DATA_DIR) if f.endswith(('.csv', '.xls', '.xlsx'))][:10],
+                    html.Pre(self.data_index.list_files()[:10],
                             style={'textAlign': 'center', 'color': '#6c757d', 'fontSize': '12px'})
                 ], style={'padding': '20px'}), note
             
+            # The ingest service already tried this export and could not parse it
+            failure = self.ingest_service.failure_for(date_str)
+            if failure:
+                return self._create_parse_error(date_str, file_found, failure), self.note_manager.load_notes(date_str)
+            
             try:
-                # Determine file type and process accordingly
-                if file_found.endswith('.csv'):
-                    trades_df = self.trade_processor.calculate_trades_csv_rithmic(file_found)
-                else:
-                    # For .xls/.xlsx files, use the original Excel processing method
-                    print(f"DEBUG: Processing Excel file: {file_found}")
-                    df = pd.read_excel(file_found, header=None)
-                    df.columns = ["date", "time", "exchange", "contract", "B/S", "Size", "Price", "F", "Direct"]
-                    processed_df = self.trade_processor.process_raw_data(df)
-                    trades_df = self.trade_processor.calculate_trades(processed_df)
-
-                # Keep your debug code
-                print(f"DEBUG: trades_df shape: {trades_df.shape}")
-                print(f"DEBUG: trades_df columns: {list(trades_df.columns)}")
-                print(f"DEBUG: trades_df empty: {trades_df.empty}")
-                if not trades_df.empty:
-                    print(f"DEBUG: First few rows:")
-                    print(trades_df.head())
-                else:
-                    print("DEBUG: DataFrame is empty!")
+                # Only the summary is built here; charts and trade cards have their own callbacks
+                data_key, trades_df = self.day_store.get(date_str)
 
-                note = self.note_manager.load_notes(date_str)
-                return DashboardComponents.create_dashboard(trades_df, note, date_str), note
+                logger.debug('trades_df shape: %s', trades_df.shape)
+                logger.debug('trades_df columns: %s', list(trades_df.columns))
+                if not trades_df.empty and logger.isEnabledFor(logging.DEBUG):
+                    logger.debug('First few rows:\n%s', trades_df.head())
+
+                from ui.dashboard_components import DashboardComponents
+                dashboard = self.render_cache.get_or_render(
+                    (date_str, data_key, self.trade_note_manager.revision(date_str), 'summary'),
+                    lambda: DashboardComponents.create_dashboard_shell(trades_df, date_str)
+                )
+                return dashboard, self.note_manager.load_notes(date_str)
             except FileNotFoundError:
                 return html.H3("No data available for this date"), ''
+            except Exception as e:
+                logger.warning('Could not parse %s: %s', file_found, e)
+                return self._create_parse_error(date_str, file_found, str(e)), self.note_manager.load_notes(date_str)
+
+        # Charts fill in after the summary
+        @self._callback(
+            Output('daily-charts', 'children'),
+            [Input('daily-view-date', 'data')]
+        )
+        def render_daily_charts(date_str):
+            entry = self.day_store.get(date_str)
+            if entry is None:
+                return []
+            data_key, trades_df = entry
+            from ui.dashboard_components import DashboardComponents
+            return self.render_cache.get_or_render(
+                (date_str, data_key, None, 'charts'),
+                lambda: DashboardComponents.create_charts(trades_df)
+            )
         '''
         def update_dashboard(date_str):
             file_path = os.path.join(DATA_DIR, f'{date_str}.csv')
@@ -297,45 +475,116 @@ class TradingDashboard:
                 processed_df = self.trade_processor.process_raw_data(df)
                 trades_df = self.trade_processor.calculate_trades(processed_df)
                 note = self.note_manager.load_notes(date_str)
-                return DashboardComponents.create_dashboard(trades_df, note, date_str), note
+                return DashboardComponents.create_dashboard(trades_df, note, date_str, self.trade_note_manager), note
             except FileNotFoundError:
                 return html.H3("No data available for this date"), ''
                 
                 
         '''
 
+        # Drafts belong to the day they were made on: drop them when the user moves to another day
+        @self._callback(
+            Output('trade-analysis-drafts', 'data', allow_duplicate=True),
+            [Input('current-date', 'data')],
+            prevent_initial_call=True
+        )
+        def clear_trade_analysis_drafts(date_str):
+            return {}
+
+        # Page through trade cards, keeping edits from the page being left as drafts
+        @self._callback(
+            [Output('trade-cards-page', 'data'),
+             Output('trade-analysis-drafts', 'data')],
+            [Input('trade-cards-prev', 'n_clicks'),
+             Input('trade-cards-next', 'n_clicks')],
+            [State('trade-cards-page', 'data'),
+             State('trade-cards-page-count', 'data'),
+             State({'type': 'trade-note', 'index': ALL}, 'value'),
+             State({'type': 'trade-color', 'index': ALL}, 'value'),
+             State({'type': 'trade-id', 'index': ALL}, 'children'),
+             State('trade-analysis-drafts', 'data')],
+            prevent_initial_call=True
+        )
+        def change_trade_cards_page(prev_clicks, next_clicks, page, page_count, trade_notes, trade_colors, trade_ids,
+                                    drafts):
+            ctx = dash.callback_context
+            if not ctx.triggered:
+                return dash.no_update, dash.no_update
+            
+            drafts = dict(drafts or {})
+            for trade_id, note, color in zip(trade_ids, trade_notes, trade_colors):
+                if trade_id:
+                    drafts[trade_id] = {'note': note, 'color': color}
+            
+            step = -1 if ctx.triggered[0]['prop_id'].startswith('trade-cards-prev') else 1
+            return max(0, min((page or 0) + step, (page_count or 1) - 1)), drafts
+
+        # Render the current page of trade cards (also runs when the dashboard first appears)
+        @self._callback(
+            [Output('trade-cards-page-content', 'children'),
+             Output('trade-cards-page-label', 'children')],
+            [Input('trade-cards-page', 'data')],
+            [State('current-date', 'data'),
+             State('trade-analysis-drafts', 'data')]
+        )
+        def render_trade_cards_page(page, date_str, drafts):
+            entry = self.day_store.get(date_str)
+            if entry is None:
+                return [], ''
+            _, trades_df = entry
+            from ui.dashboard_components import DashboardComponents
+            cards, label, _ = DashboardComponents.create_trade_cards_page(
+                trades_df, date_str, page, trade_note_manager=self.trade_note_manager, drafts=drafts
+            )
+            return cards, label
+
         # Callback to handle saving trade analysis data only
-        @self.app.callback(
-            Output('save-note', 'n_clicks'),
+        @self._callback(
+            [Output('save-note', 'n_clicks'),
+             Output('trade-analysis-drafts', 'data', allow_duplicate=True)],
             [Input('save-note', 'n_clicks')],
             [State('current-date', 'data'),
              State({'type': 'trade-note', 'index': ALL}, 'value'),
              State({'type': 'trade-color', 'index': ALL}, 'value'),
-             State({'type': 'trade-id', 'index': ALL}, 'children')],
+             State({'type': 'trade-id', 'index': ALL}, 'children'),
+             State('trade-analysis-drafts', 'data')],
             prevent_initial_call=True
         )
-        def save_trade_analysis(n_clicks, date_str, trade_notes, trade_colors, trade_ids):
+        def save_trade_analysis(n_clicks, date_str, trade_notes, trade_colors, trade_ids, drafts):
             if n_clicks and n_clicks > 0:
-                # Save all trade notes and colors
-                saved_count = 0
+                # Collect all trade notes and colors, then write each file once.
+                # Edits made on other trade-card pages are held in the drafts store.
+                notes_to_save = {}
+                colors_to_save = {}
+                saved_ids = set()
+                for trade_id, draft in (drafts or {}).items():
+                    if not trade_id.startswith(f'{date_str}_'):
+                        # Left over from another day if the date changed before the drafts were cleared
+                        continue
+                    if draft.get('note'):
+                        notes_to_save[trade_id] = draft['note']
+                    if draft.get('color'):
+                        colors_to_save[trade_id] = draft['color']
+                    saved_ids.add(trade_id)
+                
                 for i, trade_id in enumerate(trade_ids):
                     if trade_id:
-                        # Save trade note
                         if i < len(trade_notes) and trade_notes[i]:
-                            self.trade_note_manager.save_trade_note(trade_id, trade_notes[i])
+                            notes_to_save[trade_id] = trade_notes[i]
                         
-                        # Save trade color
                         if i < len(trade_colors) and trade_colors[i]:
-                            self.trade_note_manager.save_trade_color(trade_id, trade_colors[i])
+                            colors_to_save[trade_id] = trade_colors[i]
                         
-                        saved_count += 1
+                        saved_ids.add(trade_id)
                 
-                print(f"✅ Saved {saved_count} trade analyses for {date_str}")
+                self.trade_note_manager.save_many(notes_to_save, colors_to_save)
+                logger.info('✅ Saved %s trade analyses for %s', len(saved_ids), date_str)
+                return n_clicks, {}
             
-            return n_clicks
+            return n_clicks, dash.no_update
 
         # Callback to handle saving daily notes
-        @self.app.callback(
+        @self._callback(
             Output('save-daily-note', 'n_clicks'),
             [Input('save-daily-note', 'n_clicks')],
             [State('notes-input', 'value'),
@@ -346,12 +595,12 @@ class TradingDashboard:
             if n_clicks and n_clicks > 0:
                 if daily_note:
                     self.note_manager.save_notes(date_str, daily_note)
-                    print(f"✅ Saved daily note for {date_str}")
+                    logger.info('✅ Saved daily note for %s', date_str)
                 else:
-                    print("ℹ️ No daily note to save")
+                    logger.info('ℹ️ No daily note to save')
             return n_clicks
 
-        @self.app.callback(
+        @self._callback(
             [Output('contract-status', 'children'),
              Output('contracts-table', 'data')],
             [Input('save-contract', 'n_clicks')],
@@ -372,7 +621,7 @@ class TradingDashboard:
             return message, table_data
         
         # Dynamic callback for trade card color changes (visual feedback only)
-        @self.app.callback(
+        @self._callback(
             Output({'type': 'trade-card', 'index': MATCH}, 'style'),
             [Input({'type': 'trade-color', 'index': MATCH}, 'value')],
             [State({'type': 'trade-card', 'index': MATCH}, 'style')],
@@ -419,37 +668,74 @@ class TradingDashboard:
             
             return new_style
 
-        # Monthly summary callbacks - try alternative trigger approach
-        @self.app.callback(
-            Output('monthly-content', 'children'),
+        # Monthly summary: a light callback turns tab/month changes into a request,
+        # which the background job picks up (superseding any job still running)
+        @self._callback(
+            Output('monthly-request', 'data'),
             [Input('main-tabs', 'value'),
              Input('current-year', 'data'),
              Input('current-month', 'data')]
         )
-        def update_monthly_content(active_tab, year, month):
-            print(f"DEBUG: update_monthly_content called - active_tab={active_tab}, year={year}, month={month}")
-            
-            # Only update when monthly tab is active
+        def request_monthly_view(active_tab, year, month):
+            # Only update when monthly tab is active; nothing is built before it is first opened
             if active_tab != 'monthly-tab':
-                print(f"DEBUG: Not monthly tab, returning loading message")
-                return html.Div("Loading monthly summary...", style={'padding': '20px', 'textAlign': 'center'})
-            
-            print(f"DEBUG: Monthly tab is active, creating summary...")
+                return dash.no_update
+            return {'year': year, 'month': month}
+        
+        @self._job_callback(
+            Output('monthly-content', 'children'),
+            [Input('monthly-request', 'data')],
+            progress_id='monthly-progress',
+            prevent_initial_call=True
+        )
+        def update_monthly_content(report, request):
+            year, month = request['year'], request['month']
+            logger.debug('update_monthly_content called - year=%s, month=%s', year, month)
             try:
-                result = self.monthly_summary.create_monthly_summary(year, month)
-                print(f"DEBUG: Monthly summary created successfully (fallback={not MONTHLY_SUMMARY_AVAILABLE})")
+                result = self.monthly_summary.create_monthly_summary(year, month, progress=report)
+                logger.debug('Monthly summary created successfully (%s)', type(self.monthly_summary).__name__)
                 return result
             except Exception as e:
-                print(f"ERROR: Failed to create monthly summary: {e}")
-                import traceback
-                traceback.print_exc()
+                logger.exception('Failed to create monthly summary: %s', e)
                 return html.Div([
                     html.H3("Error loading monthly summary", style={'color': 'red'}),
                     html.P(f"Error: {str(e)}"),
-                    html.P(f"Dependencies available: {MONTHLY_SUMMARY_AVAILABLE}")
+                    html.P(f"Summary backend: {type(self.monthly_summary).__name__}")
                 ])
 
-        @self.app.callback(
+        # Year-to-date / custom range performance, requested the same way
+        @self._callback(
+            Output('range-request', 'data'),
+            [Input('main-tabs', 'value'),
+             Input('range-preset', 'value'),
+             Input('range-dates', 'start_date'),
+             Input('range-dates', 'end_date')]
+        )
+        def request_range_view(active_tab, preset, start_date, end_date):
+            if active_tab != 'range-tab':
+                return dash.no_update
+            return {'preset': preset, 'start_date': start_date, 'end_date': end_date}
+        
+        @self._job_callback(
+            Output('range-content', 'children'),
+            [Input('range-request', 'data')],
+            progress_id='range-progress',
+            prevent_initial_call=True
+        )
+        def update_range_content(report, request):
+            if not self.range_summary:
+                return html.P("Range analytics dependencies are not installed")
+            try:
+                return self.range_summary.create_range_summary(request['preset'], request['start_date'],
+                                                               request['end_date'], progress=report)
+            except Exception as e:
+                logger.exception('Failed to create range summary: %s', e)
+                return html.Div([
+                    html.H3("Error loading performance view", style={'color': 'red'}),
+                    html.P(f"Error: {str(e)}")
+                ])
+
+        @self._callback(
             [Output('current-year', 'data'),
              Output('current-month', 'data')],
             [Input('prev-month', 'n_clicks'),
@@ -484,7 +770,7 @@ class TradingDashboard:
             return current_year, current_month
 
         # Calendar day click callback to switch to daily view
-        @self.app.callback(
+        @self._callback(
             [Output('main-tabs', 'value'),
              Output('current-date', 'data', allow_duplicate=True)],
             [Input({'type': 'calendar-day', 'date': ALL}, 'n_clicks')],
@@ -504,7 +790,70 @@ class TradingDashboard:
             
             return dash.no_update, dash.no_update
     
+    def _setup_tab_body(self, tab, create):
+        @self._callback(
+            [Output(f'{tab}-body', 'children'),
+             Output(f'{tab}-built', 'data')],
+            [Input('main-tabs', 'value')],
+            [State(f'{tab}-built', 'data')]
+        )
+        def build_tab_body(active_tab, built):
+            if active_tab != tab or built:
+                return dash.no_update, dash.no_update
+            return create(), True
+    
+    def _create_parse_error(self, date_str, file_path, error):
+        return html.Div([
+            html.H3(f"Could not read the export for {date_str}",
+                   style={'textAlign': 'center', 'color': '#7f8c8d', 'margin': '50px'}),
+            html.P(os.path.basename(file_path),
+                   style={'textAlign': 'center', 'color': '#95a5a6'}),
+            html.Pre(error,
+                    style={'textAlign': 'center', 'color': '#6c757d', 'fontSize': '12px', 'whiteSpace': 'pre-wrap'})
+        ], style={'padding': '20px'})
+    
+    def warm_up(self):
+        """Build every manager and load the shared state callbacks read.
+        
+        The pre-fork server calls this in the parent so workers start warm and
+        share these pages copy-on-write. Starts no threads.
+        """
+        # Contract manager and trade processor, importing pandas and pyarrow
+        self.day_store.get(datetime.now().strftime('%Y-%m-%d'))
+        import ui.dashboard_components  # noqa: F401 (plotly)
+        # Report builders (plotly express) and their shared rollup store
+        self.monthly_summary
+        self.range_summary
+        self.ingest_service.rollups.errors()  # loads the rollup rows
+        self.data_index.refresh()
+        self.trade_note_manager.load_trade_colors()
+        self.trade_note_manager.load_trade_notes()
+    
+    def start_ingest_watcher(self):
+        """Start the export watcher unless disabled or already running in another worker process."""
+        if not INGEST_WATCHER_ENABLED:
+            return
+        if not hold_process_lock(INGEST_LOCK_FILE):
+            logger.debug('Export watcher runs in another process')
+            return
+        self.ingest_service.start()
+    
+    def start_background_services(self):
+        """Warm up and start the export watcher in a thread, off the startup path."""
+        threading.Thread(target=self._warm_up_and_watch, name='pdb-warmup', daemon=True).start()
+    
+    def _warm_up_and_watch(self):
+        try:
+            self.warm_up()
+            self.start_ingest_watcher()
+        except Exception:
+            logger.exception('Background warm-up failed')
+    
     def run(self):
+        # With debug=True the reloader re-runs this module in a child process;
+        # only that serving process should watch the data directory
+        if os.environ.get('WERKZEUG_RUN_MAIN') == 'true':
+            self.start_background_services()
         self.app.run(debug=True)
 
 if __name__ == '__main__':
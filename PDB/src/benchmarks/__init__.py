@@ -0,0 +1 @@
+# Benchmarks and synthetic data generators for the trade pipeline
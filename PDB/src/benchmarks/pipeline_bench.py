@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+"""Time the parse -> aggregate -> render pipeline on synthetic data and flag regressions.
+
+Writes a synthetic trading_data directory (Rithmic CSVs, optionally mixed with
+legacy 9-column Excel fills), then times each stage separately and records its
+peak traced memory:
+
+    calculate_trades_csv_rithmic   one Rithmic CSV day
+    calculate_trades               one Excel day (already read and sorted)
+    get_monthly_data_cold          month stats with empty rollup and trade caches
+    get_monthly_data_warm          month stats served from the rollup store
+    create_dashboard               daily dashboard for the largest day
+    create_monthly_summary         full monthly tab
+
+Usage (from the src directory):
+    python -m benchmarks.pipeline_bench run [--days 20] [--contracts 3] [--fills-per-day 600]
+                                            [--depth 3] [--excel-every 5] [--repeat 3]
+                                            [--output results.json] [--baseline old.json]
+    python -m benchmarks.pipeline_bench compare old.json new.json [--threshold 0.2]
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.synthetic_data import generate_dataset
+from contracts.contract_manager import ContractManager
+from data.daily_rollup import DailyRollupStore
+from data.data_index import DataDirIndex
+from data.quality_index import QualityIndex
+from data.trade_cache import TradeCache
+from data.trade_processor import EXCEL_COLUMNS, TradeProcessor
+
+DEFAULT_THRESHOLD = 0.2
+# Timings below this are too noisy to call a regression on a relative change alone
+MIN_SIGNIFICANT_SECONDS = 0.005
+
+
+def _time_stage(func, repeat, setup=None):
+    """Time func() `repeat` times (setup() before each, untimed), then once more under tracemalloc."""
+    timings = []
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+
+    if setup is not None:
+        setup()
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        'best_s': min(timings),
+        'median_s': statistics.median(timings),
+        'runs': len(timings),
+        'peak_mb': peak / 1e6
+    }
+
+
+def _git_revision():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__)), timeout=5).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def run_benchmarks(days=20, contracts=3, fills_per_day=600, depth=3, excel_every=5, repeat=3,
+                   start_date='2024-06-03', seed=0):
+    """Build a synthetic dataset in a temporary directory and time every stage. Returns the results dict."""
+    # Imported here so the module can be inspected without Dash installed
+    from ui.dashboard_components import DashboardComponents
+    from ui.monthly_summary import MonthlySummaryComponents
+
+    params = {
+        'days': days, 'contracts': contracts, 'fills_per_day': fills_per_day, 'depth': depth,
+        'excel_every': excel_every, 'repeat': repeat, 'start_date': start_date, 'seed': seed
+    }
+    results = {}
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        data_dir = os.path.join(tmp_dir, 'trading_data')
+        cache_dir = os.path.join(tmp_dir, 'cache')
+        written = generate_dataset(data_dir, start_date, days, contracts, fills_per_day, depth, excel_every, seed)
+        csv_file = next(path for _, path in written if path.endswith('.csv'))
+        excel_file = next((path for _, path in written if path.endswith('.xlsx')), None)
+        year, month = int(start_date[:4]), int(start_date[5:7])
+
+        contract_manager = ContractManager()
+        processor = TradeProcessor(contract_manager, trade_cache=TradeCache(cache_dir))
+        data_index = DataDirIndex(data_dir)
+
+        results['calculate_trades_csv_rithmic'] = _time_stage(
+            lambda: processor.calculate_trades_csv_rithmic(csv_file), repeat)
+
+        if excel_file is not None:
+            raw = pd.read_excel(excel_file, header=None)
+            raw.columns = EXCEL_COLUMNS
+            fills = processor.process_raw_data(raw)
+            results['calculate_trades'] = _time_stage(lambda: processor.calculate_trades(fills), repeat)
+
+        monthly = MonthlySummaryComponents()
+        monthly.trade_processor = processor
+        monthly.data_index = data_index
+        monthly.quality_index = QualityIndex(processor, data_index, os.path.join(cache_dir, 'quality_index.json'))
+        rollup_file = os.path.join(cache_dir, 'daily_rollups.json')
+
+        def reset_caches():
+            processor.trade_cache.clear()
+            if os.path.exists(rollup_file):
+                os.remove(rollup_file)
+            monthly.rollups = DailyRollupStore(processor, data_index, rollup_file=rollup_file)
+
+        results['get_monthly_data_cold'] = _time_stage(
+            lambda: monthly._get_monthly_data(year, month), repeat, setup=reset_caches)
+        results['get_monthly_data_warm'] = _time_stage(lambda: monthly._get_monthly_data(year, month), repeat)
+
+        largest = max((processor.load_trades_file(path) for _, path in written), key=len)
+        results['create_dashboard'] = _time_stage(
+            lambda: DashboardComponents.create_dashboard(largest, '', written[0][0]), repeat)
+        results['create_monthly_summary'] = _time_stage(
+            lambda: monthly.create_monthly_summary(year, month), repeat)
+
+        params['trades_in_largest_day'] = len(largest)
+
+    return {
+        'meta': {
+            'created': datetime.now().isoformat(timespec='seconds'),
+            'git_revision': _git_revision(),
+            'python': platform.python_version(),
+            'pandas': pd.__version__,
+            'numpy': np.__version__,
+            'machine': platform.machine(),
+            'params': params
+        },
+        'results': results
+    }
+
+
+def compare_results(baseline, current, threshold=DEFAULT_THRESHOLD):
+    """
+    Compare two result dicts stage by stage.
+
+    A stage regresses when its best time or peak memory grew by more than
+    `threshold` (fractional). Times under MIN_SIGNIFICANT_SECONDS in both runs
+    are not flagged.
+
+    Returns:
+        List of (stage, metric, baseline value, current value, change, regressed)
+    """
+    rows = []
+    for stage, now in current['results'].items():
+        before = baseline['results'].get(stage)
+        if before is None:
+            continue
+        for metric in ('best_s', 'peak_mb'):
+            old, new = before[metric], now[metric]
+            change = (new - old) / old if old else 0.0
+            regressed = change > threshold
+            if metric == 'best_s' and max(old, new) < MIN_SIGNIFICANT_SECONDS:
+                regressed = False
+            rows.append((stage, metric, old, new, change, regressed))
+    return rows
+
+
+def _print_results(report):
+    params = report['meta']['params']
+    print(f"{params['days']} days x {params['contracts']} contracts, ~{params['fills_per_day']} fills/day, "
+          f"depth {params['depth']} (largest day: {params['trades_in_largest_day']} trades)")
+    for stage, result in report['results'].items():
+        print(f"  {stage:<30} best {result['best_s'] * 1000:>9.1f} ms   median {result['median_s'] * 1000:>9.1f} ms"
+              f"   peak {result['peak_mb']:>7.1f} MB")
+
+
+def _print_comparison(rows, threshold):
+    print(f"Compared with baseline (regression threshold {threshold:.0%}):")
+    for stage, metric, old, new, change, regressed in rows:
+        unit = 'ms' if metric == 'best_s' else 'MB'
+        scale = 1000 if metric == 'best_s' else 1
+        flag = '  REGRESSION' if regressed else ''
+        print(f"  {stage:<30} {metric:<8} {old * scale:>9.1f} -> {new * scale:>9.1f} {unit}  {change:>+7.1%}{flag}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = subparsers.add_parser('run', help='generate data and time every stage')
+    run_parser.add_argument('--days', type=int, default=20)
+    run_parser.add_argument('--contracts', type=int, default=3)
+    run_parser.add_argument('--fills-per-day', type=int, default=600)
+    run_parser.add_argument('--depth', type=int, default=3, help='max scale-out exits per position')
+    run_parser.add_argument('--excel-every', type=int, default=5, help='every Nth day is an Excel export (0 = none)')
+    run_parser.add_argument('--repeat', type=int, default=3)
+    run_parser.add_argument('--seed', type=int, default=0)
+    run_parser.add_argument('--output', help='write results JSON here')
+    run_parser.add_argument('--baseline', help='results JSON to compare against')
+    run_parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD)
+
+    compare_parser = subparsers.add_parser('compare', help='compare two results files')
+    compare_parser.add_argument('baseline')
+    compare_parser.add_argument('current')
+    compare_parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD)
+
+    args = parser.parse_args(argv)
+
+    if args.command == 'run':
+        # The pipeline logs warnings for e.g. unknown contracts; keep the report readable
+        with contextlib.redirect_stdout(io.StringIO()):
+            report = run_benchmarks(args.days, args.contracts, args.fills_per_day, args.depth,
+                                    args.excel_every, args.repeat, seed=args.seed)
+        _print_results(report)
+        if args.output:
+            with open(args.output, 'w') as f:
+                json.dump(report, f, indent=2)
+            print(f"Results written to {args.output}")
+        if not args.baseline:
+            return 0
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        current = report
+    else:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        with open(args.current) as f:
+            current = json.load(f)
+
+    rows = compare_results(baseline, current, args.threshold)
+    _print_comparison(rows, args.threshold)
+    return 1 if any(row[-1] for row in rows) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""Compare Rithmic CSV parser backends in lines/sec on synthetic multi-contract exports.
+
+Usage (from the src directory):
+    python -m benchmarks.rithmic_parser_bench [--contracts 6] [--trades 2000] [--depth 4]
+"""
+import argparse
+import contextlib
+import io
+import os
+import tempfile
+import time
+
+import pandas as pd
+
+from benchmarks.synthetic_data import generate_rithmic_csv
+from contracts.contract_manager import ContractManager
+from data.trade_processor import TradeProcessor
+
+
+def bench_parser(csv_parser, file_path, line_count, repeat=3):
+    """Return the best lines/sec over `repeat` runs and the resulting trades DataFrame."""
+    processor = TradeProcessor(ContractManager(), csv_parser=csv_parser)
+    best = None
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        # The legacy parser prints per line; keep that out of the measurement output
+        with contextlib.redirect_stdout(io.StringIO()):
+            result = processor.calculate_trades_csv_rithmic(file_path)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return line_count / best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--contracts', type=int, default=6)
+    parser.add_argument('--trades', type=int, default=2000, help='positions per contract')
+    parser.add_argument('--depth', type=int, default=4, help='max scale-out exits per position')
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        file_path = os.path.join(tmp_dir, '2025-08-22.csv')
+        line_count = generate_rithmic_csv(file_path, contracts=args.contracts,
+                                          trades_per_contract=args.trades, scale_out_depth=args.depth)
+        print(f"Synthetic export: {line_count:,} lines, {args.contracts} contracts")
+
+        results = {}
+        for csv_parser in ('legacy', 'fast'):
+            lines_per_sec, results[csv_parser] = bench_parser(csv_parser, file_path, line_count, args.repeat)
+            print(f"  {csv_parser:<7} {lines_per_sec:>12,.0f} lines/sec")
+
+        pd.testing.assert_frame_equal(results['fast'], results['legacy'], check_exact=True)
+        print("  ✓ fast and legacy parsers produce identical trades")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""Measure dashboard cold start: per-module import times and time to first response.
+
+Every measurement runs in a fresh interpreter, the way a supervisor restart does:
+
+    import breakdown   `import app` under -X importtime, summed per top-level
+                       package plus the slowest individual modules
+    first response     process spawn -> `import app` -> TradingDashboard() ->
+                       '/', '/_dash-layout' and '/_dash-dependencies' answered
+
+The run fails (exit status 1) when the best time to first response is over the
+budget, or when a module that should only load on first use (pandas, plotly
+express, the parsers and report builders) was imported before the first response.
+
+Usage (from the src directory):
+    python -m benchmarks.startup_bench [--repeat 3] [--budget 2.5] [--top 15] [--output results.json]
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+from collections import defaultdict
+
+SRC_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+DEFAULT_BUDGET_SECONDS = 2.5
+# Loaded on first use; none of these may be imported to serve the initial page
+LAZY_MODULES = (
+    'pandas',
+    'pyarrow',
+    'plotly.express',
+    'data.trade_processor',
+    'data.ingest_service',
+    'ui.dashboard_components',
+    'ui.monthly_summary',
+    'ui.range_summary'
+)
+
+_FIRST_RESPONSE_SCRIPT = '''
+import json, sys, time
+started = time.perf_counter()
+import app
+imported = time.perf_counter()
+dashboard = app.TradingDashboard()
+built = time.perf_counter()
+client = dashboard.app.server.test_client()
+for path in ('/', '/_dash-layout', '/_dash-dependencies'):
+    status = client.get(path).status_code
+    if status != 200:
+        raise SystemExit(f'{path} returned {status}')
+answered = time.perf_counter()
+print(json.dumps({
+    'answered_at': time.time(),
+    'import_s': imported - started,
+    'init_s': built - imported,
+    'requests_s': answered - built,
+    'loaded': [name for name in %r if name in sys.modules]
+}))
+''' % (LAZY_MODULES,)
+
+
+def _run_python(args):
+    return subprocess.run([sys.executable] + args, cwd=SRC_DIR, capture_output=True, text=True, timeout=300,
+                          env=dict(os.environ, PDB_INGEST_WATCHER='0'))
+
+
+def import_breakdown(module='app', top=15):
+    """
+    Import `module` in a fresh interpreter under -X importtime.
+
+    Returns:
+        dict with total_s, by_package (top-level package -> summed self time,
+        slowest first) and slowest_modules ((module, self_s, cumulative_s),
+        by self time), each limited to `top` entries
+    """
+    result = _run_python(['-X', 'importtime', '-c', f'import {module}'])
+    if result.returncode != 0:
+        raise RuntimeError(f'import {module} failed:\n{result.stderr[-2000:]}')
+
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        rows.append((name.strip(), int(self_us) / 1e6, int(cumulative_us) / 1e6))
+
+    by_package = defaultdict(float)
+    for name, self_s, _ in rows:
+        by_package[name.split('.')[0]] += self_s
+    total = next((cumulative for name, _, cumulative in rows if name == module), sum(by_package.values()))
+    return {
+        'total_s': total,
+        'by_package': sorted(by_package.items(), key=lambda item: item[1], reverse=True)[:top],
+        'slowest_modules': sorted(rows, key=lambda row: row[1], reverse=True)[:top]
+    }
+
+
+def first_response(repeat=3):
+    """Time process spawn to the first answered page `repeat` times. Returns the per-run dicts."""
+    runs = []
+    for _ in range(repeat):
+        spawned = time.time()
+        result = _run_python(['-c', _FIRST_RESPONSE_SCRIPT])
+        if result.returncode != 0:
+            raise RuntimeError(f'first-response run failed:\n{result.stderr[-2000:]}')
+        run = json.loads(result.stdout.strip().splitlines()[-1])
+        run['first_response_s'] = run.pop('answered_at') - spawned
+        runs.append(run)
+    return runs
+
+
+def run_startup_bench(repeat=3, top=15):
+    """Import breakdown plus time-to-first-response runs. Returns the results dict."""
+    runs = first_response(repeat)
+    return {
+        'imports': import_breakdown(top=top),
+        'first_response': runs,
+        'best_first_response_s': min(run['first_response_s'] for run in runs),
+        'eager_modules': sorted({name for run in runs for name in run['loaded']})
+    }
+
+
+def check_budget(report, budget=DEFAULT_BUDGET_SECONDS):
+    """List of problems (empty when the cold start is within budget and lazy modules stayed lazy)."""
+    problems = []
+    if report['best_first_response_s'] > budget:
+        problems.append(f"time to first response {report['best_first_response_s']:.2f}s is over the {budget:.2f}s budget")
+    if report['eager_modules']:
+        problems.append(f"imported before the first response: {', '.join(report['eager_modules'])}")
+    return problems
+
+
+def _print_report(report):
+    imports = report['imports']
+    print(f"import app: {imports['total_s'] * 1000:.0f} ms")
+    print("  by package (self time):")
+    for package, seconds in imports['by_package']:
+        print(f"    {package:<40} {seconds * 1000:>8.1f} ms")
+    print("  slowest modules (self / cumulative):")
+    for name, self_s, cumulative_s in imports['slowest_modules']:
+        print(f"    {name:<40} {self_s * 1000:>8.1f} ms {cumulative_s * 1000:>8.1f} ms")
+    print("Time to first response:")
+    for run in report['first_response']:
+        print(f"  {run['first_response_s'] * 1000:>8.0f} ms  (import {run['import_s'] * 1000:.0f} ms, "
+              f"init {run['init_s'] * 1000:.0f} ms, first requests {run['requests_s'] * 1000:.0f} ms)")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--budget', type=float, default=DEFAULT_BUDGET_SECONDS,
+                        help='maximum seconds from process spawn to the first answered page')
+    parser.add_argument('--top', type=int, default=15, help='packages and modules listed in the breakdown')
+    parser.add_argument('--output', help='write results JSON here')
+    args = parser.parse_args(argv)
+
+    report = run_startup_bench(args.repeat, args.top)
+    _print_report(report)
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"Results written to {args.output}")
+
+    problems = check_budget(report, args.budget)
+    for problem in problems:
+        print(f"STARTUP REGRESSION: {problem}")
+    return 1 if problems else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,193 @@
+import random
+from datetime import datetime, timedelta
+
+# Symbol -> (base price, tick size, tick value)
+SYNTHETIC_CONTRACTS = {
+    'ESU5': (6450.00, 0.25, 12.50),
+    'NQU5': (23400.00, 0.25, 5.00),
+    'CLV5': (63.50, 0.01, 10.00),
+    'GCZ5': (3410.0, 0.10, 10.00),
+    'NGQ25': (2.850, 0.001, 10.00),
+    'RTYU5': (2350.0, 0.10, 5.00),
+}
+
+RITHMIC_SUMMARY_HEADER = ('"Account","Trade P&L","Commission & Fees","Net P&L","Trade Count","Winning Trades",'
+                          '"Losing Trades","Win %","Lose %","Scratched Trades","Scratched %","Ticks Made",'
+                          '"Max Drawdown","Max Drawdown %"')
+RITHMIC_TRADE_HEADER = ('"Trade Date","Entry Order Number","Entry Buy/Sell","Entry Time","Entry Price",'
+                        '"Exit Order Number","Exit Buy/Sell","Exit Time","Exit Price","Trade Life Span (Seconds)",'
+                        '"Fill Size","Trade P&L","Commission & Fees","Net P&L","Ticks Made"')
+
+
+def _quote(values):
+    return ','.join(f'"{value}"' for value in values)
+
+
+def generate_rithmic_csv(file_path, date_str='2025-08-22', contracts=3, trades_per_contract=50,
+                         scale_out_depth=3, seed=0):
+    """
+    Write a synthetic Rithmic trade-history export.
+
+    Args:
+        file_path: Destination .csv path
+        date_str: Trading date (YYYY-MM-DD)
+        contracts: Number of contract sections
+        trades_per_contract: Positions (entry orders) per contract
+        scale_out_depth: Maximum partial exits per position
+        seed: Random seed, so runs are reproducible
+
+    Returns:
+        Number of lines written
+    """
+    rng = random.Random(seed)
+    session_open = datetime.strptime(date_str, '%Y-%m-%d').replace(hour=8)
+    order_number = 93880000
+    symbols = list(SYNTHETIC_CONTRACTS)
+    lines = [RITHMIC_SUMMARY_HEADER, _quote(['188076', '0.00', '0.00', '0.00', '0', '0', '0', '0.00', '0.00',
+                                             '0', '0.00', '0', '', ''])]
+
+    for contract_index in range(contracts):
+        symbol = symbols[contract_index % len(symbols)]
+        if contract_index >= len(symbols):
+            symbol = f"{symbol[:-1]}{contract_index}"
+        base_price, tick_size, tick_value = SYNTHETIC_CONTRACTS[symbols[contract_index % len(symbols)]]
+        decimals = max(0, len(f"{tick_size:g}".split('.')[-1])) if '.' in f"{tick_size:g}" else 0
+
+        trade_lines = []
+        for _ in range(trades_per_contract):
+            order_number += rng.randint(5, 40)
+            entry_order = order_number
+            is_long = rng.random() < 0.5
+            entry_time = session_open + timedelta(seconds=rng.randint(0, 7 * 3600))
+            entry_price = base_price + rng.randint(-200, 200) * tick_size
+
+            for _ in range(rng.randint(1, scale_out_depth)):
+                order_number += rng.randint(1, 10)
+                life_span = rng.uniform(0.5, 600)
+                exit_time = entry_time + timedelta(seconds=life_span)
+                exit_price = entry_price + rng.randint(-20, 20) * tick_size
+                fill_size = rng.randint(1, 5)
+                ticks = (exit_price - entry_price) / tick_size * (1 if is_long else -1)
+                pnl = ticks * tick_value * fill_size
+                fees = 4.0 * fill_size
+                trade_lines.append(_quote([
+                    date_str.replace('-', ''), entry_order, 'B' if is_long else 'S',
+                    entry_time.strftime('%Y-%m-%d %H:%M:%S'), f"{entry_price:.{decimals}f}",
+                    order_number, 'S' if is_long else 'B', exit_time.strftime('%Y-%m-%d %H:%M:%S'),
+                    f"{exit_price:.{decimals}f}", f"{life_span:.6f}", fill_size, f"{pnl:.2f}",
+                    f"{fees:.2f}", f"{pnl - fees:.2f}", ''
+                ]))
+
+        lines.append(_quote([symbol, '0.00', '0.00', '0.00', len(trade_lines), '0', '0', '0.00', '0.00',
+                             '0', '0.00', '0', '', '']))
+        lines.append(RITHMIC_TRADE_HEADER)
+        lines.extend(trade_lines)
+
+    with open(file_path, 'w') as f:
+        f.write('\n'.join(lines) + '\n')
+    return len(lines)
+
+
+# Excel fills use "<root> <Mon><yy>" contract names; the first three roots have default contract specs
+EXCEL_CONTRACTS = {
+    'ES': ('CME', 6450.00, 0.25),
+    'GC': ('COMEX', 3410.0, 0.10),
+    'RTY': ('CME', 2350.0, 0.10),
+    'NQ': ('CME', 23400.00, 0.25),
+    'CL': ('NYMEX', 63.50, 0.01),
+    'NG': ('NYMEX', 2.850, 0.001),
+}
+
+
+def generate_excel_fills(file_path, date_str='2025-08-22', contracts=3, trades_per_contract=50,
+                         scale_out_depth=3, seed=0):
+    """
+    Write a synthetic legacy 9-column Excel fills export (.xlsx or .xls path).
+
+    Each position opens with one fill and closes over up to scale_out_depth
+    fills; positions in the same contract never overlap. Rows are written
+    newest first, like the broker export.
+
+    Returns:
+        Number of fills written
+    """
+    import pandas as pd
+
+    rng = random.Random(seed)
+    day = datetime.strptime(date_str, '%Y-%m-%d')
+    month_code = day.strftime('%b%y')
+    roots = list(EXCEL_CONTRACTS)
+    rows = []
+
+    for contract_index in range(contracts):
+        root = roots[contract_index % len(roots)]
+        exchange, base_price, tick_size = EXCEL_CONTRACTS[root]
+        decimals = len(f"{tick_size:g}".split('.')[-1]) if '.' in f"{tick_size:g}" else 0
+        contract = f"{root} {month_code}"
+        clock = day.replace(hour=8) + timedelta(seconds=rng.randint(0, 600))
+
+        for _ in range(trades_per_contract):
+            is_long = rng.random() < 0.5
+            size = rng.randint(1, 5)
+            price = base_price + rng.randint(-200, 200) * tick_size
+            rows.append((clock, exchange, contract, 'B' if is_long else 'S', size, round(price, decimals)))
+
+            exits = min(size, rng.randint(1, scale_out_depth))
+            remaining = size
+            for exit_index in range(exits):
+                clock += timedelta(seconds=rng.uniform(0.5, 120))
+                exit_size = remaining if exit_index == exits - 1 else rng.randint(1, remaining - (exits - exit_index - 1))
+                remaining -= exit_size
+                exit_price = price + rng.randint(-20, 20) * tick_size
+                rows.append((clock, exchange, contract, 'S' if is_long else 'B', exit_size, round(exit_price, decimals)))
+            clock += timedelta(seconds=rng.uniform(1, 60))
+
+    rows.sort(key=lambda row: row[0], reverse=True)
+    df = pd.DataFrame([
+        [timestamp.strftime('%d%b%y'), timestamp.strftime('%H:%M:%S.%f')[:-3], exchange, contract, side, size,
+         price, 'F', 'Direct']
+        for timestamp, exchange, contract, side, size, price in rows
+    ])
+    df.to_excel(file_path, header=False, index=False)
+    return len(rows)
+
+
+def generate_dataset(data_dir, start_date='2025-08-01', days=20, contracts=3, fills_per_day=600,
+                     scale_out_depth=3, excel_every=0, seed=0):
+    """
+    Write a multi-day trading_data directory of synthetic exports.
+
+    Args:
+        data_dir: Destination directory (created if missing)
+        start_date: First calendar day; weekends are skipped
+        days: Number of trading days
+        contracts: Contracts traded per day
+        fills_per_day: Approximate exit fills per day across all contracts
+        scale_out_depth: Maximum partial exits per position
+        excel_every: Write every Nth day as a 9-column .xlsx instead of a
+            Rithmic .csv (0 = CSV only)
+        seed: Random seed
+
+    Returns:
+        List of (date_str, file_path) in date order
+    """
+    import os
+
+    os.makedirs(data_dir, exist_ok=True)
+    # Exits per position average (1 + depth) / 2
+    trades_per_contract = max(1, round(fills_per_day / contracts / ((1 + scale_out_depth) / 2)))
+    written = []
+    day = datetime.strptime(start_date, '%Y-%m-%d')
+    while len(written) < days:
+        if day.weekday() < 5:
+            date_str = day.strftime('%Y-%m-%d')
+            day_seed = seed * 10007 + len(written)
+            if excel_every and len(written) % excel_every == excel_every - 1:
+                file_path = os.path.join(data_dir, f'trades_{date_str}.xlsx')
+                generate_excel_fills(file_path, date_str, contracts, trades_per_contract, scale_out_depth, day_seed)
+            else:
+                file_path = os.path.join(data_dir, f'{date_str}.csv')
+                generate_rithmic_csv(file_path, date_str, contracts, trades_per_contract, scale_out_depth, day_seed)
+            written.append((date_str, file_path))
+        day += timedelta(days=1)
+    return written
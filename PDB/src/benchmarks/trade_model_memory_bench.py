@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""Compare memory and time of the per-fill dict pipeline with the columnar one.
+
+Measures (wall time, then tracemalloc peak in a second run) on one synthetic multi-thousand-fill day:
+  - the legacy parser (a 14-key dict per fill, then dicts per position)
+  - the fast parser (raw trade lines tokenized per contract block)
+and the size of the aggregated-trade model held three ways: per-trade dicts,
+slotted AggregatedTrade objects, and TradeDate's column arrays.
+
+Usage (from the src directory):
+    python -m benchmarks.trade_model_memory_bench [--contracts 6] [--trades 500] [--depth 4]
+"""
+import argparse
+import contextlib
+import io
+import os
+import tempfile
+import time
+import tracemalloc
+
+import pandas as pd
+
+from benchmarks.synthetic_data import generate_rithmic_csv
+from classes.AT import AggregatedTrade
+from classes.TD import TradeDate
+from contracts.contract_manager import ContractManager
+from data.trade_processor import TradeProcessor
+
+
+def measure(func):
+    """Run func twice; return (result, seconds untraced, peak traced bytes)."""
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def retained(build):
+    """Bytes still allocated by the object build() returns."""
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        obj = build()
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    return obj, after - before
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--contracts', type=int, default=6)
+    parser.add_argument('--trades', type=int, default=500, help='positions per contract')
+    parser.add_argument('--depth', type=int, default=4, help='max scale-out exits per position')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        file_path = os.path.join(tmp_dir, '2025-08-22.csv')
+        line_count = generate_rithmic_csv(file_path, contracts=args.contracts,
+                                          trades_per_contract=args.trades, scale_out_depth=args.depth)
+        print(f"Synthetic export: {line_count:,} lines, {args.contracts} contracts")
+
+        print("Parse (peak traced memory, wall time):")
+        results = {}
+        for csv_parser in ('legacy', 'fast'):
+            processor = TradeProcessor(ContractManager(), csv_parser=csv_parser)
+            with contextlib.redirect_stdout(io.StringIO()):
+                results[csv_parser], elapsed, peak = measure(
+                    lambda: processor.calculate_trades_csv_rithmic(file_path))
+            print(f"  {csv_parser:<7} {peak / 1e6:>8.1f} MB  {elapsed:>7.3f}s")
+        pd.testing.assert_frame_equal(results['fast'], results['legacy'], check_exact=True)
+
+        # Fills per contract from the fast parser, for the model comparison
+        with open(file_path) as f:
+            lines = [line.strip() for line in f if line.strip()]
+        contracts_data = TradeProcessor(ContractManager())._parse_rithmic_csv_fast(lines)
+
+    print("Aggregated trade model (retained memory):")
+    contract_trades = _model_trades(contracts_data)
+    trades = [trade for _, trade in contract_trades]
+    _, columnar_bytes = retained(lambda: _build_trade_date(contract_trades))
+    _, dict_bytes = retained(lambda: [trade.to_dict() for trade in trades])
+    _, slotted_bytes = retained(lambda: [AggregatedTrade(*(getattr(t, f) for f in AggregatedTrade.__slots__))
+                                         for t in trades])
+    print(f"  {len(trades):,} trades")
+    print(f"  dicts    {dict_bytes / 1e6:>8.2f} MB")
+    print(f"  slotted  {slotted_bytes / 1e6:>8.2f} MB")
+    print(f"  columnar {columnar_bytes / 1e6:>8.2f} MB")
+
+
+def _model_trades(contracts_data):
+    """[(contract, AggregatedTrade)], one per parsed trade line."""
+    return [(contract, AggregatedTrade(*values))
+            for contract, data in contracts_data.items()
+            for values in data['trades'][list(AggregatedTrade.__slots__)].itertuples(index=False)]
+
+
+def _build_trade_date(contract_trades):
+    trade_date = TradeDate('2025-08-22')
+    for contract, trade in contract_trades:
+        trade_date.add_trade(contract, trade)
+    trade_date.trade_count()  # folds the buffered trades into the column arrays
+    return trade_date
+
+
+if __name__ == '__main__':
+    main()
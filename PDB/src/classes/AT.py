@@ -1,4 +1,7 @@
 class AggregatedTrade:
+    # Slotted: no per-instance __dict__, which matters with thousands of trades per day
+    __slots__ = ('entry_order_number', 'commission_fees', 'trade_pnl', 'fill_size')
+
     def __init__(self, entry_order_number, commission_fees, trade_pnl, fill_size):
         self.entry_order_number = entry_order_number
         self.commission_fees = commission_fees
@@ -9,6 +12,14 @@ class AggregatedTrade:
         return (f"AggregatedTrade(order={self.entry_order_number}, "
                 f"fees={self.commission_fees}, pnl={self.trade_pnl}, fills={self.fill_size})")
 
+    def __eq__(self, other):
+        if not isinstance(other, AggregatedTrade):
+            return NotImplemented
+        return all(getattr(self, field) == getattr(other, field) for field in self.__slots__)
+
+    def __hash__(self):
+        # Consistent with __eq__; don't mutate a trade while it is a dict key or in a set
+        return hash(tuple(getattr(self, field) for field in self.__slots__))
 
     def to_dict(self):
         return {
@@ -1,23 +1,68 @@
+import numpy as np
 import pandas as pd
+
+from classes.AT import AggregatedTrade
+
+TRADE_FIELDS = AggregatedTrade.__slots__
+
+
 class TradeDate:
+    """Aggregated trades for one date, stored column-wise per contract.
+
+    Each contract holds one NumPy array per AggregatedTrade field rather than
+    a list of trade objects. Trades added one at a time are buffered and
+    folded into the arrays on the next read; AggregatedTrade instances are
+    only built when get_trades() asks for them.
+    """
+    __slots__ = ('date', 'contracts', '_pending')
+
     def __init__(self, date):
         self.date = date
-        self.contracts = {}  # {contract: [AggregatedTrade, ...]}
+        self.contracts = {}  # {contract: {field: np.ndarray}}
+        self._pending = {}  # {contract: [(field values...), ...]}
 
     def add_trade(self, contract, trade):
-        if contract not in self.contracts:
-            self.contracts[contract] = []
-        self.contracts[contract].append(trade)
+        self.contracts.setdefault(contract, None)
+        self._pending.setdefault(contract, []).append(tuple(getattr(trade, field) for field in TRADE_FIELDS))
+
+    def _extend(self, contract, arrays):
+        self._flush(contract)
+        current = self.contracts.get(contract)
+        if current is None:
+            self.contracts[contract] = arrays
+        else:
+            self.contracts[contract] = {field: np.concatenate([current[field], arrays[field]])
+                                        for field in TRADE_FIELDS}
+
+    def _flush(self, contract):
+        rows = self._pending.pop(contract, None)
+        if rows:
+            columns = list(zip(*rows))
+            arrays = {field: np.array(values, dtype=object if field == 'entry_order_number' else None)
+                      for field, values in zip(TRADE_FIELDS, columns)}
+            self._extend(contract, arrays)
+
+    def _arrays(self, contract):
+        self._flush(contract)
+        return self.contracts.get(contract)
 
     def get_trades(self, contract):
-        return self.contracts.get(contract, [])
+        arrays = self._arrays(contract)
+        if arrays is None:
+            return []
+        return [AggregatedTrade(*values)
+                for values in zip(*(arrays[field].tolist() for field in TRADE_FIELDS))]
 
+    def trade_count(self):
+        return sum(len(self._arrays(contract)['entry_order_number']) for contract in list(self.contracts))
 
     def trades_to_dataframe(self):
-        trade_dicts = []
-        for contract, trades in self.contracts.items():
-            for trade in trades:
-                trade_data = trade.to_dict()
-                trade_data['contract'] = contract  # Inject contract info into dict
-                trade_dicts.append(trade_data)
-        return pd.DataFrame(trade_dicts)
+        frames = []
+        for contract in list(self.contracts):
+            arrays = self._arrays(contract)
+            frame = pd.DataFrame({field: arrays[field] for field in TRADE_FIELDS})
+            frame['contract'] = contract
+            frames.append(frame)
+        if not frames:
+            return pd.DataFrame()
+        return pd.concat(frames, ignore_index=True)
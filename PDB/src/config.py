@@ -6,10 +6,83 @@ PDB_DIR = os.path.dirname(SRC_DIR)  # PDB directory
 DATA_DIR = os.path.join(SRC_DIR, 'trading_data')
 NOTES_FILE = os.path.join(PDB_DIR, 'trading_notes.json')
 CONTRACTS_FILE = os.path.join(PDB_DIR, 'contracts.json')
-os.makedirs(DATA_DIR, exist_ok=True)
+CACHE_DIR = os.path.join(PDB_DIR, '.trade_cache')  # Parsed trades cache
+ROLLUP_FILE = os.path.join(CACHE_DIR, 'daily_rollups.json')  # One summary row per trading day
+QUALITY_INDEX_FILE = os.path.join(CACHE_DIR, 'quality_index.json')  # Rated trades by month
+
+# Logging: INFO keeps production output to one line per action; DEBUG traces every parsed row
+LOG_LEVEL = os.environ.get('PDB_LOG_LEVEL', 'INFO')
+LOG_FORMAT = '%(asctime)s %(levelname)s [%(name)s] %(message)s'
+
+# Rithmic CSV parser backend: 'fast' (columnar) or 'legacy' (line-by-line)
+RITHMIC_CSV_PARSERS = ('fast', 'legacy')
+RITHMIC_CSV_PARSER = os.environ.get('PDB_RITHMIC_CSV_PARSER', 'fast')
+if RITHMIC_CSV_PARSER not in RITHMIC_CSV_PARSERS:
+    raise ValueError(f"PDB_RITHMIC_CSV_PARSER must be one of {RITHMIC_CSV_PARSERS}, got {RITHMIC_CSV_PARSER!r}")
+
+# Background ingestion of new exports: poll interval, and how long a file must be
+# left untouched before it is considered fully written
+INGEST_WATCHER_ENABLED = os.environ.get('PDB_INGEST_WATCHER', '1') != '0'
+INGEST_POLL_SECONDS = float(os.environ.get('PDB_INGEST_POLL_SECONDS', '2.0'))
+INGEST_DEBOUNCE_SECONDS = float(os.environ.get('PDB_INGEST_DEBOUNCE_SECONDS', '1.0'))
+# Days per rollup refresh while backfilling, so rows are saved as the backfill goes
+INGEST_BATCH_SIZE = int(os.environ.get('PDB_INGEST_BATCH_SIZE', '20'))
+
+# Worker processes for bulk (backfill) parsing; 0 uses every CPU
+BULK_INGEST_WORKERS = int(os.environ.get('PDB_BULK_INGEST_WORKERS', '0'))
+
+# Rendered daily dashboards kept in memory (LRU); 0 disables the cache
+RENDER_CACHE_SIZE = int(os.environ.get('PDB_RENDER_CACHE_SIZE', '32'))
+
+# Parsed trades kept in memory for recently viewed days, shared by the daily view callbacks
+DAY_STORE_SIZE = int(os.environ.get('PDB_DAY_STORE_SIZE', '8'))
+
+# Trade cards rendered per page in the daily view
+TRADE_CARDS_PAGE_SIZE = int(os.environ.get('PDB_TRADE_CARDS_PAGE_SIZE', '20'))
+
+# Latency metrics: samples kept per stage for the rolling p50/p95/p99 served on /metrics
+METRICS_ENABLED = os.environ.get('PDB_METRICS', '1') != '0'
+METRICS_WINDOW = int(os.environ.get('PDB_METRICS_WINDOW', '1024'))
+# Serve /metrics and /debug/profiles to non-loopback clients too
+METRICS_ALLOW_REMOTE = os.environ.get('PDB_METRICS_ALLOW_REMOTE', '0') == '1'
+# gunicorn workers share their metrics through this directory, each rewriting its file every few seconds
+METRICS_DIR = os.path.join(CACHE_DIR, 'metrics')
+METRICS_PUBLISH_SECONDS = float(os.environ.get('PDB_METRICS_PUBLISH_SECONDS', '5.0'))
+
+# Opt-in cProfile capture of callback requests; the slowest PROFILE_KEEP are kept for download
+PROFILE_REQUESTS = os.environ.get('PDB_PROFILE_REQUESTS', '0') == '1'
+PROFILE_KEEP = int(os.environ.get('PDB_PROFILE_KEEP', '10'))
+
+# Production serving (gunicorn -c gunicorn.conf.py wsgi:server): bind address,
+# worker processes (0 = one per CPU), threads per worker and request timeout
+SERVER_BIND = os.environ.get('PDB_BIND', '127.0.0.1:8050')
+SERVER_WORKERS = int(os.environ.get('PDB_WORKERS', '0'))
+SERVER_THREADS = int(os.environ.get('PDB_THREADS', '4'))
+SERVER_TIMEOUT = int(os.environ.get('PDB_SERVER_TIMEOUT', '120'))
+# Held by the one process that runs the export watcher
+INGEST_LOCK_FILE = os.path.join(CACHE_DIR, 'ingest.lock')
+
+# Monthly and range views run as Dash background jobs on a thread pool in each server
+# process (needs diskcache; without it they run inside the request)
+BACKGROUND_CALLBACKS = os.environ.get('PDB_BACKGROUND_CALLBACKS', '1') != '0'
+BACKGROUND_CACHE_DIR = os.path.join(CACHE_DIR, 'background_jobs')
+BACKGROUND_JOB_THREADS = int(os.environ.get('PDB_BACKGROUND_JOB_THREADS', '2'))
+
+# Daily export filename patterns, in lookup priority order
+DATA_FILE_PATTERNS = [
+    '{date}.csv',
+    'trades_{date}.csv',
+    '{date}.xls',
+    'trades_{date}.xls',
+    '{date}.xlsx',
+    'trades_{date}.xlsx'
+]
 
 # Default contracts configuration
 DEFAULT_CONTRACTS = {
     'ES': {'tick_value': 12.50, 'tick_size': 0.25},
     'GC': {'tick_value': 10.00, 'tick_size': 0.10}
-} 
\ No newline at end of file
+} 
+# Storage backend for notes, trade analysis and contracts: 'json' (flat files) or 'sqlite'
+STORAGE_BACKEND = os.environ.get('PDB_STORAGE_BACKEND', 'json')
+JOURNAL_DB_FILE = os.path.join(PDB_DIR, 'journal.db')
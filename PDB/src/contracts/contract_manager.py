@@ -1,23 +1,72 @@
 import json
 import os
-from config import CONTRACTS_FILE, DEFAULT_CONTRACTS
+import threading
+from config import CONTRACTS_FILE, DEFAULT_CONTRACTS, STORAGE_BACKEND
+from contracts.contract_registry import ContractRegistry
+from storage.file_lock import file_lock, write_json_atomic
+
+# Shared by every ContractManager: contracts are re-read only when the source changes
+_cache = {'signature': None, 'contracts': None, 'registry': None}
+_cache_lock = threading.Lock()
 
 class ContractManager:
+    def __init__(self):
+        self._journal = None
+        if STORAGE_BACKEND == 'sqlite':
+            from storage.sqlite_journal import get_journal
+            self._journal = get_journal()
+
+    def _load_from_source(self):
+        if self._journal is not None:
+            contracts = self._journal.load_contracts()
+            # The journal query is cheap; its content is the signature
+            return json.dumps(contracts, sort_keys=True), contracts
+
+        if not os.path.exists(CONTRACTS_FILE):
+            with open(CONTRACTS_FILE, 'w') as f:
+                json.dump(DEFAULT_CONTRACTS, f)
+        stat = os.stat(CONTRACTS_FILE)
+        signature = (stat.st_mtime_ns, stat.st_size)
+        if signature == _cache['signature']:
+            return signature, _cache['contracts']
+        with open(CONTRACTS_FILE, 'r') as f:
+            return signature, json.load(f)
+
+    def _refresh(self):
+        with _cache_lock:
+            signature, contracts = self._load_from_source()
+            if signature != _cache['signature']:
+                _cache['signature'] = signature
+                _cache['contracts'] = contracts
+                _cache['registry'] = ContractRegistry(contracts)
+            return _cache['contracts'], _cache['registry']
+
     def load_contracts(self):
-        if os.path.exists(CONTRACTS_FILE):
-            with open(CONTRACTS_FILE, 'r') as f:
-                return json.load(f)
-        
-        with open(CONTRACTS_FILE, 'w') as f:
-            json.dump(DEFAULT_CONTRACTS, f)
-        return DEFAULT_CONTRACTS
-    
+        contracts, _ = self._refresh()
+        return dict(contracts)
+
+    def get_registry(self):
+        """Return the symbol -> root contract registry for the current contracts."""
+        _, registry = self._refresh()
+        return registry
+
+    def specs_signature(self):
+        """Return a short hash of the current tick specs."""
+        return self.get_registry().signature
+
     def save_contract(self, name, tick_value, tick_size):
-        contracts = self.load_contracts()
-        contracts[name] = {
-            'tick_value': float(tick_value),
-            'tick_size': float(tick_size)
-        }
-        with open(CONTRACTS_FILE, 'w') as f:
-            json.dump(contracts, f)
-        return contracts 
\ No newline at end of file
+        if self._journal is not None:
+            self._journal.save_contract(name, float(tick_value), float(tick_size))
+            return self.load_contracts()
+
+        # Re-read under the lock so a save from another worker is not overwritten
+        with file_lock(CONTRACTS_FILE):
+            self._load_from_source()  # writes the defaults if the file is missing
+            with open(CONTRACTS_FILE, 'r') as f:
+                contracts = json.load(f)
+            contracts[name] = {
+                'tick_value': float(tick_value),
+                'tick_size': float(tick_size)
+            }
+            write_json_atomic(CONTRACTS_FILE, contracts)
+        return contracts
@@ -0,0 +1,67 @@
+import hashlib
+import json
+import re
+import numpy as np
+import pandas as pd
+
+# Root + futures month code + 1-2 digit year, e.g. CLV5, ESU5, NGQ25, MNQZ5
+_EXCHANGE_SYMBOL = re.compile(r'^([A-Z0-9]+?)([FGHJKMNQUVXZ])(\d{1,2})$')
+
+
+class ContractRegistry:
+    """Precomputed symbol -> root contract lookup over a contracts spec dict.
+
+    Accepts Rithmic exchange symbols ("CLV5", quoted or not) and Excel-style
+    names ("ES Mar25"). Each distinct symbol is resolved once and memoized.
+    """
+
+    def __init__(self, contracts):
+        self.contracts = contracts
+        # Changes whenever any tick spec does; keys caches of P&L computed from the specs
+        self.signature = hashlib.sha1(json.dumps(contracts, sort_keys=True).encode('utf-8')).hexdigest()[:16]
+        self._roots = {}
+
+    def root_for(self, symbol):
+        """Return the root contract for symbol (e.g. '"NGQ25"' -> 'NG')."""
+        root = self._roots.get(symbol)
+        if root is None:
+            root = self._resolve(symbol)
+            self._roots[symbol] = root
+        return root
+
+    def _resolve(self, symbol):
+        cleaned = str(symbol).strip().strip('"').strip()
+        if not cleaned:
+            return cleaned
+        token = cleaned.split()[0]
+        if token in self.contracts or ' ' in cleaned:
+            return token
+        match = _EXCHANGE_SYMBOL.match(token.upper())
+        return match.group(1) if match else token
+
+    def specs_for(self, symbol):
+        """Return the tick specs for symbol's root, or None if unknown."""
+        return self.contracts.get(self.root_for(symbol))
+
+    def resolve_roots(self, symbols):
+        """Vectorized root_for over an array/Series of symbols."""
+        codes, uniques = pd.factorize(np.asarray(symbols, dtype=object), use_na_sentinel=False)
+        roots = np.array([self.root_for(symbol) for symbol in uniques], dtype=object)
+        return roots[codes]
+
+    def tick_specs(self, symbols):
+        """Return (tick_size, tick_value, has_specs) arrays aligned with symbols.
+
+        Symbols without specs get tick_size 1.0 and tick_value 0.0.
+        """
+        codes, uniques = pd.factorize(np.asarray(symbols, dtype=object), use_na_sentinel=False)
+        unique_specs = [self.specs_for(symbol) for symbol in uniques]
+        tick_size = np.array([specs['tick_size'] if specs else 1.0 for specs in unique_specs], dtype=float)
+        tick_value = np.array([specs['tick_value'] if specs else 0.0 for specs in unique_specs], dtype=float)
+        has_specs = np.array([specs is not None for specs in unique_specs], dtype=bool)
+        return tick_size[codes], tick_value[codes], has_specs[codes]
+
+    def unknown_roots(self, symbols):
+        """Roots among symbols that have no contract specs."""
+        roots = pd.unique(self.resolve_roots(symbols))
+        return [root for root in roots if root not in self.contracts]
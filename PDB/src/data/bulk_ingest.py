@@ -0,0 +1,55 @@
+import argparse
+import logging
+import os
+
+from contracts.contract_manager import ContractManager
+from data.daily_rollup import get_daily_rollups
+from data.data_index import get_data_index
+from data.trade_processor import TradeProcessor
+
+logger = logging.getLogger(__name__)
+
+
+def bulk_ingest(file_paths=None, max_workers=None, use_cache=True):
+    """Parse exports in parallel, warm the trades cache and refresh their daily rollups.
+
+    Defaults to every export in DATA_DIR. Returns (trades, errors) as returned by
+    TradeProcessor.parse_files_parallel.
+    """
+    data_index = get_data_index()
+    if file_paths is None:
+        file_paths = [data_index.find(date_str) for date_str in data_index.all_dates()]
+
+    def progress(done, total, file_path, error):
+        status = f"failed: {error}" if error else "ok"
+        logger.info('[%s/%s] %s %s', done, total, os.path.basename(file_path), status)
+
+    processor = TradeProcessor(ContractManager())
+    trades, errors = processor.parse_files_parallel(file_paths, max_workers=max_workers,
+                                                    use_cache=use_cache, progress=progress)
+
+    # Rollups read the freshly cached frames, so this pass is cheap
+    indexed = {data_index.find(date_str): date_str for date_str in data_index.all_dates()}
+    dates = [indexed[file_path] for file_path in trades if file_path in indexed]
+    get_daily_rollups().refresh(dates)
+    return trades, errors
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Parse many trade exports in parallel (backfill)')
+    parser.add_argument('files', nargs='*', help='export files to ingest (default: everything in DATA_DIR)')
+    parser.add_argument('--workers', type=int, default=None, help='worker processes (default: config / CPU count)')
+    parser.add_argument('--no-cache', action='store_true', help='re-parse files even if they are cached')
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    trades, errors = bulk_ingest(args.files or None, args.workers, use_cache=not args.no_cache)
+    logger.info('Ingested %s file(s), %s trade(s); %s failed',
+                len(trades), sum(len(df) for df in trades.values()), len(errors))
+    for file_path, error in errors.items():
+        logger.info('  %s: %s', file_path, error)
+    return 1 if errors else 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
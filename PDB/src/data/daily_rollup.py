@@ -0,0 +1,306 @@
+import argparse
+import json
+import logging
+import os
+import threading
+
+import numpy as np
+
+from config import ROLLUP_FILE
+from data.data_index import get_data_index
+from data.trade_cache import PARSER_VERSION
+from storage.file_lock import file_lock, write_json_atomic
+
+logger = logging.getLogger(__name__)
+
+
+def _to_python(value):
+    """Convert numpy scalars to plain Python numbers for JSON."""
+    return value.item() if isinstance(value, np.generic) else value
+
+
+def summarize_trades(trades_df, registry):
+    """Per-day totals for one trades DataFrame, or None if it has no P&L rows."""
+    if trades_df.empty or 'pnl' not in trades_df.columns:
+        return None
+
+    pnl = trades_df['pnl']
+    contracts = {}
+    if 'contract' in trades_df.columns:
+        roots = registry.resolve_roots(trades_df['contract'])
+        by_root = pnl.groupby(roots, sort=False).agg(['sum', 'size'])
+        for contract, row in zip(by_root.index, by_root.itertuples(index=False)):
+            contracts[contract] = {'pnl': _to_python(row.sum), 'trades': int(row.size)}
+
+    return {
+        'total_pnl': _to_python(pnl.sum()),
+        'trade_count': len(trades_df),
+        'wins': int((pnl > 0).sum()),
+        'losses': int((pnl < 0).sum()),
+        'contracts': contracts
+    }
+
+
+class DailyRollupStore:
+    """Persistent one-row-per-trading-day summary of P&L, counts and contracts.
+
+    Rows remember the source file's mtime, size, PARSER_VERSION and the
+    contract specs signature; a day is recomputed only when its export is new
+    or changed or the specs were edited, so month and year views are served
+    without touching raw exports. Days that fail to parse are recorded too,
+    so an unchanged bad file is not retried on every render.
+    """
+
+    def __init__(self, trade_processor, data_index=None, rollup_file=ROLLUP_FILE):
+        self.trade_processor = trade_processor
+        self.data_index = data_index or get_data_index()
+        self.rollup_file = rollup_file
+        self._lock = threading.RLock()
+        self._rows = None
+        self._signature = None
+
+    def _file_signature(self):
+        try:
+            stat = os.stat(self.rollup_file)
+        except FileNotFoundError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def _read(self):
+        try:
+            with open(self.rollup_file, 'r') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except ValueError as e:
+            logger.warning('Discarding unreadable rollup file %s: %s', self.rollup_file, e)
+            return {}
+
+    def _load(self, force=False):
+        """Read the rows if another process rewrote the file since the last read (always, when force is set)."""
+        signature = self._file_signature()
+        if self._rows is not None and signature == self._signature and not force:
+            return
+        self._rows = self._read()
+        self._signature = signature
+
+    def _save(self, dates=None):
+        """Write the rows for dates (all rows when None) under the file lock.
+
+        Other worker processes may have saved their own days since this one
+        read the file, so it is re-read and only these dates are merged in.
+        """
+        with file_lock(self.rollup_file):
+            if dates is not None:
+                rows = self._read()
+                for date_str in dates:
+                    if date_str in self._rows:
+                        rows[date_str] = self._rows[date_str]
+                    else:
+                        rows.pop(date_str, None)
+                self._rows = rows
+            # Unique temporary name: several worker processes may save at once
+            write_json_atomic(self.rollup_file, self._rows, sort_keys=True)
+            self._signature = self._file_signature()
+
+    def _source_signature(self, file_path):
+        stat = os.stat(file_path)
+        return {
+            'source': os.path.basename(file_path),
+            'mtime_ns': stat.st_mtime_ns,
+            'size': stat.st_size,
+            'parser_version': PARSER_VERSION,
+            # P&L of Excel exports and the per-contract split both come from the tick specs
+            'specs': self.trade_processor.contract_manager.specs_signature()
+        }
+
+    def _compute_row(self, date_str, file_path, use_cache=True):
+        row = self._source_signature(file_path)
+        try:
+            trades_df = self.trade_processor.load_trades_file(file_path, use_cache=use_cache)
+            registry = self.trade_processor.contract_manager.get_registry()
+            row['summary'] = summarize_trades(trades_df, registry)
+        except Exception as e:
+            logger.warning('Error processing %s: %s', date_str, e)
+            row['summary'] = None
+            row['error'] = str(e)
+        return row
+
+    def _is_current(self, row, file_path):
+        """True if row was computed from file_path as it is now, with the current specs."""
+        if row is None:
+            return False
+        return all(row.get(key) == value for key, value in self._source_signature(file_path).items())
+
+    def _refresh_date(self, date_str, use_cache):
+        """Bring one row up to date (caller holds the lock). Returns True if it changed."""
+        file_path = self.data_index.find(date_str)
+        if file_path is None:
+            return self._rows.pop(date_str, None) is not None
+        if self._is_current(self._rows.get(date_str), file_path):
+            return False
+        self._rows[date_str] = self._compute_row(date_str, file_path, use_cache)
+        return True
+
+    def refresh(self, dates, use_cache=True, progress=None):
+        """Bring the rows for dates up to date with their exports. Returns the dates updated.
+
+        Exports are parsed without holding the store's lock, so a long refresh
+        (a backfill) does not hold up reads of other days; the new rows are
+        merged in and saved at the end.
+
+        progress, if given, is called as progress(done, total) after each date.
+        """
+        dates = list(dates)
+        rows = {}  # {date_str: new row, or None when its export is gone}
+        for done, date_str in enumerate(dates, 1):
+            file_path = self.data_index.find(date_str)
+            with self._lock:
+                self._load()
+                row = self._rows.get(date_str)
+            if file_path is None:
+                if row is not None:
+                    rows[date_str] = None
+            elif not self._is_current(row, file_path):
+                rows[date_str] = self._compute_row(date_str, file_path, use_cache)
+            if progress is not None:
+                progress(done, len(dates))
+        if rows:
+            with self._lock:
+                self._load()
+                for date_str, row in rows.items():
+                    if row is None:
+                        self._rows.pop(date_str, None)
+                    else:
+                        self._rows[date_str] = row
+                self._save(list(rows))
+            logger.debug('Updated rollups for %s', list(rows))
+        return list(rows)
+
+    def _summaries(self, dates, progress=None):
+        """{date_str: summary} for the dates that have trades, refreshing them first."""
+        dates = list(dates)
+        self.refresh(dates, progress=progress)
+        with self._lock:
+            return {
+                date_str: self._rows[date_str]['summary']
+                for date_str in dates
+                if date_str in self._rows and self._rows[date_str]['summary'] is not None
+            }
+
+    def month(self, year, month, progress=None):
+        """Per-day summaries for a month, keyed by date string."""
+        return self._summaries(self.data_index.dates_in_month(year, month), progress)
+
+    def between(self, start_date, end_date):
+        """Per-day summaries for start_date..end_date inclusive (YYYY-MM-DD)."""
+        return self._summaries(self.data_index.dates_between(start_date, end_date))
+
+    def year(self, year):
+        """Per-month totals for a year: {month: {'total_pnl', 'trade_count', 'wins', 'losses', 'trading_days'}}."""
+        daily = self.between(f"{year}-01-01", f"{year}-12-31")
+        months = {}
+        for date_str, summary in daily.items():
+            totals = months.setdefault(int(date_str[5:7]), {
+                'total_pnl': 0, 'trade_count': 0, 'wins': 0, 'losses': 0, 'trading_days': 0
+            })
+            totals['total_pnl'] += summary['total_pnl']
+            totals['trade_count'] += summary['trade_count']
+            totals['wins'] += summary['wins']
+            totals['losses'] += summary['losses']
+            totals['trading_days'] += 1
+        return dict(sorted(months.items()))
+
+    def errors(self):
+        """{date_str: error message} for days whose export could not be parsed."""
+        with self._lock:
+            self._load()
+            return {date_str: row['error'] for date_str, row in sorted(self._rows.items()) if 'error' in row}
+
+    def error_for(self, date_str):
+        """Parse error recorded for date_str's current export, or None."""
+        file_path = self.data_index.find(date_str)
+        if file_path is None:
+            return None
+        with self._lock:
+            self._load()
+            row = self._rows.get(date_str)
+            if row is None or 'error' not in row or not self._is_current(row, file_path):
+                return None
+            return row['error']
+
+    def rebuild(self):
+        """Drop every row and recompute all days from the exports, bypassing the trade cache."""
+        with self._lock:
+            self._rows = {}
+            for date_str in self.data_index.all_dates():
+                self._refresh_date(date_str, use_cache=False)
+            self._save()
+            return len(self._rows)
+
+    def verify(self):
+        """Re-parse every export, bypassing the trade cache, and compare with the stored rows.
+
+        Returns a list of (date_str, problem) tuples; empty when everything matches.
+        """
+        problems = []
+        with self._lock:
+            self._load()
+            all_dates = self.data_index.all_dates()
+            for date_str in sorted(set(self._rows) - set(all_dates)):
+                problems.append((date_str, 'row has no export file'))
+            for date_str in all_dates:
+                stored = self._rows.get(date_str)
+                if stored is None:
+                    problems.append((date_str, 'missing row'))
+                    continue
+                fresh = self._compute_row(date_str, self.data_index.find(date_str), use_cache=False)
+                if fresh != stored:
+                    problems.append((date_str, 'row differs from a fresh parse'))
+        return problems
+
+
+_default_store = None
+_default_store_lock = threading.Lock()
+
+
+def get_daily_rollups():
+    """Return the process-wide rollup store."""
+    global _default_store
+    with _default_store_lock:
+        if _default_store is None:
+            from contracts.contract_manager import ContractManager
+            from data.trade_processor import TradeProcessor
+            _default_store = DailyRollupStore(TradeProcessor(ContractManager()))
+        return _default_store
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Maintain the daily P&L rollup store')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    subparsers.add_parser('rebuild', help='recompute every day from the exports')
+    subparsers.add_parser('verify', help='compare stored rows with a fresh parse of every export')
+    show_parser = subparsers.add_parser('show', help='print the rollups for a month')
+    show_parser.add_argument('year', type=int)
+    show_parser.add_argument('month', type=int)
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    store = get_daily_rollups()
+    if args.command == 'rebuild':
+        logger.info('Rebuilt rollups for %s trading days', store.rebuild())
+    elif args.command == 'verify':
+        problems = store.verify()
+        for date_str, problem in problems:
+            logger.error('%s: %s', date_str, problem)
+        logger.info('%s problem(s) found', len(problems))
+        return 1 if problems else 0
+    else:
+        for date_str, summary in store.month(args.year, args.month).items():
+            logger.info('%s  pnl=%.2f  trades=%s  wins=%s  losses=%s',
+                        date_str, summary['total_pnl'], summary['trade_count'], summary['wins'], summary['losses'])
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
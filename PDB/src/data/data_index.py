@@ -0,0 +1,120 @@
+import bisect
+import calendar
+import os
+import re
+import threading
+
+from config import DATA_DIR, DATA_FILE_PATTERNS
+from monitoring.timing import timed
+
+_DATE_IN_NAME = re.compile(r'\d{4}-\d{2}-\d{2}')
+
+
+class DataDirIndex:
+    """Index of DATA_DIR mapping each trading date to its export file.
+
+    The directory is read with a single os.scandir and only re-read when its
+    mtime changes (a file was added, removed or renamed). When several exports
+    exist for one date, the first match in DATA_FILE_PATTERNS wins.
+    """
+
+    def __init__(self, data_dir=DATA_DIR, patterns=DATA_FILE_PATTERNS):
+        self.data_dir = data_dir
+        self._pattern_rank = {pattern: rank for rank, pattern in enumerate(patterns)}
+        self._lock = threading.Lock()
+        self._dir_mtime = None
+        self._files_by_date = {}  # {date_str: (rank, file_path, file_format)}
+        self._sorted_dates = []
+        self._export_files = []
+
+    def refresh(self, force=False):
+        """Rebuild the index if the directory changed since the last scan."""
+        try:
+            dir_mtime = os.stat(self.data_dir).st_mtime_ns
+        except FileNotFoundError:
+            dir_mtime = None
+
+        with self._lock:
+            if not force and dir_mtime == self._dir_mtime and self._dir_mtime is not None:
+                return
+
+            files_by_date = {}
+            export_files = []
+            if dir_mtime is not None:
+                with os.scandir(self.data_dir) as entries:
+                    for entry in entries:
+                        name = entry.name
+                        if not name.endswith(('.csv', '.xls', '.xlsx')):
+                            continue
+                        export_files.append(name)
+
+                        match = _DATE_IN_NAME.search(name)
+                        if not match:
+                            continue
+                        date_str = match.group(0)
+                        rank = self._pattern_rank.get(name.replace(date_str, '{date}', 1))
+                        if rank is None:
+                            continue
+                        if date_str not in files_by_date or rank < files_by_date[date_str][0]:
+                            files_by_date[date_str] = (rank, entry.path, os.path.splitext(name)[1][1:])
+
+            self._files_by_date = files_by_date
+            self._sorted_dates = sorted(files_by_date)
+            self._export_files = sorted(export_files)
+            self._dir_mtime = dir_mtime
+
+    @timed('data_index.find')
+    def find(self, date_str):
+        """Return the export path for date_str, or None if there is no data."""
+        entry = self.find_entry(date_str)
+        return entry[0] if entry else None
+
+    def find_entry(self, date_str):
+        """Return (file_path, file_format) for date_str, or None."""
+        self.refresh()
+        entry = self._files_by_date.get(date_str)
+        return entry[1:] if entry else None
+
+    def dates_in_month(self, year, month):
+        """Return the dates of the month that have an export, in order."""
+        self.refresh()
+        files_by_date = self._files_by_date
+        num_days = calendar.monthrange(year, month)[1]
+        dates = (f"{year}-{month:02d}-{day:02d}" for day in range(1, num_days + 1))
+        return [date_str for date_str in dates if date_str in files_by_date]
+
+    def dates_in_year(self, year):
+        """Return the dates of the year that have an export, in order."""
+        dates = []
+        for month in range(1, 13):
+            dates.extend(self.dates_in_month(year, month))
+        return dates
+
+    def dates_between(self, start_date, end_date):
+        """Return dates with data between start_date and end_date (inclusive, YYYY-MM-DD)."""
+        self.refresh()
+        dates = self._sorted_dates
+        return dates[bisect.bisect_left(dates, start_date):bisect.bisect_right(dates, end_date)]
+
+    def all_dates(self):
+        """Return every date that has an export, in order."""
+        self.refresh()
+        return list(self._sorted_dates)
+
+    def list_files(self):
+        """Return the names of all export files in the directory."""
+        self.refresh()
+        return list(self._export_files)
+
+
+_default_index = None
+_default_index_lock = threading.Lock()
+
+
+def get_data_index():
+    """Return the process-wide DATA_DIR index."""
+    global _default_index
+    with _default_index_lock:
+        if _default_index is None:
+            _default_index = DataDirIndex()
+        return _default_index
@@ -0,0 +1,68 @@
+import logging
+import threading
+from collections import OrderedDict
+
+from config import DAY_STORE_SIZE
+from data.data_index import get_data_index
+from monitoring.timing import timed
+
+logger = logging.getLogger(__name__)
+
+
+class DayTradesStore:
+    """Server-side store of parsed trades for recently viewed dates.
+
+    The daily view is built by several callbacks (summary, charts, trade-card
+    pages); they all fetch the day's DataFrame here so it is loaded once per
+    export version rather than once per callback. Entries are keyed by the
+    trade cache key of the export, so an overwritten file is reloaded.
+    """
+
+    def __init__(self, trade_processor, data_index=None, max_days=DAY_STORE_SIZE):
+        self.trade_processor = trade_processor
+        self.data_index = data_index or get_data_index()
+        self.max_days = max_days
+        self._days = OrderedDict()  # {date_str: (data_key, trades_df)}
+        self._loading = {}  # {date_str: lock held while that day is being loaded}
+        self._lock = threading.Lock()
+
+    @timed('day_store.get')
+    def get(self, date_str):
+        """Return (data_key, trades_df) for date_str, or None if there is no export.
+
+        data_key identifies the export version and is suitable for cache keys.
+        Parse errors propagate to the caller.
+        """
+        file_path = self.data_index.find(date_str)
+        if file_path is None:
+            return None
+        data_key = self.trade_processor.trade_cache.cache_key(file_path)
+
+        with self._lock:
+            entry = self._days.get(date_str)
+            if entry is not None and entry[0] == data_key:
+                self._days.move_to_end(date_str)
+                return entry
+            load_lock = self._loading.setdefault(date_str, threading.Lock())
+
+        # Concurrent callbacks for the same day wait for one load instead of parsing it again
+        with load_lock:
+            with self._lock:
+                entry = self._days.get(date_str)
+                if entry is not None and entry[0] == data_key:
+                    return entry
+            try:
+                trades_df = self.trade_processor.load_trades_file(file_path)
+            except Exception:
+                with self._lock:
+                    self._loading.pop(date_str, None)
+                raise
+            logger.debug('Loaded %s trades for %s into the day store', len(trades_df), date_str)
+            entry = (data_key, trades_df)
+            with self._lock:
+                self._loading.pop(date_str, None)
+                self._days[date_str] = entry
+                self._days.move_to_end(date_str)
+                while len(self._days) > self.max_days:
+                    self._days.popitem(last=False)
+            return entry
@@ -0,0 +1,99 @@
+import logging
+import os
+import threading
+import time
+
+from config import INGEST_POLL_SECONDS, INGEST_DEBOUNCE_SECONDS, INGEST_BATCH_SIZE
+from data.daily_rollup import get_daily_rollups
+
+logger = logging.getLogger(__name__)
+
+
+class IngestService:
+    """Background thread that pre-parses new or changed exports in DATA_DIR.
+
+    The directory is polled every poll_interval seconds. A file is ingested once
+    it has not been modified for debounce seconds, so exports that are still
+    being written are left alone. Ingesting a day refreshes its daily rollup,
+    which also fills the parsed-trades cache the daily dashboard reads from.
+    Parse failures are kept on the rollup row and exposed through failure_for().
+    """
+
+    def __init__(self, rollups=None, poll_interval=INGEST_POLL_SECONDS, debounce=INGEST_DEBOUNCE_SECONDS,
+                 batch_size=INGEST_BATCH_SIZE):
+        self.rollups = rollups or get_daily_rollups()
+        self.data_index = self.rollups.data_index
+        self.poll_interval = poll_interval
+        self.debounce = debounce
+        self.batch_size = max(1, batch_size)
+        self._ingested = {}  # {date_str: (file_path, mtime_ns, size)}
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        """Start the watcher thread (no-op if already running)."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name='pdb-ingest', daemon=True)
+        self._thread.start()
+        logger.info('Watching %s for new exports', self.data_index.data_dir)
+
+    def stop(self, timeout=None):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                self.poll_once()
+            except Exception:
+                logger.exception('Ingestion pass failed')
+            self._stop.wait(self.poll_interval)
+
+    def poll_once(self):
+        """Ingest every settled export that changed since it was last seen. Returns the dates ingested."""
+        now = time.time()
+        ready = {}
+        for date_str in self.data_index.all_dates():
+            file_path = self.data_index.find(date_str)
+            try:
+                stat = os.stat(file_path)
+            except (FileNotFoundError, TypeError):
+                continue
+            signature = (file_path, stat.st_mtime_ns, stat.st_size)
+            if self._ingested.get(date_str) == signature:
+                continue
+            if now - stat.st_mtime < self.debounce:
+                logger.debug('Waiting for %s to settle', os.path.basename(file_path))
+                continue
+            ready[date_str] = signature
+
+        if not ready:
+            return []
+
+        # A first pass backfills every export: save it a batch at a time and stop early on shutdown
+        dates = list(ready)
+        ingested = []
+        updated = []
+        for start in range(0, len(dates), self.batch_size):
+            if self._stop.is_set():
+                break
+            batch = dates[start:start + self.batch_size]
+            updated.extend(self.rollups.refresh(batch))
+            self._ingested.update((date_str, ready[date_str]) for date_str in batch)
+            ingested.extend(batch)
+        if updated:
+            failed = [date_str for date_str in updated if self.rollups.error_for(date_str)]
+            logger.info('Ingested %s export(s), %s failed to parse', len(updated), len(failed))
+        return ingested
+
+    def failure_for(self, date_str):
+        """Parse error recorded for date_str's current export, or None."""
+        return self.rollups.error_for(date_str)
+
+    def failures(self):
+        """{date_str: error message} for every export that failed to parse."""
+        return self.rollups.errors()
@@ -0,0 +1,263 @@
+import argparse
+import json
+import logging
+import os
+import threading
+
+from config import QUALITY_INDEX_FILE
+from data.data_index import get_data_index
+from notes.trade_note_manager import TradeNoteManager
+from storage.file_lock import file_lock, write_json_atomic
+
+logger = logging.getLogger(__name__)
+
+# Trade colors that count as a quality rating, best first
+QUALITIES = ('fantastic', 'good', 'attention', 'uncertain', 'bad')
+
+
+def _sort_key(trade_id):
+    # "<date>_<contract>_<entry>_<exit>": by date, then entry time
+    parts = trade_id.rsplit('_', 2)
+    return trade_id[:10], parts[1] if len(parts) == 3 else ''
+
+
+def rated_trade_records(trades_df, date_str, ratings):
+    """{trade_id: record} for the trades of one day rated in ratings ({trade_id: quality})."""
+    if trades_df.empty or 'pnl' not in trades_df.columns:
+        return {}
+    trade_ids = TradeNoteManager.trade_ids(trades_df, date_str)
+    mask = trade_ids.isin(list(ratings)) & trades_df['pnl'].notna()
+    rated = trades_df[mask]
+    entry_times = rated['entry_time'].dt.strftime('%I:%M:%S %p')
+    exit_times = rated['exit_time'].dt.strftime('%I:%M:%S %p')
+    return {
+        trade_id: {
+            'quality': ratings[trade_id],
+            'date': date_str,
+            'pnl': float(trade['pnl']),
+            'contract': str(trade.get('contract', 'N/A')),
+            'quantity': int(trade.get('quantity', 0)),
+            'entry_time': entry_time,
+            'exit_time': exit_time,
+            'direction': str(trade.get('direction', 'N/A'))
+        }
+        for trade_id, trade, entry_time, exit_time in zip(
+            trade_ids[mask], rated.to_dict('records'), entry_times, exit_times)
+    }
+
+
+class QualityIndex:
+    """Persistent index of rated trades, partitioned by month: {"YYYY-MM": {trade_id: record}}.
+
+    A record holds the quality plus the trade's P&L, contract, quantity,
+    times and direction captured when it was rated, so the monthly quality
+    analysis renders without parsing exports. TradeNoteManager updates it on
+    every color save; reads compare a month with the saved colors and repair
+    it from source if they disagree. Rated trades that are not in their
+    export are kept as 'missing' records, looked up again only once that
+    day's export is added or changes.
+    """
+
+    def __init__(self, trade_processor, data_index=None, index_file=QUALITY_INDEX_FILE, trade_note_manager=None):
+        self.trade_processor = trade_processor
+        self.data_index = data_index or get_data_index()
+        self.index_file = index_file
+        self.trade_note_manager = trade_note_manager or TradeNoteManager()
+        self._lock = threading.RLock()
+        self._months = {}
+        self._signature = None
+
+    def _file_signature(self):
+        try:
+            stat = os.stat(self.index_file)
+        except FileNotFoundError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def _refresh(self, force=False):
+        """Reload the index if another process rewrote it (always, when force is set)."""
+        signature = self._file_signature()
+        if signature == self._signature and not force:
+            return
+        self._months = {}
+        if signature is not None:
+            try:
+                with open(self.index_file, 'r') as f:
+                    self._months = json.load(f)
+            except ValueError as e:
+                logger.warning('Discarding unreadable quality index %s: %s', self.index_file, e)
+        self._signature = signature
+
+    def _save(self):
+        self._months = {key: trades for key, trades in self._months.items() if trades}
+        write_json_atomic(self.index_file, self._months, sort_keys=True)
+        self._signature = self._file_signature()
+
+    @staticmethod
+    def _source_signature(file_path):
+        """[file name, mtime, size] of a day's export, or None when there is no export."""
+        if file_path is None:
+            return None
+        try:
+            stat = os.stat(file_path)
+        except FileNotFoundError:
+            return None
+        return [os.path.basename(file_path), stat.st_mtime_ns, stat.st_size]
+
+    def _is_stale(self, record):
+        """True for a 'missing' record whose day's export appeared or changed since it was looked up."""
+        if not record.get('missing'):
+            return False
+        return record.get('source') != self._source_signature(self.data_index.find(record['date']))
+
+    def _records_for(self, ratings, use_cache=True):
+        """{trade_id: record} for {trade_id: quality}, read from each day's trades."""
+        by_date = {}
+        for trade_id, quality in ratings.items():
+            by_date.setdefault(trade_id[:10], {})[trade_id] = quality
+
+        records = {}
+        for date_str, day_ratings in by_date.items():
+            found = {}
+            file_path = self.data_index.find(date_str)
+            # Taken before parsing, so an export rewritten meanwhile is looked up again
+            source = self._source_signature(file_path)
+            if file_path is not None:
+                try:
+                    trades_df = self.trade_processor.load_trades_file(file_path, use_cache=use_cache)
+                    found = rated_trade_records(trades_df, date_str, day_ratings)
+                except Exception as e:
+                    logger.warning('Error indexing rated trades for %s: %s', date_str, e)
+            for trade_id, quality in day_ratings.items():
+                records[trade_id] = found.get(
+                    trade_id, {'quality': quality, 'date': date_str, 'missing': True, 'source': source})
+        return records
+
+    def _apply(self, ratings, use_cache=True):
+        """Bring the index in line with {trade_id: color} (caller holds the locks)."""
+        to_load = {}
+        for trade_id, color in ratings.items():
+            trades = self._months.setdefault(trade_id[:7], {})
+            if color not in QUALITIES:
+                trades.pop(trade_id, None)
+            elif trade_id in trades and not self._is_stale(trades[trade_id]):
+                # Keep the trade as captured when it was first rated
+                trades[trade_id]['quality'] = color
+            else:
+                to_load[trade_id] = color
+        for trade_id, record in self._records_for(to_load, use_cache).items():
+            self._months[trade_id[:7]][trade_id] = record
+
+    def record_ratings(self, colors):
+        """Update the index for just-saved {trade_id: color}; 'none' removes a trade."""
+        if not colors:
+            return
+        with self._lock, file_lock(self.index_file):
+            self._refresh(force=True)
+            self._apply(colors)
+            self._save()
+
+    def month(self, year, month):
+        """{trade_id: record} for the month's rated trades, by date and entry time."""
+        key = f"{year:04d}-{month:02d}"
+        ratings = {
+            trade_id: color
+            for trade_id, color in self.trade_note_manager.load_trade_colors_for_month(year, month).items()
+            if color in QUALITIES
+        }
+        with self._lock:
+            self._refresh()
+            trades = self._months.get(key, {})
+            if ({trade_id: record['quality'] for trade_id, record in trades.items()} != ratings
+                    or any(self._is_stale(record) for record in trades.values())):
+                with file_lock(self.index_file):
+                    self._refresh(force=True)
+                    stale = {trade_id: 'none' for trade_id in self._months.get(key, {}) if trade_id not in ratings}
+                    self._apply(dict(ratings, **stale))
+                    self._save()
+                logger.info('Repaired quality index for %s from the saved colors', key)
+            trades = self._months.get(key, {})
+            return {
+                trade_id: dict(trades[trade_id])
+                for trade_id in sorted(trades, key=_sort_key)
+                if not trades[trade_id].get('missing')
+            }
+
+    def rebuild(self):
+        """Recompute the whole index from the saved colors and the exports, bypassing the trade cache."""
+        ratings = {
+            trade_id: color for trade_id, color in self.trade_note_manager.load_trade_colors().items()
+            if color in QUALITIES
+        }
+        with self._lock, file_lock(self.index_file):
+            self._months = {}
+            self._apply(ratings, use_cache=False)
+            self._save()
+            return len(ratings)
+
+    def verify(self):
+        """Compare the index with the saved colors and a fresh parse of the exports.
+
+        Returns a list of (trade_id, problem) tuples; empty when everything matches.
+        """
+        ratings = {
+            trade_id: color for trade_id, color in self.trade_note_manager.load_trade_colors().items()
+            if color in QUALITIES
+        }
+        fresh = self._records_for(ratings, use_cache=False)
+        with self._lock:
+            self._refresh(force=True)
+            stored = {trade_id: record for trades in self._months.values() for trade_id, record in trades.items()}
+        problems = [(trade_id, 'not rated') for trade_id in sorted(set(stored) - set(fresh))]
+        for trade_id, record in sorted(fresh.items()):
+            if trade_id not in stored:
+                problems.append((trade_id, 'missing from the index'))
+            elif stored[trade_id] != record:
+                problems.append((trade_id, 'differs from the saved color or export'))
+        return problems
+
+
+_default_index = None
+_default_index_lock = threading.Lock()
+
+
+def get_quality_index():
+    """Return the process-wide quality index (sharing the rollup store's trade processor)."""
+    global _default_index
+    with _default_index_lock:
+        if _default_index is None:
+            from data.daily_rollup import get_daily_rollups
+            rollups = get_daily_rollups()
+            _default_index = QualityIndex(rollups.trade_processor, rollups.data_index)
+        return _default_index
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Maintain the index of rated trades')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    subparsers.add_parser('rebuild', help='recompute the index from the saved colors and the exports')
+    subparsers.add_parser('verify', help='compare the index with the saved colors and a fresh parse')
+    show_parser = subparsers.add_parser('show', help='print the rated trades for a month')
+    show_parser.add_argument('year', type=int)
+    show_parser.add_argument('month', type=int)
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    index = get_quality_index()
+    if args.command == 'rebuild':
+        logger.info('Indexed %s rated trades', index.rebuild())
+    elif args.command == 'verify':
+        problems = index.verify()
+        for trade_id, problem in problems:
+            logger.error('%s: %s', trade_id, problem)
+        logger.info('%s problem(s) found', len(problems))
+        return 1 if problems else 0
+    else:
+        for trade_id, record in index.month(args.year, args.month).items():
+            logger.info('%-10s %s  pnl=%.2f  %s %s', record['quality'], trade_id, record['pnl'],
+                        record['direction'], record['quantity'])
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,189 @@
+import argparse
+import logging
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+
+from data.daily_rollup import get_daily_rollups
+from data.data_index import get_data_index
+from data.trade_analytics import compute_trade_metrics
+
+logger = logging.getLogger(__name__)
+
+WEEKDAY_NAMES = ['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun']
+
+
+class RangeAnalytics:
+    """Performance aggregates over an arbitrary date range (year-to-date, custom).
+
+    All trades in the range are loaded as one columnar frame (per-day frames
+    come from the on-disk trade cache; uncached exports go through
+    parse_files_parallel) and every view is a vectorized groupby over it.
+    Exports the rollup store already knows to be unreadable are skipped. The
+    last combined frame is kept in memory and reused while none of its
+    exports change.
+    """
+
+    def __init__(self, trade_processor, data_index=None, rollups=None):
+        self.trade_processor = trade_processor
+        self.data_index = data_index or get_data_index()
+        self.rollups = rollups or get_daily_rollups()
+        self._lock = threading.Lock()
+        self._frame_key = None
+        self._frame = None
+        self._errors = {}
+
+    def load_trades(self, start_date, end_date, progress=None):
+        """All trades for start_date..end_date (inclusive) as one DataFrame.
+
+        Adds 'date' (export date string) and 'root' (contract root) columns.
+        Returns (trades_df, errors) where errors is {date_str: message} for
+        exports that could not be parsed. progress, if given, is called as
+        progress(days done, days in range) while exports are loaded.
+        """
+        dates = self.data_index.dates_between(start_date, end_date)
+        trade_cache = self.trade_processor.trade_cache
+        frame_key = tuple(trade_cache.cache_key(self.data_index.find(date_str)) for date_str in dates)
+
+        with self._lock:
+            if frame_key == self._frame_key:
+                return self._frame, dict(self._errors)
+
+        files = {}
+        known_errors = {}
+        for date_str in dates:
+            error = self.rollups.error_for(date_str)
+            if error is None:
+                files[self.data_index.find(date_str)] = date_str
+            else:
+                known_errors[date_str] = error
+
+        def report(done, total, file_path, error):
+            progress(len(known_errors) + done, len(dates))
+
+        trades, errors = self.trade_processor.parse_files_parallel(list(files), progress=report if progress else None)
+        days = [(files[file_path], trades_df) for file_path, trades_df in trades.items() if not trades_df.empty]
+        if days:
+            trades_df = pd.concat([day_df for _, day_df in days], ignore_index=True)
+            trades_df['date'] = np.repeat([date_str for date_str, _ in days], [len(day_df) for _, day_df in days])
+            registry = self.trade_processor.contract_manager.get_registry()
+            trades_df['root'] = registry.resolve_roots(trades_df['contract'])
+        else:
+            trades_df = pd.DataFrame(columns=['contract', 'entry_time', 'exit_time', 'pnl', 'date', 'root'])
+        if errors:
+            # Record the failures so the next load skips these exports
+            self.rollups.refresh([files[file_path] for file_path in errors])
+        errors = dict(known_errors, **{files[file_path]: error for file_path, error in errors.items()})
+
+        with self._lock:
+            self._frame_key, self._frame, self._errors = frame_key, trades_df, errors
+        return trades_df, dict(errors)
+
+    def compute(self, start_date, end_date, progress=None):
+        """Aggregates for the range (progress is passed to load_trades).
+
+        Returns a dict with:
+            totals: total_pnl, trade_count, trading_days, wins, losses, win_rate
+            equity: per-day DataFrame (pnl, trades, cumulative) indexed by date
+            contracts: per-root DataFrame (pnl, trades, wins, losses, win_rate)
+            weekday / hour: DataFrames (pnl, trades) by entry weekday / hour
+            heatmap_pnl / heatmap_trades: weekday x hour DataFrames
+            metrics: compute_trade_metrics() over the range (drawdown, profit
+                factor, expectancy, streaks, rolling metrics)
+            errors: {date_str: message} for exports that failed to parse
+        """
+        trades_df, errors = self.load_trades(start_date, end_date, progress)
+        report = {'start_date': start_date, 'end_date': end_date, 'errors': errors}
+        if trades_df.empty:
+            report.update(totals=None, equity=None, contracts=None, weekday=None, hour=None,
+                          heatmap_pnl=None, heatmap_trades=None, metrics=None)
+            return report
+
+        pnl = trades_df['pnl']
+        is_win = (pnl > 0).rename('wins')
+        is_loss = (pnl < 0).rename('losses')
+        wins, losses = int(is_win.sum()), int(is_loss.sum())
+
+        equity = pnl.groupby(trades_df['date']).agg(pnl='sum', trades='size')
+        equity['cumulative'] = equity['pnl'].cumsum()
+
+        contracts = pd.concat([
+            pnl.groupby(trades_df['root']).agg(pnl='sum', trades='size'),
+            is_win.groupby(trades_df['root']).sum(),
+            is_loss.groupby(trades_df['root']).sum()
+        ], axis=1)
+        contracts['win_rate'] = contracts['wins'] / contracts['trades'] * 100
+        contracts = contracts.sort_values('pnl', ascending=False)
+
+        weekday = trades_df['entry_time'].dt.dayofweek.rename('weekday')
+        hour = trades_df['entry_time'].dt.hour.rename('hour')
+        by_weekday = pnl.groupby(weekday).agg(pnl='sum', trades='size')
+        by_weekday.index = [WEEKDAY_NAMES[day] for day in by_weekday.index]
+        by_hour = pnl.groupby(hour).agg(pnl='sum', trades='size')
+
+        cells = pnl.groupby([weekday, hour]).agg(['sum', 'size'])
+        heatmap_pnl = cells['sum'].unstack(fill_value=0)
+        heatmap_trades = cells['size'].unstack(fill_value=0)
+        heatmap_pnl.index = heatmap_trades.index = [WEEKDAY_NAMES[day] for day in heatmap_pnl.index]
+
+        report.update(
+            totals={
+                'total_pnl': float(pnl.sum()),
+                'trade_count': len(trades_df),
+                'trading_days': len(equity),
+                'wins': wins,
+                'losses': losses,
+                'win_rate': wins / len(trades_df) * 100
+            },
+            equity=equity,
+            contracts=contracts,
+            weekday=by_weekday,
+            hour=by_hour,
+            heatmap_pnl=heatmap_pnl,
+            heatmap_trades=heatmap_trades,
+            metrics=compute_trade_metrics(trades_df)
+        )
+        return report
+
+
+_default_analytics = None
+_default_analytics_lock = threading.Lock()
+
+
+def get_range_analytics():
+    """Return the process-wide range analytics instance."""
+    global _default_analytics
+    with _default_analytics_lock:
+        if _default_analytics is None:
+            from contracts.contract_manager import ContractManager
+            from data.trade_processor import TradeProcessor
+            _default_analytics = RangeAnalytics(TradeProcessor(ContractManager()))
+        return _default_analytics
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Print performance aggregates for a date range')
+    parser.add_argument('start_date', help='YYYY-MM-DD')
+    parser.add_argument('end_date', help='YYYY-MM-DD')
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+
+    analytics = get_range_analytics()
+    started = time.perf_counter()
+    report = analytics.compute(args.start_date, args.end_date)
+    elapsed = time.perf_counter() - started
+    if report['totals'] is None:
+        logger.info('No trades between %s and %s', args.start_date, args.end_date)
+        return 0
+    logger.info('%s', report['totals'])
+    logger.info('By contract:\n%s', report['contracts'])
+    logger.info('By weekday:\n%s', report['weekday'])
+    logger.info('Computed in %.3fs', elapsed)
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,187 @@
+import numpy as np
+import pandas as pd
+
+DEFAULT_ROLLING_WINDOW = 20
+
+
+def _ordered_pnl(trades_df):
+    """P&L values in exit-time order (the order the equity curve is realised in)."""
+    if 'exit_time' in trades_df.columns and not trades_df['exit_time'].is_monotonic_increasing:
+        order = np.argsort(trades_df['exit_time'].to_numpy(), kind='stable')
+        return trades_df['pnl'].to_numpy(dtype=float)[order], order
+    return trades_df['pnl'].to_numpy(dtype=float), None
+
+
+def _runs(mask):
+    """(start, length) arrays for every run of True values in a boolean array."""
+    padded = np.r_[False, mask, False].astype(np.int8)
+    edges = np.diff(padded)
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1)
+    return starts, ends - starts
+
+
+def drawdown(pnl, times=None):
+    """
+    Drawdown of the cumulative P&L curve.
+
+    Args:
+        pnl: P&L per trade in realisation order
+        times: Optional exit timestamps (same order) for the drawdown duration
+
+    Returns:
+        dict with max_drawdown (<= 0), the trade indexes where the worst
+        drawdown peaked and bottomed (-1 for the starting balance / no
+        drawdown), the longest underwater stretch in trades and, when times
+        are given, as a Timedelta; plus the drawdown array
+    """
+    equity = np.cumsum(pnl)
+    # The account starts flat, so a losing first trade is already a drawdown
+    peaks = np.maximum.accumulate(np.r_[0.0, equity])[1:]
+    underwater = equity - peaks
+
+    trough = int(np.argmin(underwater)) if len(underwater) else 0
+    max_drawdown = float(underwater[trough]) if len(underwater) else 0.0
+    at_peak = np.flatnonzero(equity[:trough + 1] == peaks[trough])
+    peak = int(at_peak[0]) if len(at_peak) and max_drawdown < 0 else -1
+
+    starts, lengths = _runs(underwater < 0)
+    result = {
+        'max_drawdown': max_drawdown,
+        'max_drawdown_peak': peak,
+        'max_drawdown_trough': trough if max_drawdown < 0 else -1,
+        'max_drawdown_trades': int(lengths.max()) if len(lengths) else 0,
+        'max_drawdown_duration': None,
+        'drawdown': underwater
+    }
+    if times is not None and len(lengths):
+        times = np.asarray(times)
+        # Underwater from the peak before the run until the trade that recovered (or the last trade)
+        run_ends = np.minimum(starts + lengths, len(times) - 1)
+        run_starts = np.maximum(starts - 1, 0)
+        durations = times[run_ends] - times[run_starts]
+        result['max_drawdown_duration'] = pd.Timedelta(durations.max())
+    return result
+
+
+def streaks(pnl):
+    """Longest consecutive winning and losing trade runs (scratch trades break a streak)."""
+    wins = _runs(pnl > 0)[1]
+    losses = _runs(pnl < 0)[1]
+    return {
+        'longest_win_streak': int(wins.max()) if len(wins) else 0,
+        'longest_loss_streak': int(losses.max()) if len(losses) else 0
+    }
+
+
+def rolling_metrics(pnl, window=DEFAULT_ROLLING_WINDOW):
+    """
+    Rolling win rate, expectancy and profit factor over the last `window` trades.
+
+    Uses differences of cumulative sums, so the cost is O(n) for any window.
+    The first window - 1 entries cover fewer trades.
+    """
+    n = len(pnl)
+    counts = np.minimum(np.arange(1, n + 1), window)
+
+    def rolling_sum(values):
+        totals = np.cumsum(values, dtype=float)
+        totals[window:] = totals[window:] - totals[:-window]
+        return totals
+
+    wins = rolling_sum(pnl > 0)
+    gross_profit = rolling_sum(np.where(pnl > 0, pnl, 0.0))
+    gross_loss = -rolling_sum(np.where(pnl < 0, pnl, 0.0))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        profit_factor = np.where(gross_loss > 0, gross_profit / gross_loss, np.inf)
+    return pd.DataFrame({
+        'win_rate': wins / counts * 100,
+        'expectancy': (gross_profit - gross_loss) / counts,
+        'profit_factor': profit_factor
+    })
+
+
+def compute_trade_metrics(trades_df, rolling_window=DEFAULT_ROLLING_WINDOW, risk_per_trade=None,
+                          tick_sizes=None):
+    """
+    Performance statistics for a trades DataFrame (one row per completed trade).
+
+    Every statistic is a single vectorized pass over the P&L array, so this
+    is suitable for the full trade history as well as a single day.
+
+    Args:
+        trades_df: Trades with at least a 'pnl' column
+        rolling_window: Trades per window for the rolling metrics
+        risk_per_trade: Dollar risk that defines 1R. Exports carry no stop
+            prices, so by default 1R is the average losing trade
+        tick_sizes: Optional per-row tick sizes (aligned with trades_df) to
+            express price excursions in ticks
+
+    Returns:
+        dict of scalar metrics plus 'per_trade' (DataFrame aligned with
+        trades_df) and 'rolling' (DataFrame in exit-time order), or None
+        when there are no trades
+    """
+    if trades_df.empty or 'pnl' not in trades_df.columns:
+        return None
+
+    pnl, order = _ordered_pnl(trades_df)
+    times = trades_df['exit_time'].to_numpy() if 'exit_time' in trades_df.columns else None
+    if times is not None and order is not None:
+        times = times[order]
+
+    is_win = pnl > 0
+    is_loss = pnl < 0
+    win_count = int(is_win.sum())
+    loss_count = int(is_loss.sum())
+    gross_profit = float(pnl[is_win].sum())
+    gross_loss = float(-pnl[is_loss].sum())
+    avg_win = gross_profit / win_count if win_count else 0.0
+    avg_loss = gross_loss / loss_count if loss_count else 0.0
+
+    metrics = {
+        'total_pnl': float(pnl.sum()),
+        'trade_count': len(pnl),
+        'wins': win_count,
+        'losses': loss_count,
+        'win_rate': win_count / len(pnl) * 100,
+        'gross_profit': gross_profit,
+        'gross_loss': gross_loss,
+        'profit_factor': gross_profit / gross_loss if gross_loss else float('inf'),
+        'expectancy': float(pnl.mean()),
+        'avg_win': avg_win,
+        'avg_loss': avg_loss,
+        'payoff_ratio': avg_win / avg_loss if avg_loss else float('inf'),
+        'largest_win': float(pnl.max()),
+        'largest_loss': float(pnl.min())
+    }
+    dd = drawdown(pnl, times)
+    metrics.update({key: value for key, value in dd.items() if key != 'drawdown'})
+    metrics.update(streaks(pnl))
+
+    # Per-trade stats, aligned with trades_df
+    risk = risk_per_trade if risk_per_trade else avg_loss
+    per_trade = pd.DataFrame(index=trades_df.index)
+    per_trade['r_multiple'] = trades_df['pnl'].to_numpy(dtype=float) / risk if risk else np.nan
+    if {'entry_price', 'exit_price', 'direction'}.issubset(trades_df.columns):
+        # Only average entry/exit prices are exported, so this is the realised
+        # excursion of each trade in its favour (negative = against it)
+        sign = np.where(trades_df['direction'].to_numpy() == 'Short', -1.0, 1.0)
+        points = (trades_df['exit_price'].to_numpy(dtype=float) - trades_df['entry_price'].to_numpy(dtype=float)) * sign
+        per_trade['points'] = points
+        if tick_sizes is not None:
+            tick_sizes = np.asarray(tick_sizes, dtype=float)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                per_trade['ticks'] = np.where(tick_sizes > 0, points / tick_sizes, np.nan)
+        favourable = points[points > 0]
+        adverse = points[points < 0]
+        metrics['avg_favourable_points'] = float(favourable.mean()) if len(favourable) else 0.0
+        metrics['avg_adverse_points'] = float(adverse.mean()) if len(adverse) else 0.0
+    metrics['risk_per_trade'] = risk
+    metrics['avg_r_multiple'] = float(per_trade['r_multiple'].mean()) if risk else None
+
+    metrics['per_trade'] = per_trade
+    metrics['rolling'] = rolling_metrics(pnl, rolling_window)
+    metrics['equity'] = np.cumsum(pnl)
+    metrics['drawdown'] = dd['drawdown']
+    return metrics
@@ -0,0 +1,102 @@
+import hashlib
+import logging
+import os
+import tempfile
+import pandas as pd
+
+from config import CACHE_DIR
+from contracts.contract_manager import ContractManager
+
+logger = logging.getLogger(__name__)
+
+# Bump whenever TradeProcessor output changes so stale entries are ignored
+PARSER_VERSION = 1
+
+# Exports whose P&L is computed from the contract tick specs rather than read from the file
+SPECS_PRICED_EXTENSIONS = ('.xls', '.xlsx')
+
+try:
+    import pyarrow  # noqa: F401
+    CACHE_FORMAT = 'parquet'
+except ImportError:
+    # Fall back to pickle when pyarrow is not installed
+    CACHE_FORMAT = 'pkl'
+
+
+class TradeCache:
+    """On-disk cache of parsed trades DataFrames, one columnar file per source export.
+
+    Entries are keyed by the source file's absolute path, mtime, size and
+    PARSER_VERSION, so an overwritten export or a parser change simply misses.
+    Excel exports are priced from the tick specs, so their key also carries
+    the specs signature and a saved contract re-prices them.
+    """
+
+    def __init__(self, cache_dir=CACHE_DIR, contract_manager=None):
+        self.cache_dir = cache_dir
+        self.contract_manager = contract_manager or ContractManager()
+
+    def _path_prefix(self, file_path):
+        return hashlib.sha1(os.path.abspath(file_path).encode('utf-8')).hexdigest()[:16]
+
+    def cache_key(self, file_path):
+        """Return the cache key for the current state of file_path."""
+        stat = os.stat(file_path)
+        raw = f"{os.path.abspath(file_path)}|{stat.st_mtime_ns}|{stat.st_size}|{PARSER_VERSION}"
+        if file_path.lower().endswith(SPECS_PRICED_EXTENSIONS):
+            raw += f"|{self.contract_manager.specs_signature()}"
+        return hashlib.sha1(raw.encode('utf-8')).hexdigest()[:16]
+
+    def _entry_path(self, file_path, key):
+        return os.path.join(self.cache_dir, f"{self._path_prefix(file_path)}_{key}.{CACHE_FORMAT}")
+
+    def get(self, file_path):
+        """Return the cached trades DataFrame for file_path, or None on a miss."""
+        try:
+            entry_path = self._entry_path(file_path, self.cache_key(file_path))
+            if not os.path.exists(entry_path):
+                return None
+            if CACHE_FORMAT == 'parquet':
+                return pd.read_parquet(entry_path)
+            return pd.read_pickle(entry_path)
+        except Exception as e:
+            logger.warning('Could not read trade cache for %s: %s', file_path, e)
+            return None
+
+    def put(self, file_path, trades_df):
+        """Store trades_df for file_path and drop entries for older versions of the file."""
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            entry_path = self._entry_path(file_path, self.cache_key(file_path))
+            # Unique per writer, and outside the entry prefix _remove_stale deletes
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, prefix='.tmp_', suffix=f'.{CACHE_FORMAT}')
+            os.close(fd)
+            try:
+                if CACHE_FORMAT == 'parquet':
+                    trades_df.to_parquet(tmp_path, index=False)
+                else:
+                    trades_df.to_pickle(tmp_path)
+                os.replace(tmp_path, entry_path)
+            finally:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+            self._remove_stale(file_path, entry_path)
+        except Exception as e:
+            logger.warning('Could not write trade cache for %s: %s', file_path, e)
+
+    def _remove_stale(self, file_path, keep_path):
+        prefix = self._path_prefix(file_path) + '_'
+        for entry in os.scandir(self.cache_dir):
+            if entry.name.startswith(prefix) and entry.path != keep_path:
+                try:
+                    os.remove(entry.path)
+                except OSError:
+                    pass
+
+    def clear(self):
+        """Remove every cached entry."""
+        if not os.path.isdir(self.cache_dir):
+            return
+        for entry in os.scandir(self.cache_dir):
+            if entry.is_file():
+                os.remove(entry.path)
@@ -1,8 +1,20 @@
+import csv
+import io
+import itertools
+import logging
+import multiprocessing
+import os
 import pandas as pd
 import numpy as np
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime
 import re
 
+from config import RITHMIC_CSV_PARSER, RITHMIC_CSV_PARSERS, BULK_INGEST_WORKERS
+from data.trade_cache import TradeCache
+from monitoring.timing import timed
+
 # For Python 3.8 and below, use typing imports
 # For Python 3.9+, you can use built-in list, dict instead
 try:
@@ -15,10 +27,186 @@ except ImportError:
     Optional = None
 
 
+logger = logging.getLogger(__name__)
+
+EXCEL_COLUMNS = ["date", "time", "exchange", "contract", "B/S", "Size", "Price", "F", "Direct"]
+
+# Rithmic trade line columns, in file order
+RITHMIC_TRADE_COLUMNS = [
+    'trade_date', 'entry_order_number', 'entry_buy_sell', 'entry_time', 'entry_price',
+    'exit_order_number', 'exit_buy_sell', 'exit_time', 'exit_price', 'trade_life_span',
+    'fill_size', 'trade_pnl', 'commission_fees', 'net_pnl'
+]
+RITHMIC_TRADE_COLUMN_COUNT = len(RITHMIC_TRADE_COLUMNS)
+RITHMIC_FLOAT_COLUMNS = ['entry_price', 'exit_price', 'trade_life_span', 'trade_pnl', 'commission_fees', 'net_pnl']
+
+_CONTRACT_PATTERN = re.compile(r'[A-Z]{2,3}[A-Z]\d+')
+
+# Files handed to a parse pool per worker at a time: enough to keep workers busy,
+# few enough that a dead worker only sends a handful back for one-at-a-time retries
+IN_FLIGHT_PER_WORKER = 2
+
+# Parse workers are never forked from the threaded server: a lock another thread holds at
+# fork time (a store's RLock, a logging handler) would stay locked in the child forever
+if 'forkserver' in multiprocessing.get_all_start_methods():
+    _POOL_CONTEXT = multiprocessing.get_context('forkserver')
+    _POOL_CONTEXT.set_forkserver_preload(['data.trade_processor'])
+else:
+    _POOL_CONTEXT = multiprocessing.get_context('spawn')
+
+
 class TradeProcessor:
-    def __init__(self, contract_manager):
+    def __init__(self, contract_manager, trade_cache=None, csv_parser=None):
         self.contract_manager = contract_manager
+        self.trade_cache = trade_cache if trade_cache is not None else TradeCache(contract_manager=contract_manager)
+        # 'fast' (columnar) or 'legacy' (line-by-line) Rithmic CSV parser
+        self.csv_parser = csv_parser or RITHMIC_CSV_PARSER
+        if self.csv_parser not in RITHMIC_CSV_PARSERS:
+            raise ValueError(f"csv_parser must be one of {RITHMIC_CSV_PARSERS}, got {self.csv_parser!r}")
+
+    @timed('trade_processor.load_trades_file')
+    def load_trades_file(self, file_path, use_cache=True) -> pd.DataFrame:
+        """
+        Load the trades DataFrame for a Rithmic CSV or Excel fills export.
+
+        Args:
+            file_path: Path to a .csv, .xls or .xlsx export
+            use_cache: Serve from / populate the on-disk trade cache
 
+        Returns:
+            DataFrame with one row per completed trade
+        """
+        if use_cache:
+            cached = self.trade_cache.get(file_path)
+            if cached is not None:
+                return cached
+
+        trades_df = self.parse_trades_file(file_path)
+
+        if use_cache:
+            self.trade_cache.put(file_path, trades_df)
+        return trades_df
+
+    @timed('trade_processor.parse_trades_file')
+    def parse_trades_file(self, file_path) -> pd.DataFrame:
+        """Parse an export from scratch, choosing the parser by file extension."""
+        if file_path.endswith('.csv'):
+            return self.calculate_trades_csv_rithmic(file_path)
+
+        # For .xls/.xlsx files, use the original Excel processing method
+        df = pd.read_excel(file_path, header=None)
+        df.columns = EXCEL_COLUMNS
+        processed_df = self.process_raw_data(df)
+        return self.calculate_trades(processed_df)
+
+    def parse_files_parallel(self, file_paths, max_workers=None, use_cache=True, progress=None):
+        """
+        Parse many exports across a process pool, e.g. for a historical backfill.
+
+        Cached files are served in-process; the rest are parsed by worker
+        processes and returned as columnar payloads. A file that fails to parse
+        is reported in errors and does not stop the others.
+
+        Args:
+            file_paths: Export paths to load
+            max_workers: Worker processes (default BULK_INGEST_WORKERS, 0 = CPU count)
+            use_cache: Serve from / populate the on-disk trade cache
+            progress: Optional callback(done, total, file_path, error)
+
+        Returns:
+            (trades, errors): dicts keyed by file path, both in sorted path order
+        """
+        file_paths = sorted(set(file_paths))
+        total = len(file_paths)
+        done = 0
+        trades = {}
+        errors = {}
+
+        def report(file_path, error=None):
+            nonlocal done
+            done += 1
+            if progress is not None:
+                progress(done, total, file_path, error)
+
+        to_parse = []
+        for file_path in file_paths:
+            cached = self.trade_cache.get(file_path) if use_cache else None
+            if cached is not None:
+                trades[file_path] = cached
+                report(file_path)
+            else:
+                to_parse.append(file_path)
+
+        def collect(file_path, payload, error):
+            if error is None:
+                trades_df = _from_columnar_payload(payload)
+                trades[file_path] = trades_df
+                if use_cache:
+                    self.trade_cache.put(file_path, trades_df)
+            else:
+                errors[file_path] = error
+                logger.warning('Could not parse %s: %s', file_path, error)
+            report(file_path, error)
+
+        if to_parse:
+            if not max_workers:
+                max_workers = BULK_INGEST_WORKERS or os.cpu_count() or 1
+            remaining = to_parse
+            while remaining:
+                lost, remaining = self._parse_in_pool(remaining, min(max_workers, len(remaining)), collect)
+                if lost:
+                    # A worker died (crash, OOM kill) and took the pool's in-flight files with it;
+                    # parse those again one per pool so only the file that kills its worker fails
+                    logger.warning('Parse worker died; retrying %s in-flight file(s) one at a time', len(lost))
+                for file_path in lost:
+                    if self._parse_in_pool([file_path], 1, collect)[0]:
+                        collect(file_path, None, 'BrokenProcessPool: the worker parsing this file died')
+
+        trades = {file_path: trades[file_path] for file_path in file_paths if file_path in trades}
+        errors = {file_path: errors[file_path] for file_path in file_paths if file_path in errors}
+        return trades, errors
+
+    def _parse_in_pool(self, file_paths, max_workers, collect):
+        """Parse file_paths on a fresh process pool, passing each result to collect(file_path, payload, error).
+
+        Only a few files per worker are handed to the pool at a time, so when
+        a worker dies the files it could have been parsing are known.
+
+        Returns:
+            (lost, unsubmitted): files in flight when the pool broke, and files never handed to it
+        """
+        queue = iter(file_paths)
+        futures = {}
+        lost = []
+        executor = ProcessPoolExecutor(max_workers=max_workers, mp_context=_POOL_CONTEXT,
+                                       initializer=_init_parse_worker, initargs=(self.csv_parser,))
+        try:
+            while True:
+                if not lost:
+                    for file_path in itertools.islice(queue, IN_FLIGHT_PER_WORKER * max_workers - len(futures)):
+                        futures[executor.submit(_parse_file_worker, file_path)] = file_path
+                if not futures:
+                    break
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                for future in done:
+                    file_path = futures.pop(future)
+                    try:
+                        payload, error = future.result()
+                    except BrokenProcessPool:
+                        lost.append(file_path)
+                        continue
+                    except Exception as e:
+                        payload, error = None, f"{e.__class__.__name__}: {e}"
+                    collect(file_path, payload, error)
+        except BaseException:
+            # collect gave up (e.g. the background job was cancelled): drop the queued files and
+            # return now; files already being parsed finish in their workers and are discarded
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+        executor.shutdown()
+        return sorted(lost), list(queue)
+
+    @timed('trade_processor.calculate_trades_csv_rithmic')
     def calculate_trades_csv_rithmic(self, df_or_file_path) -> pd.DataFrame:
         """
         Process Rithmic CSV data into aggregated trades by contract.
@@ -41,19 +229,20 @@ class TradeProcessor:
                 raise ValueError("Input must be DataFrame or file path")
 
             # Parse the CSV structure
-            contracts_data = self._parse_rithmic_csv(lines)
+            if self.csv_parser == 'legacy':
+                contracts_data = self._parse_rithmic_csv(lines)
+            else:
+                contracts_data = self._parse_rithmic_csv_fast(lines)
 
             # In your calculate_trades_csv_rithmic method, add this back:
-            print(f"Found contracts: {list(contracts_data.keys())}")
+            logger.debug('Found contracts: %s', list(contracts_data.keys()))
 
             # Convert to summary DataFrame
             result_df = self._create_summary_dataframe(contracts_data)
             return result_df
 
         except Exception as e:
-            print(f"ERROR processing Rithmic data: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception('Error processing Rithmic data: %s', e)
             return pd.DataFrame()
 
     def _parse_rithmic_csv(self, lines: List[str]) -> Dict[str, Dict]:
@@ -79,33 +268,32 @@ class TradeProcessor:
                     'trades': []
                 }
                 current_section = 'summary'
-                print(f"DEBUG: Set current_contract to {current_contract}, section = summary")
+                logger.debug('Set current_contract to %s, section = summary', current_contract)
                 continue
 
             # Check if this is a trade header (handle quoted fields)
             clean_fields = [field.strip('"') for field in fields]
             if 'Trade Date' in clean_fields and 'Entry Order Number' in clean_fields:
-                print(f"DEBUG: Found trade header for {current_contract}, setting section to trades_header")
+                logger.debug('Found trade header for %s, setting section to trades_header', current_contract)
                 current_section = 'trades_header'
                 continue
 
-            # ADD THIS DEBUG to see what lines are being processed:
             if current_contract:
-                print(f"DEBUG: Processing line for {current_contract}, section={current_section}, fields={fields[:3]}")
+                logger.debug('Processing line for %s, section=%s, fields=%s', current_contract, current_section, fields[:3])
 
             # Process trade data lines
             if current_contract and current_section == 'trades_header' and len(fields) >= 10:
-                print(f"DEBUG: About to call _parse_trade_line")
-                print(f"DEBUG: Trying to parse trade line for {current_contract}: {fields[:3]}...")
+                logger.debug('About to call _parse_trade_line')
+                logger.debug('Trying to parse trade line for %s: %s...', current_contract, fields[:3])
                 try:
                     trade_data = self._parse_trade_line(fields)
                     if trade_data:
-                        print(f"DEBUG: Successfully parsed trade: {trade_data['entry_order_number']}")
+                        logger.debug('Successfully parsed trade: %s', trade_data['entry_order_number'])
                         contracts_data[current_contract]['trades'].append(trade_data)
                     else:
-                        print(f"DEBUG: _parse_trade_line returned None")
+                        logger.debug('_parse_trade_line returned None')
                 except (ValueError, IndexError) as e:
-                    print(f"Warning: Could not parse trade line: {line} - {e}")
+                    logger.warning('Could not parse trade line: %s - %s', line, e)
                     continue
 
         return contracts_data
@@ -115,22 +303,12 @@ class TradeProcessor:
         # Clean quotes first
         clean_field = field.strip('"')
 
-        # Add this debug:
-        if any(contract in clean_field for contract in ['CLQ5', 'ESU5', 'NGQ25']):
-            print(f"DEBUG: Testing contract field: '{field}' -> '{clean_field}'")
-
         if not clean_field or clean_field.isdigit():
             return False
 
         # Check against known patterns - make sure this is complete!
         patterns = [r'^[A-Z]{2,3}[A-Z]\d+$', r'^[A-Z]{2,3}[A-Z]\d{2}$']
-        result = any(re.match(pattern, clean_field) for pattern in patterns)
-
-        # Add this debug:
-        if any(contract in clean_field for contract in ['CLQ5', 'ESU5', 'NGQ25']):
-            print(f"DEBUG: Pattern match result for '{clean_field}': {result}")
-
-        return result
+        return any(re.match(pattern, clean_field) for pattern in patterns)
 
     def _parse_contract_summary(self, fields: List[str]) -> Dict:
         """Parse contract summary line."""
@@ -150,7 +328,7 @@ class TradeProcessor:
                 'lose_percent': float(clean_fields[8]) if clean_fields[8] else 0
             }
         except (ValueError, IndexError) as e:
-            print(f"DEBUG: Error parsing contract summary: {e}")
+            logger.debug('Error parsing contract summary: %s', e)
             return {'contract': fields[0].strip('"'), 'trade_pnl': 0, 'commission_fees': 0}
 
     def _parse_trade_line(self, fields: List[str]) -> Optional[Dict]:
@@ -188,18 +366,21 @@ class TradeProcessor:
         """Create summary DataFrame that matches your dashboard's expected format."""
         trade_rows = []
 
-        print(f"DEBUG: Processing {len(contracts_data)} contracts")
+        logger.debug('Processing %s contracts', len(contracts_data))
+
+        if any(isinstance(data['trades'], pd.DataFrame) for data in contracts_data.values()):
+            return self._create_summary_dataframe_columnar(contracts_data)
 
         for contract, data in contracts_data.items():
             trades = data['trades']
-            print(f"DEBUG: Contract {contract} has {len(trades)} trades")
+            logger.debug('Contract %s has %s trades', contract, len(trades))
 
             # Group trades by entry order number (scale in/out positions)
             grouped_trades = self._group_scale_trades(trades)
 
             # Create individual trade rows (matching your dashboard format)
             for grouped_trade in grouped_trades:
-                print(f"DEBUG: Processing grouped trade: {grouped_trade}")
+                logger.debug('Processing grouped trade: %s', grouped_trade)
 
                 # Add error handling for datetime parsing
                 try:
@@ -216,16 +397,16 @@ class TradeProcessor:
                         'num_exits': grouped_trade['num_exits']  # Track how many partial exits
                     })
                 except Exception as e:
-                    print(f"DEBUG: Error processing grouped trade: {e}")
+                    logger.debug('Error processing grouped trade: %s', e)
                     continue
 
-        print(f"DEBUG: Created {len(trade_rows)} trade rows")
+        logger.debug('Created %s trade rows', len(trade_rows))
         df = pd.DataFrame(trade_rows)
 
         # Sort by exit time chronologically
         if not df.empty and 'exit_time' in df.columns:
             df = df.sort_values('exit_time').reset_index(drop=True)
-            print(f"DEBUG: Sorted DataFrame by exit_time")
+            logger.debug('Sorted DataFrame by exit_time')
 
         return df
 
@@ -292,6 +473,175 @@ class TradeProcessor:
 
         return result
 
+    def _parse_rithmic_csv_fast(self, lines: List[str]) -> Dict[str, Dict]:
+        """
+        Parse the Rithmic CSV structure into contract sections in a single pass.
+
+        Produces the same sections as _parse_rithmic_csv, but each contract's
+        trade lines are collected as raw text and tokenized in one block by
+        pandas' C reader, so no per-fill list or dict is ever built. Only the
+        rare candidate contract and header lines go through the csv module.
+        """
+        contracts_data = {}
+        trade_lines = {}
+        current_lines = None
+        in_trades = False
+
+        for line in lines:
+            if not line or line.startswith(',,,'):
+                continue
+
+            head = line.partition(',')[0]
+            if _CONTRACT_PATTERN.search(head):
+                first_field = next(csv.reader([line]))[0].strip()
+                if first_field and not first_field.isdigit() and _CONTRACT_PATTERN.fullmatch(first_field):
+                    # Keep the raw (quoted) name, matching the legacy parser's contract keys
+                    raw_fields = [field.strip() for field in line.split(',')]
+                    current_contract = raw_fields[0]
+                    contracts_data[current_contract] = {
+                        'summary': self._parse_contract_summary(raw_fields),
+                        'trades': None
+                    }
+                    current_lines = trade_lines[current_contract] = []
+                    in_trades = False
+                    continue
+
+            if 'Trade Date' in line and 'Entry Order Number' in line:
+                fields = next(csv.reader([line]))
+                if 'Trade Date' in fields and 'Entry Order Number' in fields:
+                    in_trades = True
+                    continue
+
+            if current_lines is not None and in_trades:
+                current_lines.append(line)
+
+        for contract, block in trade_lines.items():
+            contracts_data[contract]['trades'] = self._build_trade_columns(block)
+
+        return contracts_data
+
+    def _build_trade_columns(self, lines: List[str]) -> pd.DataFrame:
+        """Tokenize a block of trade lines into typed columns, dropping rows that fail to parse."""
+        if not lines:
+            return pd.DataFrame({column: [] for column in RITHMIC_TRADE_COLUMNS})
+
+        # Name enough columns for the widest line so ragged rows are padded, never rejected
+        width = max(RITHMIC_TRADE_COLUMN_COUNT, max(line.count(',') for line in lines) + 1)
+        raw = pd.read_csv(
+            io.StringIO('\n'.join(lines)), header=None, names=range(width),
+            usecols=range(RITHMIC_TRADE_COLUMN_COUNT), keep_default_na=False, skip_blank_lines=False,
+            dtype={i: str for i, column in enumerate(RITHMIC_TRADE_COLUMNS) if column not in RITHMIC_FLOAT_COLUMNS},
+            float_precision='round_trip'
+        )
+        raw.columns = RITHMIC_TRADE_COLUMNS
+
+        # Rows with fewer than 14 fields were skipped by the line parser
+        valid = np.array([line.count(',') >= RITHMIC_TRADE_COLUMN_COUNT - 1 for line in lines])
+        columns = {}
+        for column in RITHMIC_TRADE_COLUMNS:
+            values = raw[column]
+            if column in RITHMIC_FLOAT_COLUMNS:
+                # Clean columns arrive as float64; anything else is coerced and bad rows dropped
+                if pd.api.types.is_numeric_dtype(values.dtype):
+                    values = values.astype(np.float64)
+                else:
+                    values = pd.to_numeric(values.astype(str).str.strip(' "'), errors='coerce')
+                values = values.to_numpy(dtype=np.float64)
+                valid &= ~np.isnan(values)
+            else:
+                values = values.str.strip(' "')
+                if column == 'fill_size':
+                    valid &= values.str.lstrip('+-').str.isdigit().to_numpy(dtype=bool)
+                values = values.to_numpy(dtype=object)
+            columns[column] = values
+
+        trades = pd.DataFrame({column: values[valid] for column, values in columns.items()})
+        trades['fill_size'] = trades['fill_size'].astype(np.int64)
+        return trades
+
+    def _create_summary_dataframe_columnar(self, contracts_data: Dict) -> pd.DataFrame:
+        """Columnar counterpart of _create_summary_dataframe for the fast parser."""
+        frames = []
+        for contract, data in contracts_data.items():
+            grouped = self._group_scale_trades_columnar(data['trades'])
+            if grouped.empty:
+                continue
+            grouped.insert(0, 'contract', contract)
+            frames.append(grouped)
+
+        if not frames:
+            return pd.DataFrame()
+
+        df = pd.concat(frames, ignore_index=True)
+        return df.sort_values('exit_time').reset_index(drop=True)
+
+    def _group_scale_trades_columnar(self, trades: pd.DataFrame) -> pd.DataFrame:
+        """Vectorized _group_scale_trades: one row per entry order number."""
+        if trades is None or trades.empty:
+            return pd.DataFrame()
+
+        # Groups keep first-appearance order; fills within a group are ordered by exit time
+        group_codes = pd.factorize(trades['entry_order_number'])[0]
+        ordered = trades.assign(_group=group_codes).sort_values(['_group', 'exit_time'], kind='mergesort')
+        groups = ordered['_group'].to_numpy()
+        starts = np.flatnonzero(np.r_[True, groups[1:] != groups[:-1]])
+        ends = np.r_[starts[1:], len(groups)] - 1
+
+        fill_size = ordered['fill_size'].to_numpy()
+        total_quantity = self._segment_sums(fill_size, starts, ends)
+        total_pnl = self._segment_sums(ordered['trade_pnl'].to_numpy(), starts, ends)
+        total_entry_value = self._segment_sums(ordered['entry_price'].to_numpy() * fill_size, starts, ends)
+        total_exit_value = self._segment_sums(ordered['exit_price'].to_numpy() * fill_size, starts, ends)
+        has_quantity = total_quantity > 0
+        safe_quantity = np.where(has_quantity, total_quantity, 1)
+        avg_entry_price = np.where(has_quantity, total_entry_value / safe_quantity, 0)
+        avg_exit_price = np.where(has_quantity, total_exit_value / safe_quantity, 0)
+
+        # Duration from first entry to last exit
+        entry_time = self._parse_rithmic_times(ordered['entry_time'].to_numpy()[starts])
+        exit_time = self._parse_rithmic_times(ordered['exit_time'].to_numpy()[ends])
+        duration = exit_time - entry_time
+        invalid = entry_time.isna() | exit_time.isna()
+        if invalid.any():
+            life_span = pd.to_timedelta(ordered['trade_life_span'].to_numpy()[ends], unit='s')
+            duration = duration.where(~invalid, pd.Series(life_span).astype(duration.dtype))
+
+        return pd.DataFrame({
+            'entry_time': entry_time,
+            'exit_time': exit_time,
+            'duration': duration,
+            'entry_price': avg_entry_price,
+            'exit_price': avg_exit_price,
+            'quantity': total_quantity,
+            'pnl': total_pnl,
+            'direction': np.where(ordered['entry_buy_sell'].to_numpy()[starts] == 'B', 'Long', 'Short'),
+            'num_exits': ends - starts + 1
+        })
+
+    @staticmethod
+    def _segment_sums(values, starts, ends):
+        """
+        Sum values[starts[i]:ends[i] + 1] for every segment, adding left to right.
+
+        Vectorized across segments with one step per position, so floating point
+        totals match Python's sum() over each group exactly.
+        """
+        totals = np.zeros(len(starts), dtype=values.dtype)
+        lengths = ends - starts + 1
+        for offset in range(int(lengths.max()) if len(lengths) else 0):
+            active = lengths > offset
+            totals[active] += values[starts[active] + offset]
+        return totals
+
+    @staticmethod
+    def _parse_rithmic_times(values) -> pd.Series:
+        """Parse Rithmic timestamps, falling back to per-value inference for odd formats."""
+        parsed = pd.Series(pd.to_datetime(values, format='%Y-%m-%d %H:%M:%S', errors='coerce'))
+        if parsed.isna().any():
+            parsed = pd.Series([pd.to_datetime(value, errors='coerce') for value in values],
+                               dtype=parsed.dtype)
+        return parsed
+
     # Keep your existing methods for other formats
     def process_raw_data(self, df):
         """Process raw Excel data format."""
@@ -302,8 +652,82 @@ class TradeProcessor:
         )
         return df.sort_values('datetime').reset_index(drop=True)
 
+    @timed('trade_processor.calculate_trades')
     def calculate_trades(self, df):
-        """Calculate trades from processed Excel data."""
+        """
+        Calculate trades from processed Excel data.
+
+        Positions are rebuilt per base contract from a cumulative sum of signed
+        fill sizes. A round trip closes on the fill where the running position
+        returns to zero and is priced against the fill that opened it.
+
+        Args:
+            df: Fills sorted by datetime, as returned by process_raw_data
+
+        Returns:
+            DataFrame with one row per closed position
+        """
+        if df.empty:
+            return pd.DataFrame()
+
+        full_contract = df['contract'].to_numpy()
+        base_contract = df['contract'].str.split().str[0].to_numpy()
+        is_buy = (df['B/S'] == 'B').to_numpy()
+        size = df['Size'].to_numpy()
+        price = df['Price'].to_numpy()
+        timestamp = df['datetime'].to_numpy()
+
+        signed_size = np.where(is_buy, size, -size)
+        position = pd.Series(signed_size).groupby(base_contract, sort=False).cumsum().to_numpy()
+        prev_position = position - signed_size
+
+        opens = (prev_position == 0) & (position != 0)
+        closes = (position == 0) & (prev_position != 0)
+        if not closes.any():
+            return pd.DataFrame()
+
+        # Opens and closes alternate per contract, so each close pairs with the
+        # most recent open of the same base contract
+        row_number = np.arange(len(df), dtype=float)
+        open_row = pd.Series(np.where(opens, row_number, np.nan)).groupby(base_contract, sort=False).ffill()
+        exit_rows = np.flatnonzero(closes)
+        entry_rows = open_row.to_numpy()[exit_rows].astype(np.int64)
+
+        # Join tick specs onto the closed positions through the root-symbol registry
+        registry = self.contract_manager.get_registry()
+        exit_base = base_contract[exit_rows]
+        tick_size, tick_value, has_specs = registry.tick_specs(exit_base)
+        for contract in registry.unknown_roots(exit_base):
+            logger.warning('Contract %s not found in contracts', contract)
+
+        entry_price = price[entry_rows]
+        exit_price = price[exit_rows]
+        entry_is_buy = is_buy[entry_rows]
+        quantity = np.abs(prev_position[exit_rows])
+
+        price_diff = np.where(entry_is_buy, exit_price - entry_price, entry_price - exit_price)
+        ticks = price_diff / tick_size
+        pnl = np.where(has_specs, ticks * tick_value * quantity, 0)
+        if not has_specs.any():
+            pnl = pnl.astype(np.int64)
+
+        entry_time = timestamp[entry_rows]
+        exit_time = timestamp[exit_rows]
+
+        return pd.DataFrame({
+            'contract': full_contract[exit_rows],
+            'entry_time': entry_time,
+            'exit_time': exit_time,
+            'duration': exit_time - entry_time,
+            'entry_price': entry_price,
+            'exit_price': exit_price,
+            'quantity': quantity,
+            'pnl': pnl,
+            'direction': np.where(entry_is_buy, 'Long', 'Short')
+        })
+
+    def _calculate_trades_iterrows(self, df):
+        """Row-by-row reference implementation of calculate_trades, kept for parity checks."""
         trades = []
         open_positions = {}
 
@@ -346,7 +770,7 @@ class TradeProcessor:
                     ticks = price_diff / specs['tick_size']
                     pnl = ticks * specs['tick_value'] * abs(prev_position)
                 except KeyError:
-                    print(f"Warning: Contract {base_contract} not found in contracts")
+                    logger.warning('Contract %s not found in contracts', base_contract)
                     pnl = 0
 
                 trades.append({
@@ -370,4 +794,37 @@ class TradeProcessor:
             else:
                 open_positions[base_contract]['position'] = new_position
 
-        return pd.DataFrame(trades)
\ No newline at end of file
+        return pd.DataFrame(trades)
+
+
+def _to_columnar_payload(df):
+    """Pack a trades DataFrame as column names, dtypes and numpy arrays for cheap pickling."""
+    return {
+        'columns': list(df.columns),
+        'dtypes': [str(dtype) for dtype in df.dtypes],
+        'arrays': [df[column].to_numpy() for column in df.columns]
+    }
+
+
+def _from_columnar_payload(payload):
+    return pd.DataFrame({
+        column: pd.Series(array, dtype=dtype)
+        for column, dtype, array in zip(payload['columns'], payload['dtypes'], payload['arrays'])
+    })
+
+
+_worker_processor = None
+
+
+def _init_parse_worker(csv_parser):
+    global _worker_processor
+    from contracts.contract_manager import ContractManager
+    _worker_processor = TradeProcessor(ContractManager(), csv_parser=csv_parser)
+
+
+def _parse_file_worker(file_path):
+    """Parse one export in a worker process. Returns (payload, None) or (None, error message)."""
+    try:
+        return _to_columnar_payload(_worker_processor.parse_trades_file(file_path)), None
+    except Exception as e:
+        return None, f"{e.__class__.__name__}: {e}"
@@ -0,0 +1,31 @@
+# gunicorn settings for `gunicorn -c gunicorn.conf.py wsgi:server` (run from the src directory)
+import gc
+import multiprocessing
+
+from config import SERVER_BIND, SERVER_THREADS, SERVER_TIMEOUT, SERVER_WORKERS
+
+bind = SERVER_BIND
+workers = SERVER_WORKERS or multiprocessing.cpu_count()
+# Threads serve the light callbacks while a worker renders a heavy month or range
+threads = SERVER_THREADS
+worker_class = 'gthread'
+timeout = SERVER_TIMEOUT
+# Import and warm the app (wsgi.py) once in the parent; workers share it copy-on-write
+preload_app = True
+
+
+def pre_fork(server, worker):
+    # Keep the preloaded objects out of the collector so the workers' GC passes
+    # don't write to (and un-share) those pages
+    gc.freeze()
+
+
+def post_fork(server, worker):
+    import wsgi
+    from monitoring.timing import get_latency_registry, start_metrics_publisher
+    # One worker watches trading_data; if it exits, the next one to start takes over
+    wsgi.dashboard.start_ingest_watcher()
+    # Each worker keeps its own latency registry and profiles; /metrics gathers every worker's
+    # registry from METRICS_DIR (labelled worker="<pid>"), /debug/profiles shows the answering worker's
+    get_latency_registry().reset()  # the parent's warm-up timings would otherwise count once per worker
+    start_metrics_publisher()
@@ -0,0 +1,20 @@
+import logging
+
+from config import LOG_LEVEL, LOG_FORMAT
+
+
+def configure_logging(level=None):
+    """
+    Configure dashboard logging once per process.
+
+    Args:
+        level: Level name or number; defaults to LOG_LEVEL (PDB_LOG_LEVEL env var)
+    """
+    level = level or LOG_LEVEL
+    if isinstance(level, str):
+        level = logging.getLevelName(level.upper())
+
+    root = logging.getLogger()
+    if not root.handlers:
+        logging.basicConfig(level=level, format=LOG_FORMAT)
+    root.setLevel(level)
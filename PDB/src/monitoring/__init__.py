@@ -0,0 +1 @@
+# Latency metrics and request profiling for the dashboard
@@ -0,0 +1,79 @@
+import cProfile
+import heapq
+import itertools
+import logging
+import marshal
+import os
+import threading
+import time
+from datetime import datetime
+
+from config import PROFILE_KEEP
+
+logger = logging.getLogger(__name__)
+
+
+class RequestProfiler:
+    """Opt-in cProfile capture of Dash callback requests.
+
+    Every profiled request is timed; only the slowest `keep` are retained, as
+    pstats-compatible dumps that can be downloaded and opened with
+    `python -m pstats` or snakeviz.
+    """
+
+    def __init__(self, keep=PROFILE_KEEP):
+        self.keep = keep
+        self._heap = []  # min-heap of (seconds, id, profile info)
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def start(self):
+        """Start profiling the current request. Returns a token for stop(), or None."""
+        profile = cProfile.Profile()
+        try:
+            profile.enable()
+        except ValueError:
+            # Another profiler is already active on this thread
+            return None
+        return profile, time.perf_counter()
+
+    def stop(self, token, label):
+        """Stop the profile started by start() and keep it if it is among the slowest."""
+        if token is None:
+            return
+        profile, started = token
+        profile.disable()
+        seconds = time.perf_counter() - started
+        with self._lock:
+            if len(self._heap) >= self.keep and seconds <= self._heap[0][0]:
+                return
+        profile.create_stats()
+        entry = {
+            'id': next(self._ids),
+            'worker': os.getpid(),
+            'label': label,
+            'seconds': seconds,
+            'captured': datetime.now().isoformat(timespec='seconds'),
+            'stats': marshal.dumps(profile.stats)
+        }
+        with self._lock:
+            item = (seconds, entry['id'], entry)
+            if len(self._heap) < self.keep:
+                heapq.heappush(self._heap, item)
+            else:
+                heapq.heappushpop(self._heap, item)
+
+    def profiles(self):
+        """Retained profiles, slowest first, without their stats payload."""
+        with self._lock:
+            entries = [entry for _, _, entry in self._heap]
+        return [{key: value for key, value in entry.items() if key != 'stats'}
+                for entry in sorted(entries, key=lambda entry: entry['seconds'], reverse=True)]
+
+    def dump(self, profile_id):
+        """The .prof bytes for profile_id, or None if it is no longer retained."""
+        with self._lock:
+            for _, entry_id, entry in self._heap:
+                if entry_id == profile_id:
+                    return entry['stats']
+        return None
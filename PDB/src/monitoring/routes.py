@@ -0,0 +1,76 @@
+import json
+import logging
+
+from flask import Response, abort, g, request
+
+from config import METRICS_ALLOW_REMOTE
+from monitoring.timing import get_latency_registry, get_metrics_publisher, render_prometheus
+
+logger = logging.getLogger(__name__)
+
+DASH_CALLBACK_PATH = '/_dash-update-component'
+LOOPBACK_ADDRESSES = ('127.0.0.1', '::1', 'localhost')
+
+
+def _require_local(allow_remote):
+    if not allow_remote and request.remote_addr not in LOOPBACK_ADDRESSES:
+        abort(403)
+
+
+def register_monitoring_routes(server, registry=None, profiler=None, allow_remote=METRICS_ALLOW_REMOTE):
+    """
+    Add /metrics (Prometheus text) and, when a profiler is given, per-request
+    cProfile capture with /debug/profiles to a Flask server.
+
+    Under gunicorn, /metrics covers every worker (see MetricsPublisher) with
+    a worker label per series. Profiles stay in the worker that served the
+    request: /debug/profiles lists the answering worker's, each tagged with
+    its worker pid.
+
+    Args:
+        server: The Dash app's Flask server
+        registry: LatencyRegistry to expose (default: the process-wide one)
+        profiler: Optional RequestProfiler; callback requests are profiled only when set
+        allow_remote: Serve these routes to non-loopback clients
+    """
+    registry = registry or get_latency_registry()
+
+    @server.route('/metrics')
+    def metrics():
+        _require_local(allow_remote)
+        publisher = get_metrics_publisher()
+        text = render_prometheus(publisher.snapshots()) if publisher else registry.render_prometheus()
+        return Response(text, mimetype='text/plain; version=0.0.4')
+
+    if profiler is None:
+        return
+
+    @server.before_request
+    def start_profile():
+        if request.path == DASH_CALLBACK_PATH:
+            g.pdb_profile = profiler.start()
+
+    @server.after_request
+    def stop_profile(response):
+        token = g.pop('pdb_profile', None)
+        if token is not None:
+            body = request.get_json(silent=True) or {}
+            profiler.stop(token, body.get('output', request.path))
+        return response
+
+    @server.route('/debug/profiles')
+    def list_profiles():
+        _require_local(allow_remote)
+        return Response(json.dumps(profiler.profiles(), indent=2), mimetype='application/json')
+
+    @server.route('/debug/profiles/<int:profile_id>.prof')
+    def download_profile(profile_id):
+        _require_local(allow_remote)
+        data = profiler.dump(profile_id)
+        if data is None:
+            abort(404)
+        return Response(data, mimetype='application/octet-stream', headers={
+            'Content-Disposition': f'attachment; filename=pdb-request-{profile_id}.prof'
+        })
+
+    logger.info('Request profiling enabled; slowest callbacks at /debug/profiles')
@@ -0,0 +1,208 @@
+import functools
+import json
+import logging
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+from config import METRICS_ENABLED, METRICS_WINDOW, METRICS_DIR, METRICS_PUBLISH_SECONDS
+from storage.file_lock import write_json_atomic
+
+logger = logging.getLogger(__name__)
+
+QUANTILES = (0.5, 0.95, 0.99)
+
+
+class LatencyRegistry:
+    """Rolling latency samples per named stage.
+
+    Each stage keeps its last `window` durations for quantiles plus all-time
+    count and sum, which is what a Prometheus summary exposes.
+    """
+
+    def __init__(self, window=METRICS_WINDOW):
+        self.window = window
+        self._samples = {}  # {stage: deque of seconds}
+        self._totals = {}  # {stage: [count, sum]}
+        self._lock = threading.Lock()
+
+    def observe(self, stage, seconds):
+        with self._lock:
+            samples = self._samples.get(stage)
+            if samples is None:
+                samples = self._samples[stage] = deque(maxlen=self.window)
+                self._totals[stage] = [0, 0.0]
+            samples.append(seconds)
+            totals = self._totals[stage]
+            totals[0] += 1
+            totals[1] += seconds
+
+    def snapshot(self):
+        """{stage: {'count', 'sum', 'p50', 'p95', 'p99'}} with quantiles over the rolling window."""
+        import numpy as np  # only needed when metrics are read, not on the startup path
+        with self._lock:
+            data = {stage: (np.fromiter(samples, dtype=float), tuple(self._totals[stage]))
+                    for stage, samples in self._samples.items()}
+        snapshot = {}
+        for stage, (samples, (count, total)) in sorted(data.items()):
+            values = np.quantile(samples, QUANTILES) if len(samples) else [float('nan')] * len(QUANTILES)
+            stats = {'count': count, 'sum': total}
+            stats.update({f"p{round(q * 100)}": float(value) for q, value in zip(QUANTILES, values)})
+            snapshot[stage] = stats
+        return snapshot
+
+    def reset(self):
+        with self._lock:
+            self._samples.clear()
+            self._totals.clear()
+
+    def render_prometheus(self):
+        """Prometheus text exposition of every stage as a summary."""
+        return render_prometheus({None: self.snapshot()})
+
+
+def render_prometheus(snapshots):
+    """Prometheus text for {worker: snapshot}; series get a worker label unless the worker is None."""
+    name = 'pdb_stage_duration_seconds'
+    lines = [
+        f'# HELP {name} Time spent in dashboard callbacks and pipeline stages.',
+        f'# TYPE {name} summary'
+    ]
+    for worker, snapshot in sorted(snapshots.items(), key=lambda item: str(item[0])):
+        worker_label = '' if worker is None else f',worker="{worker}"'
+        for stage, stats in snapshot.items():
+            labels = 'stage="' + stage.replace('\\', '\\\\').replace('"', '\\"') + '"' + worker_label
+            for quantile in QUANTILES:
+                lines.append(f'{name}{{{labels},quantile="{quantile}"}} '
+                             f'{stats[f"p{round(quantile * 100)}"]:.6f}')
+            lines.append(f'{name}_sum{{{labels}}} {stats["sum"]:.6f}')
+            lines.append(f'{name}_count{{{labels}}} {stats["count"]}')
+    return '\n'.join(lines) + '\n'
+
+
+class MetricsPublisher:
+    """Shares this worker's latency snapshot with its sibling workers through a directory.
+
+    Under gunicorn every pre-forked worker has its own registry and a scrape
+    of /metrics reaches just one of them. Each worker writes its snapshot to
+    <directory>/<pid>.json every `interval` seconds; the worker answering a
+    scrape renders every live worker's snapshot, each series labelled
+    worker="<pid>". Quantiles stay per worker (they cannot be merged);
+    sum() the _sum and _count series across workers for totals.
+    """
+
+    def __init__(self, directory=METRICS_DIR, registry=None, interval=METRICS_PUBLISH_SECONDS):
+        self.directory = directory
+        self.registry = registry or _registry
+        self.interval = interval
+        self._stop = threading.Event()
+
+    def _path(self, pid):
+        return os.path.join(self.directory, f'{pid}.json')
+
+    def publish(self):
+        write_json_atomic(self._path(os.getpid()), self.registry.snapshot())
+
+    def snapshots(self):
+        """{pid: snapshot} for every live worker, this one freshly published."""
+        self.publish()
+        snapshots = {}
+        for entry in os.scandir(self.directory):
+            stem, ext = os.path.splitext(entry.name)
+            if ext != '.json' or not stem.isdigit():
+                continue
+            pid = int(stem)
+            if not _process_alive(pid):
+                # Left behind by a worker that exited
+                try:
+                    os.remove(entry.path)
+                except OSError:
+                    pass
+                continue
+            try:
+                with open(entry.path, 'r') as f:
+                    snapshots[pid] = json.load(f)
+            except (OSError, ValueError) as e:
+                logger.debug('Skipping metrics from worker %s: %s', pid, e)
+        return snapshots
+
+    def start(self):
+        """Publish from a daemon thread every interval seconds."""
+        threading.Thread(target=self._run, name='pdb-metrics', daemon=True).start()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.publish()
+            except Exception as e:
+                logger.warning('Could not publish metrics: %s', e)
+
+    def stop(self):
+        self._stop.set()
+
+
+def _process_alive(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+
+_registry = LatencyRegistry()
+
+
+_publisher = None
+
+
+def get_latency_registry():
+    """Return the process-wide latency registry."""
+    return _registry
+
+
+def start_metrics_publisher(directory=METRICS_DIR):
+    """Share this process's metrics with sibling workers (called in each gunicorn worker after fork)."""
+    global _publisher
+    if _publisher is None and METRICS_ENABLED:
+        _publisher = MetricsPublisher(directory)
+        _publisher.start()
+    return _publisher
+
+
+def get_metrics_publisher():
+    """Return this process's MetricsPublisher, or None when it serves only its own metrics."""
+    return _publisher
+
+
+@contextmanager
+def stage_timer(stage, registry=None):
+    """Record the time spent in the with-block under `stage`."""
+    if not METRICS_ENABLED:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        (registry or _registry).observe(stage, time.perf_counter() - start)
+
+
+def timed(stage):
+    """Decorator recording each call's duration under `stage` (exceptions included)."""
+    def decorator(func):
+        if not METRICS_ENABLED:
+            return func
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                _registry.observe(stage, time.perf_counter() - start)
+        return wrapper
+    return decorator
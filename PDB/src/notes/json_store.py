@@ -0,0 +1,164 @@
+import json
+import logging
+import os
+import threading
+
+from storage.file_lock import file_lock, write_json_atomic
+
+logger = logging.getLogger(__name__)
+
+
+class JsonStore:
+    """In-memory view of a flat JSON object file keyed by "<date>_<...>" ids.
+
+    The file is parsed once and reused until its mtime or size changes on disk,
+    keys are indexed by their date prefix, and every update rewrites the file
+    atomically exactly once. Updates hold a file lock and re-read the file
+    first, so saves from several worker processes are not lost.
+    """
+
+    def __init__(self, file_path, indent=2):
+        self.file_path = file_path
+        # Keep each file's existing layout (the trade files are indented, the daily notes are not)
+        self.indent = indent
+        self._lock = threading.RLock()
+        self._data = {}
+        self._by_date = {}
+        self._signature = None
+
+    @staticmethod
+    def _date_prefix(key):
+        return key.split('_', 1)[0] if '_' in key else None
+
+    def _file_signature(self):
+        try:
+            stat = os.stat(self.file_path)
+        except FileNotFoundError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def _rebuild_index(self):
+        self._by_date = {}
+        for key in self._data:
+            date_prefix = self._date_prefix(key)
+            if date_prefix is not None:
+                self._by_date.setdefault(date_prefix, []).append(key)
+
+    def _refresh(self, force=False):
+        """Reload the file if it changed since the last read (always, when force is set)."""
+        signature = self._file_signature()
+        if signature == self._signature and not force:
+            return
+        if signature is None:
+            self._data = {}
+        else:
+            with open(self.file_path, 'r') as f:
+                self._data = json.load(f)
+            logger.debug('Loaded %s entries from %s', len(self._data), self.file_path)
+        self._signature = signature
+        self._rebuild_index()
+
+    def _write(self):
+        write_json_atomic(self.file_path, self._data, indent=self.indent)
+        self._signature = self._file_signature()
+
+    def all(self):
+        """Return a copy of every entry."""
+        with self._lock:
+            self._refresh()
+            return dict(self._data)
+
+    def for_date(self, date_str):
+        """Return the entries whose key starts with "<date_str>_"."""
+        with self._lock:
+            self._refresh()
+            return {key: self._data[key] for key in self._by_date.get(date_str, [])}
+
+    def between(self, start_date, end_date):
+        """Return the entries dated start_date..end_date inclusive (YYYY-MM-DD strings)."""
+        with self._lock:
+            self._refresh()
+            return {
+                key: self._data[key]
+                for date_prefix, keys in self._by_date.items()
+                if start_date <= date_prefix <= end_date
+                for key in keys
+            }
+
+    def get(self, key, default=None):
+        with self._lock:
+            self._refresh()
+            return self._data.get(key, default)
+
+    def get_many(self, keys, default=None):
+        """Return {key: value} for every key, using default for missing ones."""
+        with self._lock:
+            self._refresh()
+            return {key: self._data.get(key, default) for key in keys}
+
+    def update(self, items):
+        """Merge items into the store and write the file once."""
+        if not items:
+            return
+        with self._lock, file_lock(self.file_path):
+            # Another process may have written within the mtime granularity
+            self._refresh(force=True)
+            for key, value in items.items():
+                if key not in self._data:
+                    date_prefix = self._date_prefix(key)
+                    if date_prefix is not None:
+                        self._by_date.setdefault(date_prefix, []).append(key)
+                self._data[key] = value
+            self._write()
+
+    def delete(self, key):
+        """Remove key and write the file if it was present."""
+        with self._lock, file_lock(self.file_path):
+            self._refresh(force=True)
+            if key not in self._data:
+                return
+            del self._data[key]
+            date_prefix = self._date_prefix(key)
+            if date_prefix in self._by_date:
+                self._by_date[date_prefix].remove(key)
+            self._write()
+
+    def rename(self, mapping):
+        """Move values from {old key: new key} and write the file once.
+
+        A value already saved under a new key wins; when several old keys map
+        to one new key, the first pair in mapping wins. Pairs with old == new
+        are ignored, and chains (a new key that is itself renamed) raise
+        ValueError, since their outcome would depend on the order applied.
+        """
+        mapping = {key: new_key for key, new_key in mapping.items() if key != new_key}
+        if set(mapping.values()) & set(mapping):
+            raise ValueError('Chained renames (a new key that is also renamed) are not supported')
+        with self._lock, file_lock(self.file_path):
+            self._refresh(force=True)
+            if not any(key in self._data for key in mapping):
+                return
+            moves = {}
+            taken = set(self._data)
+            for key, new_key in mapping.items():
+                if key in self._data and new_key not in taken:
+                    moves[key] = new_key
+                    taken.add(new_key)
+            # Renamed keys keep their place in the file
+            self._data = {moves.get(key, key): value for key, value in self._data.items()
+                          if key not in mapping or key in moves}
+            self._rebuild_index()
+            self._write()
+
+
+_stores = {}
+_stores_lock = threading.Lock()
+
+
+def get_json_store(file_path, indent=2):
+    """Return the process-wide JsonStore for file_path."""
+    file_path = os.path.abspath(file_path)
+    with _stores_lock:
+        if file_path not in _stores:
+            _stores[file_path] = JsonStore(file_path, indent)
+        return _stores[file_path]
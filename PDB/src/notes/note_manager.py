@@ -1,21 +1,26 @@
-import json
-import os
-from config import NOTES_FILE
+from config import NOTES_FILE, STORAGE_BACKEND
+from monitoring.timing import timed
+from notes.json_store import get_json_store
 
 class NoteManager:
+    def __init__(self):
+        self._journal = None
+        self._notes = None
+        if STORAGE_BACKEND == 'sqlite':
+            from storage.sqlite_journal import get_journal
+            self._journal = get_journal()
+        else:
+            # Locked read-modify-write, so concurrent saves don't drop each other's notes
+            self._notes = get_json_store(NOTES_FILE, indent=None)
+
+    @timed('notes.load_daily_note')
     def load_notes(self, date_str):
-        try:
-            with open(NOTES_FILE, 'r') as f:
-                return json.load(f).get(date_str, '')
-        except FileNotFoundError:
-            return ''
+        if self._journal is not None:
+            return self._journal.load_daily_note(date_str)
+        return self._notes.get(date_str, '')
     
     def save_notes(self, date_str, note):
-        notes = {}
-        if os.path.exists(NOTES_FILE):
-            with open(NOTES_FILE, 'r') as f:
-                notes = json.load(f)
-        notes[date_str] = note
-        with open(NOTES_FILE, 'w') as f:
-            json.dump(notes, f)
- 
\ No newline at end of file
+        if self._journal is not None:
+            self._journal.save_daily_note(date_str, note)
+            return
+        self._notes.update({date_str: note})
@@ -1,81 +1,251 @@
-import json
+import calendar
+import logging
 import os
-from config import PDB_DIR
+import re
+import threading
+from datetime import datetime, timedelta
+
+from config import PDB_DIR, STORAGE_BACKEND
+from monitoring.timing import timed
+from notes.json_store import get_json_store
+
+logger = logging.getLogger(__name__)
+
+# Callbacks run with the set of dates touched by every save/delete
+_save_listeners = []
+
+# Trade IDs are "<date>_<contract>_<entry>_<exit>" with full 24-hour timestamps
+TRADE_ID_TIME_FORMAT = '%Y%m%dT%H%M%S'
+# Earlier IDs used the quoted contract and 12-hour display times: 2025-08-22_"CLV5"_08-00-00_AM_08-00-29_AM
+LEGACY_TRADE_ID = re.compile(r'^(\d{4}-\d{2}-\d{2})_(.+)_(\d{2}-\d{2}-\d{2}_[AP]M)_(\d{2}-\d{2}-\d{2}_[AP]M)$')
+
+# Stores whose legacy IDs were already migrated by this process
+_migrated_stores = set()
+_migration_lock = threading.Lock()
+
+
+def _clean_contract(contract):
+    return str(contract).strip().strip('"').strip().upper()
+
+
+def migrate_trade_id(trade_id):
+    """Best-guess current ID for a legacy trade ID, or None if trade_id is not in the legacy format.
+
+    Legacy IDs carry only times of day, so the entry is taken to be on the
+    export date and an exit before the entry to be on the next day. That is
+    wrong for overnight-session trades, so legacy_id_mapping only falls back
+    to this for trades that are no longer in an export.
+    """
+    match = LEGACY_TRADE_ID.match(trade_id)
+    if match is None:
+        return None
+    date_str, contract, entry, exit_ = match.groups()
+    entry_time = datetime.strptime(f"{date_str} {entry}", '%Y-%m-%d %I-%M-%S_%p')
+    exit_time = datetime.strptime(f"{date_str} {exit_}", '%Y-%m-%d %I-%M-%S_%p')
+    if exit_time < entry_time:
+        exit_time += timedelta(days=1)
+    return (f"{date_str}_{_clean_contract(contract)}_"
+            f"{entry_time.strftime(TRADE_ID_TIME_FORMAT)}_{exit_time.strftime(TRADE_ID_TIME_FORMAT)}")
+
+
+def legacy_trade_ids(trades_df, date_str):
+    """The legacy IDs of every row of trades_df, as a Series aligned with it."""
+    legacy_ids = (date_str + '_' + trades_df['contract'].astype(str)
+                  + '_' + trades_df['entry_time'].dt.strftime('%I:%M:%S %p')
+                  + '_' + trades_df['exit_time'].dt.strftime('%I:%M:%S %p'))
+    return legacy_ids.str.replace(' ', '_').str.replace(':', '-')
+
+
+def _load_export_trades(date_str):
+    from data.daily_rollup import get_daily_rollups
+    rollups = get_daily_rollups()
+    file_path = rollups.data_index.find(date_str)
+    return None if file_path is None else rollups.trade_processor.load_trades_file(file_path)
+
+
+def legacy_id_mapping(trade_ids, load_trades=_load_export_trades):
+    """{legacy ID: current ID} for the legacy IDs among trade_ids.
+
+    Each day's trades are loaded with load_trades(date_str) (its parsed export
+    by default) and their legacy IDs rebuilt from the real entry and exit
+    timestamps. Trades that cannot be found fall back to migrate_trade_id.
+    """
+    by_date = {}
+    for trade_id in trade_ids:
+        match = LEGACY_TRADE_ID.match(trade_id)
+        if match is not None:
+            by_date.setdefault(match.group(1), []).append(trade_id)
+
+    mapping = {}
+    for date_str, day_ids in by_date.items():
+        found = {}
+        try:
+            trades_df = load_trades(date_str)
+        except Exception as e:
+            logger.warning('Could not load trades for %s to migrate their IDs: %s', date_str, e)
+            trades_df = None
+        if trades_df is not None and not trades_df.empty:
+            current_ids = TradeNoteManager.trade_ids(trades_df, date_str)
+            # Reversed so the first trade wins when two share a legacy ID
+            found = dict(zip(legacy_trade_ids(trades_df, date_str)[::-1], current_ids[::-1]))
+        for trade_id in day_ids:
+            mapping[trade_id] = found.get(trade_id) or migrate_trade_id(trade_id)
+    return mapping
+
 
 class TradeNoteManager:
-    def __init__(self):
-        self.trade_notes_file = os.path.join(PDB_DIR, 'trade_notes.json')
-        self.trade_colors_file = os.path.join(PDB_DIR, 'trade_colors.json')
-    
+    @staticmethod
+    def add_save_listener(callback):
+        """Register callback(dates) to run after any trade note or color is saved or deleted."""
+        _save_listeners.append(callback)
+
+    @staticmethod
+    def remove_save_listener(callback):
+        """Unregister a callback added with add_save_listener."""
+        if callback in _save_listeners:
+            _save_listeners.remove(callback)
+
+    @staticmethod
+    def _index_ratings(colors):
+        """Keep the quality index in step with saved colors (a missed update is repaired on the next read)."""
+        try:
+            from data.quality_index import get_quality_index
+            get_quality_index().record_ratings(colors)
+        except Exception as e:
+            logger.warning('Could not update the quality index: %s', e)
+
+    @staticmethod
+    def _notify_saved(trade_ids):
+        dates = {trade_id.split('_', 1)[0] for trade_id in trade_ids}
+        for callback in list(_save_listeners):
+            callback(dates)
+
+    def __init__(self, journal_dir=PDB_DIR):
+        self.trade_notes_file = os.path.join(journal_dir, 'trade_notes.json')
+        self.trade_colors_file = os.path.join(journal_dir, 'trade_colors.json')
+        if STORAGE_BACKEND == 'sqlite':
+            from storage.sqlite_journal import get_journal
+            journal = get_journal()
+            self._notes = journal.trade_table('trade_notes')
+            self._colors = journal.trade_table('trade_colors')
+        else:
+            # Shared, mtime-validated stores: repeated lookups don't re-read the files
+            self._notes = get_json_store(self.trade_notes_file)
+            self._colors = get_json_store(self.trade_colors_file)
+        self._migrate_legacy_ids(self._notes)
+        self._migrate_legacy_ids(self._colors)
+
+    @staticmethod
+    def _migrate_legacy_ids(store, load_trades=_load_export_trades):
+        """Rename legacy trade IDs in store to the current format (once per store and process)."""
+        name = getattr(store, 'file_path', None) or f'{store.journal.db_path}:{store.table}'
+        with _migration_lock:
+            if name in _migrated_stores:
+                return
+            mapping = legacy_id_mapping(store.all(), load_trades)
+            if mapping:
+                store.rename(mapping)
+                logger.info('Migrated %s legacy trade IDs in %s', len(mapping), name)
+            _migrated_stores.add(name)
+
     def generate_trade_id(self, date_str, contract, entry_time, exit_time):
-        """Generate a unique trade ID based on trade details."""
-        # Create a unique identifier using date, contract, and times
-        return f"{date_str}_{contract}_{entry_time}_{exit_time}".replace(' ', '_').replace(':', '-')
-    
+        """Trade ID from the export date, contract symbol and entry/exit timestamps."""
+        return (f"{date_str}_{_clean_contract(contract)}_"
+                f"{entry_time.strftime(TRADE_ID_TIME_FORMAT)}_{exit_time.strftime(TRADE_ID_TIME_FORMAT)}")
+
+    @staticmethod
+    def trade_ids(trades_df, date_str):
+        """generate_trade_id for every row of trades_df, as a Series aligned with it."""
+        contracts = trades_df['contract'].astype(str).str.strip().str.strip('"').str.strip().str.upper()
+        return (date_str + '_' + contracts
+                + '_' + trades_df['entry_time'].dt.strftime(TRADE_ID_TIME_FORMAT)
+                + '_' + trades_df['exit_time'].dt.strftime(TRADE_ID_TIME_FORMAT))
+
+    @timed('notes.annotate')
+    def annotate(self, trades_df, date_str, notes=None, colors=None):
+        """Copy of trades_df with trade_id, note and color columns.
+
+        notes and colors default to the saved ones for date_str; pass already
+        loaded {trade_id: value} dicts (e.g. a month's) to skip the lookups.
+        """
+        if notes is None:
+            notes = self._notes.for_date(date_str)
+        if colors is None:
+            colors = self._colors.for_date(date_str)
+        trade_ids = self.trade_ids(trades_df, date_str)
+        return trades_df.assign(
+            trade_id=trade_ids,
+            note=trade_ids.map(notes).fillna(''),
+            color=trade_ids.map(colors).fillna('none')
+        )
+
     def load_trade_notes(self, date_str=None):
         """Load trade notes. If date_str provided, return only notes for that date."""
-        try:
-            with open(self.trade_notes_file, 'r') as f:
-                all_notes = json.load(f)
-            
-            if date_str:
-                # Filter notes for specific date
-                return {k: v for k, v in all_notes.items() if k.startswith(f"{date_str}_")}
-            return all_notes
-        except FileNotFoundError:
-            return {}
-    
+        if date_str:
+            return self._notes.for_date(date_str)
+        return self._notes.all()
+
     def save_trade_note(self, trade_id, note):
         """Save a note for a specific trade."""
-        # Load existing notes
-        all_notes = self.load_trade_notes()
-        
-        # Update with new note
-        all_notes[trade_id] = note
-        
-        # Save back to file
-        with open(self.trade_notes_file, 'w') as f:
-            json.dump(all_notes, f, indent=2)
-    
+        self._notes.update({trade_id: note})
+        self._notify_saved([trade_id])
+
     def get_trade_note(self, trade_id):
         """Get note for a specific trade."""
-        all_notes = self.load_trade_notes()
-        return all_notes.get(trade_id, '')
-    
+        return self._notes.get(trade_id, '')
+
     def delete_trade_note(self, trade_id):
         """Delete a note for a specific trade."""
-        all_notes = self.load_trade_notes()
-        if trade_id in all_notes:
-            del all_notes[trade_id]
-            with open(self.trade_notes_file, 'w') as f:
-                json.dump(all_notes, f, indent=2)
-    
+        self._notes.delete(trade_id)
+        self._notify_saved([trade_id])
+
     def load_trade_colors(self, date_str=None):
         """Load trade colors. If date_str provided, return only colors for that date."""
-        try:
-            with open(self.trade_colors_file, 'r') as f:
-                all_colors = json.load(f)
-            
-            if date_str:
-                # Filter colors for specific date
-                return {k: v for k, v in all_colors.items() if k.startswith(f"{date_str}_")}
-            return all_colors
-        except FileNotFoundError:
-            return {}
-    
+        if date_str:
+            return self._colors.for_date(date_str)
+        return self._colors.all()
+
+    def load_trade_colors_for_month(self, year, month):
+        """Load trade colors for every day of the given month."""
+        last_day = calendar.monthrange(year, month)[1]
+        return self._colors.between(f"{year:04d}-{month:02d}-01", f"{year:04d}-{month:02d}-{last_day:02d}")
+
+    def load_trade_notes_for_month(self, year, month):
+        """Load trade notes for every day of the given month."""
+        last_day = calendar.monthrange(year, month)[1]
+        return self._notes.between(f"{year:04d}-{month:02d}-01", f"{year:04d}-{month:02d}-{last_day:02d}")
+
     def save_trade_color(self, trade_id, color):
         """Save a color preference for a specific trade."""
-        # Load existing colors
-        all_colors = self.load_trade_colors()
-        
-        # Update with new color
-        all_colors[trade_id] = color
-        
-        # Save back to file
-        with open(self.trade_colors_file, 'w') as f:
-            json.dump(all_colors, f, indent=2)
-    
+        self._colors.update({trade_id: color})
+        self._index_ratings({trade_id: color})
+        self._notify_saved([trade_id])
+
     def get_trade_color(self, trade_id):
         """Get color for a specific trade."""
-        all_colors = self.load_trade_colors()
-        return all_colors.get(trade_id, 'none')
\ No newline at end of file
+        return self._colors.get(trade_id, 'none')
+
+    @timed('notes.get_trade_analysis')
+    def get_many(self, trade_ids):
+        """Get (note, color) for each trade ID in one lookup per file."""
+        notes = self._notes.get_many(trade_ids, '')
+        colors = self._colors.get_many(trade_ids, 'none')
+        return {trade_id: (notes[trade_id], colors[trade_id]) for trade_id in trade_ids}
+
+    @timed('notes.save_trade_analysis')
+    def save_many(self, notes=None, colors=None):
+        """Save {trade_id: note} and {trade_id: color} with a single write per file."""
+        notes = notes or {}
+        colors = colors or {}
+        self._notes.update(notes)
+        self._colors.update(colors)
+        if colors:
+            self._index_ratings(colors)
+        if notes or colors:
+            self._notify_saved(list(notes) + list(colors))
+
+    def revision(self, date_str):
+        """Fingerprint of the notes and colors saved for date_str."""
+        notes = self._notes.for_date(date_str)
+        colors = self._colors.for_date(date_str)
+        return hash((tuple(sorted(notes.items())), tuple(sorted(colors.items()))))
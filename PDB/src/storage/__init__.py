@@ -0,0 +1 @@
+# Alternative persistence backends for notes, trade analysis and contracts
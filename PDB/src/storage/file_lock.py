@@ -0,0 +1,96 @@
+import json
+import os
+import shutil
+import tempfile
+import threading
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:  # Windows: no pre-fork server there, so in-process locking is enough
+    fcntl = None
+
+_thread_locks = {}
+_thread_locks_lock = threading.Lock()
+_held_locks = {}  # {lock path: (pid, open file)} held until the process exits
+
+
+def _current_umask():
+    umask = os.umask(0)
+    os.umask(umask)
+    return umask
+
+
+# Read once at import, while nothing else is creating files
+_UMASK = _current_umask()
+
+
+def _thread_lock(path):
+    with _thread_locks_lock:
+        return _thread_locks.setdefault(path, threading.Lock())
+
+
+@contextmanager
+def file_lock(path):
+    """Exclusive lock on `path` shared by every thread and worker process.
+
+    Uses a `<path>.lock` sidecar so the locked file itself can be replaced
+    atomically while the lock is held.
+    """
+    lock_path = os.path.abspath(path) + '.lock'
+    with _thread_lock(lock_path):
+        if fcntl is None:
+            yield
+            return
+        os.makedirs(os.path.dirname(lock_path), exist_ok=True)
+        with open(lock_path, 'a') as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+
+def hold_process_lock(path):
+    """Try to take `path` for the rest of this process's life. Returns True if this process holds it.
+
+    Used to pick the one worker that runs a background service; the lock is
+    released by the OS when the holder exits, so a replacement worker takes over.
+    """
+    path = os.path.abspath(path)
+    # A forked child inherits this table but not the ownership
+    held = _held_locks.get(path)
+    if held is not None and held[0] == os.getpid():
+        return True
+    if fcntl is None:
+        _held_locks[path] = (os.getpid(), None)
+        return True
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    f = open(path, 'a')
+    try:
+        fcntl.flock(f, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        f.close()
+        return False
+    _held_locks[path] = (os.getpid(), f)
+    return True
+
+
+def write_json_atomic(path, data, **dump_kwargs):
+    """Write data as JSON through a uniquely named temporary file and os.replace it into place."""
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.tmp_', suffix='.json')
+    try:
+        # mkstemp creates the file 0600; give it the mode the file already has, or a plain open()'s
+        if os.path.exists(path):
+            shutil.copymode(path, tmp_path)
+        else:
+            os.chmod(tmp_path, 0o666 & ~_UMASK)
+        with os.fdopen(fd, 'w') as f:
+            json.dump(data, f, **dump_kwargs)
+        os.replace(tmp_path, path)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
@@ -0,0 +1,286 @@
+import argparse
+import json
+import logging
+import os
+import sqlite3
+import threading
+
+from config import PDB_DIR, NOTES_FILE, CONTRACTS_FILE, DEFAULT_CONTRACTS, JOURNAL_DB_FILE
+from storage.file_lock import write_json_atomic
+
+logger = logging.getLogger(__name__)
+
+TRADE_NOTES_FILE = os.path.join(PDB_DIR, 'trade_notes.json')
+TRADE_COLORS_FILE = os.path.join(PDB_DIR, 'trade_colors.json')
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+CREATE TABLE IF NOT EXISTS daily_notes (
+    date TEXT PRIMARY KEY,
+    note TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS trade_notes (
+    trade_id TEXT PRIMARY KEY,
+    date TEXT,
+    value TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_trade_notes_date ON trade_notes (date);
+CREATE TABLE IF NOT EXISTS trade_colors (
+    trade_id TEXT PRIMARY KEY,
+    date TEXT,
+    value TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_trade_colors_date ON trade_colors (date);
+CREATE TABLE IF NOT EXISTS contracts (
+    name TEXT PRIMARY KEY,
+    tick_value REAL NOT NULL,
+    tick_size REAL NOT NULL
+);
+"""
+
+# Trade tables and the JSON files they replace
+TRADE_TABLES = {
+    'trade_notes': TRADE_NOTES_FILE,
+    'trade_colors': TRADE_COLORS_FILE,
+}
+
+
+def _trade_date(trade_id):
+    """Date prefix of a trade ID ("2025-08-22_..." -> "2025-08-22")."""
+    return trade_id.split('_', 1)[0] if '_' in trade_id else None
+
+
+def _read_json(file_path):
+    try:
+        with open(file_path, 'r') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+
+
+class SqliteJournal:
+    """SQLite (WAL) store for daily notes, trade notes/colors and contract specs.
+
+    Connections are per thread (and per process after a fork); every save is a
+    single-row upsert in its own transaction, so concurrent saves from
+    callbacks no longer overwrite each other.
+    """
+
+    def __init__(self, db_path=JOURNAL_DB_FILE):
+        self.db_path = db_path
+        self._local = threading.local()
+        self._pid = os.getpid()
+        with self._connect() as conn:
+            conn.executescript(SCHEMA)
+
+    def _connect(self):
+        if self._pid != os.getpid():
+            # Forked (pre-fork server workers): never reuse the parent's connections
+            self._local = threading.local()
+            self._pid = os.getpid()
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            self._local.conn = conn
+        return conn
+
+    # Migration / export
+
+    def is_migrated(self):
+        row = self._connect().execute("SELECT value FROM meta WHERE key = 'migrated_from_json'").fetchone()
+        return row is not None
+
+    def migrate_from_json(self, force=False):
+        """Import the existing JSON files once. Returns {table: rows imported}."""
+        if self.is_migrated() and not force:
+            return {}
+        counts = {}
+        conn = self._connect()
+        with conn:
+            daily_notes = _read_json(NOTES_FILE) or {}
+            conn.executemany(
+                'INSERT OR REPLACE INTO daily_notes (date, note) VALUES (?, ?)',
+                daily_notes.items()
+            )
+            counts['daily_notes'] = len(daily_notes)
+
+            for table, file_path in TRADE_TABLES.items():
+                values = _read_json(file_path) or {}
+                conn.executemany(
+                    f'INSERT OR REPLACE INTO {table} (trade_id, date, value) VALUES (?, ?, ?)',
+                    ((trade_id, _trade_date(trade_id), value) for trade_id, value in values.items())
+                )
+                counts[table] = len(values)
+
+            contracts = _read_json(CONTRACTS_FILE) or DEFAULT_CONTRACTS
+            conn.executemany(
+                'INSERT OR REPLACE INTO contracts (name, tick_value, tick_size) VALUES (?, ?, ?)',
+                ((name, specs['tick_value'], specs['tick_size']) for name, specs in contracts.items())
+            )
+            counts['contracts'] = len(contracts)
+
+            conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('migrated_from_json', '1')")
+        logger.info('Migrated JSON journal into %s: %s', self.db_path, counts)
+        return counts
+
+    def export_to_json(self, out_dir=PDB_DIR):
+        """Write the journal back out in the original JSON file layout."""
+        os.makedirs(out_dir, exist_ok=True)
+        conn = self._connect()
+        daily_notes = dict(conn.execute('SELECT date, note FROM daily_notes ORDER BY rowid'))
+        write_json_atomic(os.path.join(out_dir, os.path.basename(NOTES_FILE)), daily_notes)
+        for table, file_path in TRADE_TABLES.items():
+            values = dict(conn.execute(f'SELECT trade_id, value FROM {table} ORDER BY rowid'))
+            write_json_atomic(os.path.join(out_dir, os.path.basename(file_path)), values, indent=2)
+        write_json_atomic(os.path.join(out_dir, os.path.basename(CONTRACTS_FILE)), self.load_contracts())
+        logger.info('Exported journal %s to %s', self.db_path, out_dir)
+
+    # Daily notes
+
+    def load_daily_note(self, date_str):
+        row = self._connect().execute('SELECT note FROM daily_notes WHERE date = ?', (date_str,)).fetchone()
+        return row[0] if row else ''
+
+    def save_daily_note(self, date_str, note):
+        conn = self._connect()
+        with conn:
+            conn.execute(
+                'INSERT INTO daily_notes (date, note) VALUES (?, ?) '
+                'ON CONFLICT(date) DO UPDATE SET note = excluded.note',
+                (date_str, note)
+            )
+
+    # Contracts
+
+    def load_contracts(self):
+        rows = self._connect().execute('SELECT name, tick_value, tick_size FROM contracts ORDER BY rowid')
+        return {name: {'tick_value': tick_value, 'tick_size': tick_size} for name, tick_value, tick_size in rows}
+
+    def save_contract(self, name, tick_value, tick_size):
+        conn = self._connect()
+        with conn:
+            conn.execute(
+                'INSERT INTO contracts (name, tick_value, tick_size) VALUES (?, ?, ?) '
+                'ON CONFLICT(name) DO UPDATE SET tick_value = excluded.tick_value, tick_size = excluded.tick_size',
+                (name, tick_value, tick_size)
+            )
+
+    def trade_table(self, table):
+        return SqliteTradeTable(self, table)
+
+
+class SqliteTradeTable:
+    """trade_notes / trade_colors table with the same interface as notes.json_store.JsonStore."""
+
+    def __init__(self, journal, table):
+        if table not in TRADE_TABLES:
+            raise ValueError(f"Unknown trade table: {table}")
+        self.journal = journal
+        self.table = table
+
+    def _rows(self, sql, params=()):
+        return dict(self.journal._connect().execute(sql, params))
+
+    def all(self):
+        return self._rows(f'SELECT trade_id, value FROM {self.table} ORDER BY rowid')
+
+    def for_date(self, date_str):
+        return self._rows(f'SELECT trade_id, value FROM {self.table} WHERE date = ? ORDER BY rowid', (date_str,))
+
+    def between(self, start_date, end_date):
+        return self._rows(
+            f'SELECT trade_id, value FROM {self.table} WHERE date BETWEEN ? AND ? ORDER BY rowid',
+            (start_date, end_date)
+        )
+
+    def get(self, key, default=None):
+        row = self.journal._connect().execute(
+            f'SELECT value FROM {self.table} WHERE trade_id = ?', (key,)
+        ).fetchone()
+        return row[0] if row else default
+
+    def get_many(self, keys, default=None):
+        keys = list(keys)
+        found = {}
+        # Stay well below SQLite's bound-parameter limit
+        for start in range(0, len(keys), 500):
+            chunk = keys[start:start + 500]
+            placeholders = ','.join('?' * len(chunk))
+            found.update(self._rows(
+                f'SELECT trade_id, value FROM {self.table} WHERE trade_id IN ({placeholders})', chunk
+            ))
+        return {key: found.get(key, default) for key in keys}
+
+    def update(self, items):
+        if not items:
+            return
+        conn = self.journal._connect()
+        with conn:
+            conn.executemany(
+                f'INSERT INTO {self.table} (trade_id, date, value) VALUES (?, ?, ?) '
+                'ON CONFLICT(trade_id) DO UPDATE SET value = excluded.value',
+                ((key, _trade_date(key), value) for key, value in items.items())
+            )
+
+    def delete(self, key):
+        conn = self.journal._connect()
+        with conn:
+            conn.execute(f'DELETE FROM {self.table} WHERE trade_id = ?', (key,))
+
+    def rename(self, mapping):
+        """Move values from {old key: new key}, with the same rules as JsonStore.rename."""
+        mapping = {old_key: new_key for old_key, new_key in mapping.items() if old_key != new_key}
+        if set(mapping.values()) & set(mapping):
+            raise ValueError('Chained renames (a new key that is also renamed) are not supported')
+        conn = self.journal._connect()
+        with conn:
+            # A value already saved under the new key, or moved there by an earlier pair, wins;
+            # the old row is then dropped
+            conn.executemany(
+                f'UPDATE OR IGNORE {self.table} SET trade_id = ? WHERE trade_id = ?',
+                ((new_key, old_key) for old_key, new_key in mapping.items())
+            )
+            conn.executemany(f'DELETE FROM {self.table} WHERE trade_id = ?', ((key,) for key in mapping))
+
+
+_journal = None
+_journal_lock = threading.Lock()
+
+
+def get_journal():
+    """Return the process-wide journal, importing the JSON files on first use."""
+    global _journal
+    with _journal_lock:
+        if _journal is None:
+            _journal = SqliteJournal()
+            _journal.migrate_from_json()
+        return _journal
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Manage the SQLite trading journal')
+    parser.add_argument('--db', default=JOURNAL_DB_FILE, help='journal database path')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    migrate_parser = subparsers.add_parser('migrate', help='import the JSON files into the journal')
+    migrate_parser.add_argument('--force', action='store_true', help='re-import even if already migrated')
+    export_parser = subparsers.add_parser('export', help='write the journal back to JSON files')
+    export_parser.add_argument('--out', default=PDB_DIR, help='output directory (default: PDB directory)')
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    journal = SqliteJournal(args.db)
+    if args.command == 'migrate':
+        counts = journal.migrate_from_json(force=args.force)
+        if not counts:
+            logger.info('Journal already migrated; use --force to re-import')
+    else:
+        journal.export_to_json(args.out)
+
+
+if __name__ == '__main__':
+    main()
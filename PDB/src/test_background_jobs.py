@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+
+# Checks for progress reporting from the monthly and range computations
+import os
+import sys
+import tempfile
+import threading
+import time
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from benchmarks.synthetic_data import generate_rithmic_csv
+from contracts.contract_manager import ContractManager
+from data.daily_rollup import DailyRollupStore
+from data.data_index import DataDirIndex
+from data.range_analytics import RangeAnalytics
+from data.trade_cache import TradeCache
+from data.trade_processor import TradeProcessor
+
+DAYS = ('2025-08-18', '2025-08-19', '2025-08-22')
+
+
+def _setup(tmp_dir):
+    data_dir = os.path.join(tmp_dir, 'trading_data')
+    os.makedirs(data_dir)
+    for seed, day in enumerate(DAYS):
+        generate_rithmic_csv(os.path.join(data_dir, f'{day}.csv'), date_str=day, seed=seed)
+    processor = TradeProcessor(ContractManager(), trade_cache=TradeCache(os.path.join(tmp_dir, 'cache')))
+    index = DataDirIndex(data_dir)
+    rollups = DailyRollupStore(processor, index, rollup_file=os.path.join(tmp_dir, 'rollups.json'))
+    return processor, index, rollups
+
+
+def test_rollup_progress():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        _, _, rollups = _setup(tmp_dir)
+        calls = []
+        month = rollups.month(2025, 8, progress=lambda done, total: calls.append((done, total)))
+        assert list(month) == list(DAYS)
+        assert calls == [(1, 3), (2, 3), (3, 3)]
+        print("✓ Monthly rollups report progress per day")
+
+
+def test_range_progress():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        processor, index, rollups = _setup(tmp_dir)
+        calls = []
+        report = RangeAnalytics(processor, index, rollups).compute(
+            '2025-08-01', '2025-08-31', progress=lambda done, total: calls.append((done, total)))
+        assert report['totals']['trading_days'] == len(DAYS)
+        assert calls and calls[-1] == (3, 3) and [done for done, _ in calls] == sorted(done for done, _ in calls)
+        print("✓ Range loads report progress up to the number of days")
+
+
+def test_job_callback_without_manager():
+    import app
+
+    dashboard = app.TradingDashboard()
+    dashboard.background_manager = None
+    # Without a manager the view runs in the request with a no-op report
+    job = dashboard._job_callback(app.Output('test-content', 'children'), [app.Input('test-request', 'data')],
+                                  progress_id='test-progress', prevent_initial_call=True)
+    wrapped = job(lambda report, request: (report(1, 2), request)[1])
+    assert wrapped({'year': 2025}) == {'year': 2025}
+    print("✓ Views fall back to running in the request without a job manager")
+
+
+
+def _start(client, output, request, old_job=None):
+    query = f'?oldJob={old_job}' if old_job else ''
+    return client.post('/_dash-update-component' + query, json={
+        'output': output, 'outputs': {'id': 'job-content', 'property': 'children'},
+        'inputs': [{'id': 'job-request', 'property': 'data', 'value': request}],
+        'state': [], 'changedPropIds': ['job-request.data']}).get_json()
+
+
+def _poll(client, output, handle):
+    response = client.post(f"/_dash-update-component?cacheKey={handle['cacheKey']}&job={handle['job']}", json={
+        'output': output, 'outputs': {'id': 'job-content', 'property': 'children'},
+        'inputs': [{'id': 'job-request', 'property': 'data', 'value': None}],
+        'state': [], 'changedPropIds': []})
+    return response.get_json() if response.data else {}
+
+
+def test_jobs_run_in_process_and_cancel():
+    try:
+        import diskcache
+    except ImportError:
+        print("- diskcache is not installed; background jobs run in the request")
+        return
+    import app
+    from ui.background_jobs import ThreadJobManager
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        dashboard = app.TradingDashboard()
+        dashboard.background_manager = ThreadJobManager(diskcache.Cache(tmp_dir))
+        release = {'slow': threading.Event()}
+        steps = {'slow': 0, 'fast': 0}
+        pids = []
+        caught = []
+
+        @dashboard._job_callback(app.Output('job-content', 'children'), [app.Input('job-request', 'data')],
+                                 progress_id='job-progress', prevent_initial_call=True)
+        def run_job(report, request):
+            pids.append(os.getpid())
+            for done in range(1, 4):
+                if request == 'slow':
+                    release['slow'].wait(5)
+                steps[request] = done
+                try:
+                    report(done, 3)
+                except Exception as e:
+                    # Like the views' error handling, which must not see the cancellation
+                    caught.append(e)
+                    return 'error'
+            return f'{request} finished'
+
+        client = dashboard.app.server.test_client()
+        output = next(dep['output'] for dep in client.get('/_dash-dependencies').get_json()
+                      if dep['output'].startswith('job-content'))
+
+        slow = _start(client, output, 'slow')
+        fast = _start(client, output, 'fast', old_job=slow['job'])
+        release['slow'].set()
+        for _ in range(100):
+            body = _poll(client, output, fast)
+            if 'response' in body:
+                break
+            time.sleep(0.05)
+        assert body['response']['job-content']['children'] == 'fast finished'
+        assert pids and set(pids) == {os.getpid()}, "jobs run in the server process, not a fork"
+
+        time.sleep(0.2)
+        assert steps['slow'] <= 1, "the superseded job stops at its next progress report"
+        assert caught == [], "cancellation is not an error for the view to handle"
+        assert 'response' not in _poll(client, output, slow), "a cancelled job never writes its result"
+        dashboard.background_manager.shutdown()
+        print("✓ Background jobs run on threads in the server process and stop when superseded")
+
+
+if __name__ == "__main__":
+    test_rollup_progress()
+    test_range_progress()
+    test_job_callback_without_manager()
+    test_jobs_run_in_process_and_cancel()
+    print("\n🎉 Background job checks passed")
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+
+# Checks for parallel multi-file parsing (backfills)
+import os
+import sys
+import tempfile
+import time
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import pandas as pd
+
+from benchmarks.synthetic_data import generate_rithmic_csv
+from contracts.contract_manager import ContractManager
+from data.trade_cache import TradeCache
+from data import trade_processor
+from data.trade_processor import IN_FLIGHT_PER_WORKER, TradeProcessor, _parse_file_worker
+
+
+def _crashing_worker(file_path):
+    # Stands in for a parse that kills its worker process (segfault, OOM kill)
+    if 'crash' in os.path.basename(file_path):
+        os._exit(1)
+    return _parse_file_worker(file_path)
+
+
+def _slow_worker(file_path):
+    time.sleep(1)
+    return None, 'slow parse stand-in'
+
+
+class _Stop(Exception):
+    pass
+
+
+class _CountingPool(trade_processor.ProcessPoolExecutor):
+    created = 0
+
+    def __init__(self, *args, **kwargs):
+        _CountingPool.created += 1
+        super().__init__(*args, **kwargs)
+
+
+def test_parallel_parse_matches_serial_and_isolates_errors():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        file_paths = []
+        for seed, day in enumerate(('2025-08-20', '2025-08-21', '2025-08-22')):
+            file_path = os.path.join(tmp_dir, f'{day}.csv')
+            generate_rithmic_csv(file_path, date_str=day, seed=seed)
+            file_paths.append(file_path)
+        corrupt = os.path.join(tmp_dir, '2025-08-25.xlsx')
+        with open(corrupt, 'w') as f:
+            f.write('not a spreadsheet')
+
+        processor = TradeProcessor(ContractManager(), trade_cache=TradeCache(os.path.join(tmp_dir, 'cache')))
+        seen = []
+        trades, errors = processor.parse_files_parallel(
+            [corrupt] + file_paths[::-1], max_workers=2,
+            progress=lambda done, total, file_path, error: seen.append((done, total))
+        )
+
+        assert list(trades) == file_paths, "results come back in sorted path order"
+        assert list(errors) == [corrupt]
+        assert [done for done, _ in seen] == [1, 2, 3, 4] and all(total == 4 for _, total in seen)
+        for file_path in file_paths:
+            pd.testing.assert_frame_equal(trades[file_path], processor.parse_trades_file(file_path), check_exact=True)
+            assert processor.trade_cache.get(file_path) is not None
+        assert trade_processor._POOL_CONTEXT.get_start_method() != 'fork', "workers never fork the threaded server"
+        print("✓ Parallel parse matches serial results and isolates a corrupt file")
+
+
+def test_dead_worker_fails_only_its_own_file():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        file_paths = []
+        for day in range(1, 13):
+            file_path = os.path.join(tmp_dir, f'2025-08-{day:02d}.csv')
+            generate_rithmic_csv(file_path, date_str=f'2025-08-{day:02d}', contracts=1, seed=day)
+            file_paths.append(file_path)
+        crashing = os.path.join(tmp_dir, '2025-08-01_crash.csv')
+        generate_rithmic_csv(crashing, date_str='2025-08-01', contracts=1, seed=0)
+
+        processor = TradeProcessor(ContractManager(), trade_cache=TradeCache(os.path.join(tmp_dir, 'cache')))
+        seen = []
+        trade_processor._parse_file_worker = _crashing_worker
+        trade_processor.ProcessPoolExecutor = _CountingPool
+        try:
+            trades, errors = processor.parse_files_parallel(
+                file_paths + [crashing], max_workers=2,
+                progress=lambda done, total, file_path, error: seen.append(file_path))
+        finally:
+            trade_processor._parse_file_worker = _parse_file_worker
+            trade_processor.ProcessPoolExecutor = _CountingPool.__bases__[0]
+
+        assert list(errors) == [crashing] and 'BrokenProcessPool' in errors[crashing]
+        assert list(trades) == file_paths, "files in flight when the worker died are parsed again"
+        assert sorted(seen) == sorted(file_paths + [crashing]), "each file is reported once"
+        # One pool before the crash, one per in-flight file, one for the files never handed over
+        assert _CountingPool.created <= 2 + IN_FLIGHT_PER_WORKER * 2, "queued files are not retried one by one"
+        print("✓ A worker that dies fails only the file it was parsing")
+
+
+def test_failed_progress_stops_the_pool():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        file_paths = []
+        for day in range(1, 9):
+            file_path = os.path.join(tmp_dir, f'2025-08-{day:02d}.csv')
+            open(file_path, 'w').close()
+            file_paths.append(file_path)
+        processor = TradeProcessor(ContractManager(), trade_cache=TradeCache(os.path.join(tmp_dir, 'cache')))
+        stopped = []
+
+        def progress(done, total, file_path, error):
+            # Stands in for a cancelled background job's progress report
+            stopped.append(time.perf_counter())
+            raise _Stop()
+
+        trade_processor._parse_file_worker = _slow_worker
+        try:
+            processor.parse_files_parallel(file_paths, max_workers=2, progress=progress)
+        except _Stop:
+            pass
+        finally:
+            trade_processor._parse_file_worker = _parse_file_worker
+        assert len(stopped) == 1 and time.perf_counter() - stopped[0] < 0.5, \
+            "the caller does not wait for queued or running parses"
+        print("✓ A failing progress report stops the parse pool at once")
+
+
+if __name__ == "__main__":
+    test_parallel_parse_matches_serial_and_isolates_errors()
+    test_dead_worker_fails_only_its_own_file()
+    test_failed_progress_stops_the_pool()
+    print("\n🎉 Bulk ingestion checks passed")
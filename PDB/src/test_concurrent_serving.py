@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+
+# Checks that shared state is safe with several worker processes and threads
+import multiprocessing
+import os
+import sys
+import tempfile
+import threading
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from benchmarks.synthetic_data import generate_rithmic_csv
+from contracts.contract_manager import ContractManager
+from data.data_index import DataDirIndex
+from data.day_store import DayTradesStore
+from data.trade_cache import TradeCache
+from data.trade_processor import TradeProcessor
+from notes.json_store import JsonStore
+from storage.file_lock import hold_process_lock
+
+
+def _save_notes(file_path, worker):
+    store = JsonStore(file_path)
+    for i in range(25):
+        store.update({f'2025-08-22_W{worker}_{i}': f'note {i}'})
+
+
+def _try_lock(lock_path, results):
+    results.put(hold_process_lock(lock_path))
+
+
+def test_json_saves_from_several_processes():
+    context = multiprocessing.get_context('fork')
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        file_path = os.path.join(tmp_dir, 'trade_notes.json')
+        workers = [context.Process(target=_save_notes, args=(file_path, worker)) for worker in range(4)]
+        for process in workers:
+            process.start()
+        for process in workers:
+            process.join()
+        assert len(JsonStore(file_path).all()) == 100, "no save was lost to another process's write"
+        print("✓ Note saves from 4 processes are all kept")
+
+
+def test_one_process_holds_the_watcher_lock():
+    context = multiprocessing.get_context('fork')
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        lock_path = os.path.join(tmp_dir, 'ingest.lock')
+        assert hold_process_lock(lock_path)
+        results = context.Queue()
+        process = context.Process(target=_try_lock, args=(lock_path, results))
+        process.start()
+        process.join()
+        assert results.get() is False, "a second process does not get the lock"
+        print("✓ Only one process runs the export watcher")
+
+
+def test_day_store_loads_once_under_concurrency():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        generate_rithmic_csv(os.path.join(tmp_dir, '2025-08-22.csv'), date_str='2025-08-22')
+        processor = TradeProcessor(ContractManager(), trade_cache=TradeCache(os.path.join(tmp_dir, 'cache')))
+        loads = []
+        load_trades_file = processor.load_trades_file
+        processor.load_trades_file = lambda path: loads.append(path) or load_trades_file(path)
+        store = DayTradesStore(processor, DataDirIndex(tmp_dir))
+
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(store.get('2025-08-22'))) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert len(loads) == 1 and len(results) == 8
+        assert all(entry is results[0] for entry in results)
+        print("✓ Concurrent callbacks for one day share a single load")
+
+
+if __name__ == "__main__":
+    test_json_saves_from_several_processes()
+    test_one_process_holds_the_watcher_lock()
+    test_day_store_loads_once_under_concurrency()
+    print("\n🎉 Concurrent serving checks passed")
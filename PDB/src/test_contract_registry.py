@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+
+# Checks for root-symbol resolution in the contract registry
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import numpy as np
+
+from contracts.contract_registry import ContractRegistry
+
+CONTRACTS = {
+    'ES': {'tick_value': 12.5, 'tick_size': 0.25},
+    'CL': {'tick_value': 10.0, 'tick_size': 0.01},
+    'NG': {'tick_value': 10.0, 'tick_size': 0.001},
+}
+
+
+def test_resolves_exchange_and_excel_symbols():
+    registry = ContractRegistry(CONTRACTS)
+    expected = {
+        'CLV5': 'CL',
+        '"ESU5"': 'ES',
+        'NGQ25': 'NG',
+        'ES MAR25': 'ES',
+        'ES Mar25': 'ES',
+        'MNQZ5': 'MNQ',
+        'ZZ Mar25': 'ZZ',
+    }
+    for symbol, root in expected.items():
+        assert registry.root_for(symbol) == root, symbol
+    print("✓ Exchange and Excel-style symbols resolve to their roots")
+
+
+def test_vectorized_tick_specs():
+    registry = ContractRegistry(CONTRACTS)
+    tick_size, tick_value, has_specs = registry.tick_specs(['"CLV5"', 'ES Mar25', 'ZZ Mar25', '"CLV5"'])
+    assert np.array_equal(tick_size, [0.01, 0.25, 1.0, 0.01])
+    assert np.array_equal(tick_value, [10.0, 12.5, 0.0, 10.0])
+    assert np.array_equal(has_specs, [True, True, False, True])
+    assert registry.unknown_roots(['"CLV5"', 'ZZ Mar25']) == ['ZZ']
+    print("✓ Tick specs join onto symbol arrays")
+
+
+if __name__ == "__main__":
+    test_resolves_exchange_and_excel_symbols()
+    test_vectorized_tick_specs()
+    print("\n🎉 Contract registry checks passed")
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+
+# Checks for the incremental daily rollup store
+import json
+import os
+import sys
+import tempfile
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from benchmarks.synthetic_data import generate_excel_fills, generate_rithmic_csv
+from contracts.contract_manager import ContractManager
+from contracts.contract_registry import ContractRegistry
+from data.daily_rollup import DailyRollupStore, summarize_trades
+from data.data_index import DataDirIndex
+from data.trade_cache import TradeCache
+from data.trade_processor import TradeProcessor
+
+
+def test_rollups_update_incrementally():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        data_dir = os.path.join(tmp_dir, 'trading_data')
+        os.makedirs(data_dir)
+        for day, seed in (('2025-08-21', 1), ('2025-08-22', 2)):
+            generate_rithmic_csv(os.path.join(data_dir, f'{day}.csv'), date_str=day, seed=seed)
+
+        processor = TradeProcessor(ContractManager(), trade_cache=TradeCache(os.path.join(tmp_dir, 'cache')))
+        store = DailyRollupStore(processor, DataDirIndex(data_dir), os.path.join(tmp_dir, 'rollups.json'))
+
+        month = store.month(2025, 8)
+        assert list(month) == ['2025-08-21', '2025-08-22']
+        registry = processor.contract_manager.get_registry()
+        expected = summarize_trades(processor.load_trades_file(os.path.join(data_dir, '2025-08-22.csv')), registry)
+        assert month['2025-08-22'] == expected
+        assert store.refresh(['2025-08-21', '2025-08-22']) == [], "unchanged files must not be re-parsed"
+
+        # Overwriting one export only recomputes that day
+        generate_rithmic_csv(os.path.join(data_dir, '2025-08-22.csv'), date_str='2025-08-22', seed=3)
+        assert store.refresh(['2025-08-21', '2025-08-22']) == ['2025-08-22']
+        assert store.verify() == []
+
+        # A fresh store reads the persisted rows
+        reopened = DailyRollupStore(processor, DataDirIndex(data_dir), os.path.join(tmp_dir, 'rollups.json'))
+        assert reopened.month(2025, 8) == store.month(2025, 8)
+        assert reopened.year(2025)[8]['trading_days'] == 2
+        print("✓ Rollups persist and only changed days are recomputed")
+
+
+def test_concurrent_saves_merge():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        data_dir = os.path.join(tmp_dir, 'trading_data')
+        os.makedirs(data_dir)
+        for day, seed in (('2025-08-21', 1), ('2025-08-22', 2)):
+            generate_rithmic_csv(os.path.join(data_dir, f'{day}.csv'), date_str=day, seed=seed)
+        processor = TradeProcessor(ContractManager(), trade_cache=TradeCache(os.path.join(tmp_dir, 'cache')))
+        rollup_file = os.path.join(tmp_dir, 'rollups.json')
+
+        # Two stores stand in for two worker processes that both read the empty file first
+        first = DailyRollupStore(processor, DataDirIndex(data_dir), rollup_file)
+        second = DailyRollupStore(processor, DataDirIndex(data_dir), rollup_file)
+        assert first.errors() == {} and second.errors() == {}
+        assert first.refresh(['2025-08-21']) == ['2025-08-21']
+        assert second.refresh(['2025-08-22']) == ['2025-08-22']
+
+        with open(rollup_file) as f:
+            assert sorted(json.load(f)) == ['2025-08-21', '2025-08-22'], "neither worker's day is lost"
+        processor.trade_cache.clear()
+        assert first.refresh(['2025-08-22']) == [], "rows saved by another worker are picked up"
+        print("✓ Rollups saved by concurrent workers are merged, not overwritten")
+
+
+class _Specs(ContractManager):
+    """Contract specs held in memory instead of contracts.json."""
+
+    def __init__(self, contracts):
+        super().__init__()
+        self.contracts = contracts
+
+    def load_contracts(self):
+        return dict(self.contracts)
+
+    def get_registry(self):
+        return ContractRegistry(self.contracts)
+
+
+def test_contract_edits_recompute_rows():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        data_dir = os.path.join(tmp_dir, 'trading_data')
+        os.makedirs(data_dir)
+        generate_excel_fills(os.path.join(data_dir, 'trades_2025-02-07.xlsx'), date_str='2025-02-07',
+                             contracts=2, trades_per_contract=5)
+        specs = _Specs({'GC': {'tick_value': 10.0, 'tick_size': 0.1}})
+        processor = TradeProcessor(specs, trade_cache=TradeCache(os.path.join(tmp_dir, 'cache'), specs))
+        store = DailyRollupStore(processor, DataDirIndex(data_dir), os.path.join(tmp_dir, 'rollups.json'))
+        unpriced = store.month(2025, 2)['2025-02-07']['total_pnl']
+
+        specs.contracts = dict(specs.contracts, ES={'tick_value': 12.5, 'tick_size': 0.25})
+        assert store.refresh(['2025-02-07']) == ['2025-02-07'], "saved specs re-price the day"
+        assert store.month(2025, 2)['2025-02-07']['total_pnl'] != unpriced
+        assert store.verify() == []
+        print("✓ Rollup rows are recomputed when the contract specs change")
+
+
+if __name__ == "__main__":
+    test_rollups_update_incrementally()
+    test_concurrent_saves_merge()
+    test_contract_edits_recompute_rows()
+    print("\n🎉 Daily rollup checks passed")
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+
+# Checks for the per-date trades store shared by the daily view callbacks
+import os
+import sys
+import tempfile
+import time
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from benchmarks.synthetic_data import generate_rithmic_csv
+from contracts.contract_manager import ContractManager
+from data.data_index import DataDirIndex
+from data.day_store import DayTradesStore
+from data.trade_cache import TradeCache
+from data.trade_processor import TradeProcessor
+from ui.dashboard_components import DashboardComponents
+
+
+class _CountingProcessor(TradeProcessor):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.loads = 0
+
+    def load_trades_file(self, file_path):
+        self.loads += 1
+        return super().load_trades_file(file_path)
+
+
+def test_one_load_per_export_version():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        file_path = os.path.join(tmp_dir, '2025-08-22.csv')
+        generate_rithmic_csv(file_path, contracts=1, trades_per_contract=5)
+        processor = _CountingProcessor(ContractManager(), trade_cache=TradeCache(os.path.join(tmp_dir, 'cache')))
+        store = DayTradesStore(processor, DataDirIndex(tmp_dir), max_days=2)
+
+        assert store.get('2025-08-21') is None
+        data_key, trades_df = store.get('2025-08-22')
+        assert store.get('2025-08-22')[1] is trades_df
+        assert processor.loads == 1, "summary, charts and card pages share one load"
+
+        # An overwritten export is picked up
+        time.sleep(0.01)
+        generate_rithmic_csv(file_path, contracts=1, trades_per_contract=7, seed=3)
+        assert store.get('2025-08-22')[0] != data_key
+        assert processor.loads == 2
+        print("✓ Day store loads each export version once")
+
+
+def test_shell_defers_charts():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        file_path = os.path.join(tmp_dir, '2025-08-22.csv')
+        generate_rithmic_csv(file_path, contracts=1, trades_per_contract=5)
+        processor = TradeProcessor(ContractManager(), trade_cache=TradeCache(os.path.join(tmp_dir, 'cache')))
+        trades_df = processor.load_trades_file(file_path)
+
+        shell = str(DashboardComponents.create_dashboard_shell(trades_df, '2025-08-22'))
+        assert 'Graph' not in shell and "id='daily-charts'" in shell
+        assert len(DashboardComponents.create_charts(trades_df)) == 2
+        print("✓ Daily shell renders the summary and leaves charts to their own callback")
+
+
+if __name__ == "__main__":
+    test_one_load_per_export_version()
+    test_shell_defers_charts()
+    print("\n🎉 Day store checks passed")
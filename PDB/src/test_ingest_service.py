@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+
+# Checks for the background export ingestion service
+import os
+import sys
+import tempfile
+import threading
+import time
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from benchmarks.synthetic_data import generate_rithmic_csv
+from contracts.contract_manager import ContractManager
+from data.daily_rollup import DailyRollupStore
+from data.data_index import DataDirIndex
+from data.ingest_service import IngestService
+from data.trade_cache import TradeCache
+from data.trade_processor import TradeProcessor
+
+
+def _age(file_path, seconds):
+    past = time.time() - seconds
+    os.utime(file_path, (past, past))
+
+
+def test_ingests_settled_files_and_records_failures():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        data_dir = os.path.join(tmp_dir, 'trading_data')
+        os.makedirs(data_dir)
+        cache = TradeCache(os.path.join(tmp_dir, 'cache'))
+        processor = TradeProcessor(ContractManager(), trade_cache=cache)
+        rollups = DailyRollupStore(processor, DataDirIndex(data_dir), os.path.join(tmp_dir, 'rollups.json'))
+        service = IngestService(rollups, poll_interval=0.05, debounce=60)
+
+        settled = os.path.join(data_dir, '2025-08-21.csv')
+        generate_rithmic_csv(settled, date_str='2025-08-21')
+        _age(settled, 120)
+        assert service.poll_once() == ['2025-08-21']
+        assert cache.get(settled) is not None, "ingestion should warm the trades cache"
+        assert service.poll_once() == []
+
+        # A file still being written is left alone until it settles
+        landing = os.path.join(data_dir, '2025-08-22.csv')
+        generate_rithmic_csv(landing, date_str='2025-08-22')
+        assert service.poll_once() == []
+        _age(landing, 120)
+        assert service.poll_once() == ['2025-08-22']
+
+        broken = os.path.join(data_dir, '2025-08-25.xlsx')
+        with open(broken, 'w') as f:
+            f.write('not a spreadsheet')
+        _age(broken, 120)
+        assert service.poll_once() == ['2025-08-25']
+        assert service.failure_for('2025-08-25')
+        assert service.failure_for('2025-08-22') is None
+        assert list(service.failures()) == ['2025-08-25']
+
+        # The thread runs the same passes in the background
+        service.start()
+        service.stop(timeout=5)
+        print("✓ Settled exports are ingested once and failures are recorded")
+
+
+class _GatedProcessor(TradeProcessor):
+    """Holds the parse of one export until released."""
+
+    def __init__(self, *args, gated=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.gated = gated
+        self.started = threading.Event()
+        self.release = threading.Event()
+
+    def load_trades_file(self, file_path, use_cache=True):
+        if os.path.basename(file_path) == self.gated:
+            self.started.set()
+            self.release.wait(10)
+        return super().load_trades_file(file_path, use_cache)
+
+
+def test_backfill_does_not_block_reads():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        data_dir = os.path.join(tmp_dir, 'trading_data')
+        os.makedirs(data_dir)
+        for day in ('2025-07-09', '2025-07-10', '2025-07-11', '2025-08-21'):
+            file_path = os.path.join(data_dir, f'{day}.csv')
+            generate_rithmic_csv(file_path, date_str=day, contracts=1)
+            _age(file_path, 120)
+        processor = _GatedProcessor(ContractManager(), trade_cache=TradeCache(os.path.join(tmp_dir, 'cache')),
+                                    gated='2025-07-11.csv')
+        rollups = DailyRollupStore(processor, DataDirIndex(data_dir), os.path.join(tmp_dir, 'rollups.json'))
+        assert list(rollups.month(2025, 8)) == ['2025-08-21']
+        service = IngestService(rollups, debounce=60, batch_size=2)
+
+        backfill = threading.Thread(target=service.poll_once)
+        backfill.start()
+        try:
+            assert processor.started.wait(10)
+            reader = threading.Thread(target=rollups.month, args=(2025, 8))
+            reader.start()
+            reader.join(2)
+            assert not reader.is_alive(), "the monthly view is not held up by the backfill's parse"
+            reopened = DailyRollupStore(processor, rollups.data_index, rollups.rollup_file)
+            assert reopened.errors() == {} and sorted(reopened._rows) == ['2025-07-09', '2025-07-10', '2025-08-21'], \
+                "finished batches are saved while the backfill runs"
+        finally:
+            processor.release.set()
+            backfill.join(10)
+        assert list(rollups.month(2025, 7)) == ['2025-07-09', '2025-07-10', '2025-07-11']
+        print("✓ Backfills save in batches and parse without blocking reads")
+
+
+if __name__ == "__main__":
+    test_ingests_settled_files_and_records_failures()
+    test_backfill_does_not_block_reads()
+    print("\n🎉 Ingest service checks passed")
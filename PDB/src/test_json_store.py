@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+
+# Checks for the mtime-validated JSON store behind TradeNoteManager
+import json
+import os
+import sys
+import tempfile
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from notes.json_store import JsonStore
+
+
+def test_reads_once_and_indexes_by_date():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        file_path = os.path.join(tmp_dir, 'trade_colors.json')
+        with open(file_path, 'w') as f:
+            json.dump({'2025-08-05_ESU5_a': 'good', '2025-08-06_CLU5_b': 'bad'}, f)
+
+        store = JsonStore(file_path)
+        assert store.for_date('2025-08-05') == {'2025-08-05_ESU5_a': 'good'}
+        assert store.for_date('2025-08-07') == {}
+
+        signature = store._signature
+        assert store.get_many(['2025-08-06_CLU5_b', 'missing'], 'none') == {
+            '2025-08-06_CLU5_b': 'bad', 'missing': 'none'}
+        assert store._signature == signature
+        print("✓ Store indexes keys by date prefix")
+
+
+def test_update_writes_once_and_picks_up_external_edits():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        file_path = os.path.join(tmp_dir, 'trade_notes.json')
+        store = JsonStore(file_path)
+        assert store.all() == {}
+
+        store.update({'2025-08-05_ESU5_a': 'note a', '2025-08-05_ESU5_b': 'note b'})
+        with open(file_path) as f:
+            assert json.load(f) == {'2025-08-05_ESU5_a': 'note a', '2025-08-05_ESU5_b': 'note b'}
+        assert sorted(os.listdir(tmp_dir)) == ['trade_notes.json', 'trade_notes.json.lock'], "no temp files left"
+
+        # A write from another process is noticed through mtime/size
+        with open(file_path, 'w') as f:
+            json.dump({'2025-08-06_CLU5_c': 'edited elsewhere'}, f)
+        os.utime(file_path, ns=(0, 0))
+        assert store.for_date('2025-08-05') == {}
+        assert store.get('2025-08-06_CLU5_c') == 'edited elsewhere'
+
+        store.delete('2025-08-06_CLU5_c')
+        assert store.for_date('2025-08-06') == {}
+        print("✓ Store writes atomically and reloads on external changes")
+
+
+def test_keeps_the_file_layout():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        file_path = os.path.join(tmp_dir, 'trading_notes.json')
+        store = JsonStore(file_path, indent=None)
+        store.update({'2025-08-05': 'daily note'})
+        with open(file_path) as f:
+            assert f.read() == '{"2025-08-05": "daily note"}'
+        print("✓ Store keeps a compact file compact")
+
+
+def test_keeps_the_file_mode():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        file_path = os.path.join(tmp_dir, 'trade_colors.json')
+        store = JsonStore(file_path)
+        store.update({'2025-08-05_ESU5_a': 'good'})
+        umask = os.umask(0)
+        os.umask(umask)
+        assert os.stat(file_path).st_mode & 0o777 == 0o666 & ~umask, "new files follow the umask"
+
+        os.chmod(file_path, 0o640)
+        store.update({'2025-08-05_ESU5_b': 'bad'})
+        assert os.stat(file_path).st_mode & 0o777 == 0o640, "rewrites keep the existing mode"
+        print("✓ Store keeps the journal file's permissions")
+
+
+def test_rename_skips_identities_and_rejects_chains():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        store = JsonStore(os.path.join(tmp_dir, 'trade_colors.json'))
+        store.update({'a': 'keep', 'b': 'old', 'c': 'saved', 'd': 'first', 'e': 'second'})
+        store.rename({'a': 'a', 'b': 'c', 'd': 'f', 'e': 'f'})
+        assert store.all() == {'a': 'keep', 'c': 'saved', 'f': 'first'}
+
+        try:
+            store.rename({'a': 'c', 'c': 'g'})
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("chained renames are rejected")
+        assert store.all() == {'a': 'keep', 'c': 'saved', 'f': 'first'}
+        print("✓ Rename keeps identity pairs, lets saved keys win and rejects chains")
+
+
+if __name__ == "__main__":
+    test_reads_once_and_indexes_by_date()
+    test_update_writes_once_and_picks_up_external_edits()
+    test_keeps_the_file_layout()
+    test_keeps_the_file_mode()
+    test_rename_skips_identities_and_rejects_chains()
+    print("\n🎉 JSON store checks passed")
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+
+# Checks for stage latency metrics and request profiling
+import os
+import json
+import pstats
+import subprocess
+import sys
+import tempfile
+import time
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from flask import Flask
+
+from monitoring.profiling import RequestProfiler
+from monitoring.routes import register_monitoring_routes
+from monitoring.timing import LatencyRegistry, MetricsPublisher, render_prometheus
+
+
+def test_registry_quantiles_and_prometheus_text():
+    registry = LatencyRegistry(window=100)
+    for ms in range(1, 201):
+        registry.observe('callback.update_dashboard', ms / 1000)
+    stats = registry.snapshot()['callback.update_dashboard']
+    assert stats['count'] == 200, "count is all-time"
+    assert abs(stats['sum'] - sum(range(1, 201)) / 1000) < 1e-9
+    assert 0.149 < stats['p50'] < 0.152, "quantiles cover the rolling window only"
+    assert stats['p99'] <= 0.2
+
+    text = registry.render_prometheus()
+    assert '# TYPE pdb_stage_duration_seconds summary' in text
+    assert 'pdb_stage_duration_seconds{stage="callback.update_dashboard",quantile="0.95"}' in text
+    assert 'pdb_stage_duration_seconds_count{stage="callback.update_dashboard"} 200' in text
+    print("✓ Registry reports rolling quantiles and all-time count/sum")
+
+
+def test_profiler_keeps_slowest():
+    profiler = RequestProfiler(keep=2)
+    for seconds in (0.001, 0.03, 0.01, 0.02):
+        token = profiler.start()
+        time.sleep(seconds)
+        profiler.stop(token, f'sleep {seconds}')
+    kept = profiler.profiles()
+    assert [entry['label'] for entry in kept] == ['sleep 0.03', 'sleep 0.02']
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, 'slowest.prof')
+        with open(path, 'wb') as f:
+            f.write(profiler.dump(kept[0]['id']))
+        assert pstats.Stats(path).total_calls > 0, "dumps load with pstats"
+    print("✓ Profiler retains the slowest requests as pstats dumps")
+
+
+def test_routes():
+    server = Flask(__name__)
+    registry = LatencyRegistry()
+    registry.observe('dashboard.create_charts', 0.05)
+    profiler = RequestProfiler(keep=5)
+    register_monitoring_routes(server, registry=registry, profiler=profiler, allow_remote=False)
+
+    @server.route('/_dash-update-component', methods=['POST'])
+    def fake_callback():
+        return '{}'
+
+    client = server.test_client()
+    response = client.get('/metrics')
+    assert response.status_code == 200 and b'dashboard.create_charts' in response.data
+    assert client.get('/metrics', environ_base={'REMOTE_ADDR': '10.0.0.2'}).status_code == 403
+
+    client.post('/_dash-update-component', json={'output': 'daily-charts.children'})
+    profiles = client.get('/debug/profiles').get_json()
+    assert profiles[0]['label'] == 'daily-charts.children'
+    assert client.get(f"/debug/profiles/{profiles[0]['id']}.prof").status_code == 200
+    assert client.get('/debug/profiles/999.prof').status_code == 404
+    print("✓ /metrics and /debug/profiles are served to local clients")
+
+
+def test_workers_share_metrics():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        registry = LatencyRegistry()
+        registry.observe('callback.update_dashboard', 0.2)
+        publisher = MetricsPublisher(tmp_dir, registry)
+
+        # A sibling worker's published snapshot, and one left by a worker that has exited
+        sibling = LatencyRegistry()
+        sibling.observe('callback.update_dashboard', 0.4)
+        with open(os.path.join(tmp_dir, f'{os.getppid()}.json'), 'w') as f:
+            json.dump(sibling.snapshot(), f)
+        exited = subprocess.Popen([sys.executable, '-c', 'pass'])
+        exited.wait()
+        with open(os.path.join(tmp_dir, f'{exited.pid}.json'), 'w') as f:
+            json.dump(sibling.snapshot(), f)
+
+        snapshots = publisher.snapshots()
+        assert sorted(snapshots) == sorted([os.getpid(), os.getppid()])
+        assert not os.path.exists(os.path.join(tmp_dir, f'{exited.pid}.json')), "dead workers' files are removed"
+        text = render_prometheus(snapshots)
+        assert (f'pdb_stage_duration_seconds_count{{stage="callback.update_dashboard",worker="{os.getpid()}"}} 1'
+                in text)
+        assert f'worker="{os.getppid()}"' in text
+        assert 'worker=' not in registry.render_prometheus(), "a single process keeps unlabelled series"
+        print("✓ Workers publish their metrics and /metrics renders them all, labelled by worker")
+
+
+if __name__ == "__main__":
+    test_registry_quantiles_and_prometheus_text()
+    test_profiler_keeps_slowest()
+    test_routes()
+    test_workers_share_metrics()
+    print("\n🎉 Monitoring checks passed")
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+
+# Checks for the pipeline benchmark harness and its synthetic data generator
+import os
+import sys
+import tempfile
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from benchmarks.pipeline_bench import compare_results, run_benchmarks
+from benchmarks.synthetic_data import generate_dataset
+from contracts.contract_manager import ContractManager
+from data.trade_cache import TradeCache
+from data.trade_processor import TradeProcessor
+
+
+def test_generated_days_parse():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        written = generate_dataset(tmp_dir, start_date='2024-06-07', days=4, contracts=2, fills_per_day=60,
+                                   excel_every=2)
+        assert [date_str for date_str, _ in written] == ['2024-06-07', '2024-06-10', '2024-06-11', '2024-06-12']
+        assert sum(path.endswith('.xlsx') for _, path in written) == 2
+        processor = TradeProcessor(ContractManager(), trade_cache=TradeCache(os.path.join(tmp_dir, 'cache')))
+        for _, path in written:
+            trades_df = processor.parse_trades_file(path)
+            assert len(trades_df) > 0 and trades_df['pnl'].notna().all()
+        print("✓ Synthetic CSV and Excel days parse into trades")
+
+
+def test_run_and_compare():
+    report = run_benchmarks(days=3, contracts=2, fills_per_day=40, excel_every=2, repeat=1)
+    assert set(report['results']) == {
+        'calculate_trades_csv_rithmic', 'calculate_trades', 'get_monthly_data_cold', 'get_monthly_data_warm',
+        'create_dashboard', 'create_monthly_summary'
+    }
+    assert all(result['best_s'] > 0 and result['peak_mb'] >= 0 for result in report['results'].values())
+
+    slower = {'results': {stage: dict(result, best_s=result['best_s'] * 2 + 0.01)
+                          for stage, result in report['results'].items()}}
+    assert not any(row[-1] for row in compare_results(report, report))
+    regressed = {row[0] for row in compare_results(report, slower) if row[-1]}
+    assert regressed == set(report['results'])
+    print("✓ Benchmark run records every stage and comparisons flag regressions")
+
+
+if __name__ == "__main__":
+    test_generated_days_parse()
+    test_run_and_compare()
+    print("\n🎉 Pipeline benchmark checks passed")
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+
+# Checks for the month-partitioned index of rated trades
+import os
+import sys
+import tempfile
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from benchmarks.synthetic_data import generate_rithmic_csv
+from contracts.contract_manager import ContractManager
+from data.data_index import DataDirIndex
+from data.quality_index import QualityIndex
+from data.trade_cache import TradeCache
+from data.trade_processor import TradeProcessor
+from notes.trade_note_manager import TradeNoteManager
+
+
+class _CountingProcessor(TradeProcessor):
+    loads = 0
+
+    def load_trades_file(self, file_path, use_cache=True):
+        self.loads += 1
+        return super().load_trades_file(file_path, use_cache)
+
+
+def _setup(tmp_dir):
+    data_dir = os.path.join(tmp_dir, 'trading_data')
+    os.makedirs(data_dir)
+    for seed, day in enumerate(('2025-08-21', '2025-08-22')):
+        generate_rithmic_csv(os.path.join(data_dir, f'{day}.csv'), date_str=day, seed=seed)
+    processor = _CountingProcessor(ContractManager(), trade_cache=TradeCache(os.path.join(tmp_dir, 'cache')))
+    notes = TradeNoteManager(journal_dir=tmp_dir)
+    index = QualityIndex(processor, DataDirIndex(data_dir), os.path.join(tmp_dir, 'quality_index.json'), notes)
+    day_ids = {day: notes.trade_ids(processor.load_trades_file(os.path.join(data_dir, f'{day}.csv')), day)
+               for day in ('2025-08-21', '2025-08-22')}
+    return processor, notes, index, day_ids
+
+
+def test_index_follows_saved_colors():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        processor, notes, index, day_ids = _setup(tmp_dir)
+        first, second = day_ids['2025-08-21'].iloc[2], day_ids['2025-08-22'].iloc[4]
+        colors = {first: 'good', second: 'bad', day_ids['2025-08-22'].iloc[0]: 'none'}
+        notes._colors.update(colors)
+        index.record_ratings(colors)
+
+        processor.loads = 0
+        month = index.month(2025, 8)
+        assert list(month) == [first, second] and processor.loads == 0, "reads never parse exports"
+        assert month[first]['quality'] == 'good' and month[second]['date'] == '2025-08-22'
+        trades = processor.load_trades_file(os.path.join(index.data_index.find('2025-08-22')))
+        assert month[second]['pnl'] == float(trades.loc[day_ids['2025-08-22'].index[4], 'pnl'])
+
+        notes._colors.update({first: 'none'})
+        index.record_ratings({first: 'none'})
+        assert list(index.month(2025, 8)) == [second]
+        assert index.month(2025, 9) == {}
+        assert index.verify() == []
+        print("✓ The quality index follows saved colors without parsing on read")
+
+
+def test_month_is_repaired_from_source():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        _, notes, index, day_ids = _setup(tmp_dir)
+        rated = {day_ids['2025-08-21'].iloc[1]: 'fantastic', day_ids['2025-08-22'].iloc[3]: 'attention',
+                 '2025-08-22_ESU5_20250822T010203_20250822T010204': 'good'}
+        # Colors saved without going through the index
+        notes._colors.update(rated)
+        assert index.verify() != []
+        month = index.month(2025, 8)
+        assert set(month) == set(rated) - {'2025-08-22_ESU5_20250822T010203_20250822T010204'}, \
+            "a rated ID with no matching trade is not shown"
+        assert index.verify() == []
+
+        os.remove(index.index_file)
+        assert index.rebuild() == 3
+        reopened = QualityIndex(index.trade_processor, index.data_index, index.index_file, notes)
+        assert reopened.month(2025, 8) == month
+        print("✓ Out-of-date months are repaired and the index rebuilds from source")
+
+
+def test_missing_trades_resolve_once_their_export_arrives():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        processor, notes, index, _ = _setup(tmp_dir)
+        late_export = os.path.join(tmp_dir, '2025-08-25.csv')
+        generate_rithmic_csv(late_export, date_str='2025-08-25', seed=7)
+        late_id = notes.trade_ids(processor.load_trades_file(late_export), '2025-08-25').iloc[0]
+
+        # Rated before the day's export is in the data directory
+        notes._colors.update({late_id: 'good'})
+        assert index.month(2025, 8) == {}
+        processor.loads = 0
+        assert index.month(2025, 8) == {} and processor.loads == 0, "the missing trade is not looked up again"
+
+        os.replace(late_export, os.path.join(index.data_index.data_dir, '2025-08-25.csv'))
+        month = index.month(2025, 8)
+        assert list(month) == [late_id] and month[late_id]['quality'] == 'good'
+        assert index.verify() == []
+        print("✓ Missing trades are looked up again once their export arrives")
+
+
+if __name__ == "__main__":
+    test_index_follows_saved_colors()
+    test_month_is_repaired_from_source()
+    test_missing_trades_resolve_once_their_export_arrives()
+    print("\n🎉 Quality index checks passed")
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+
+# Checks for year-to-date / custom range analytics
+import os
+import sys
+import tempfile
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from benchmarks.synthetic_data import generate_rithmic_csv
+from contracts.contract_manager import ContractManager
+from data.daily_rollup import DailyRollupStore
+from data.data_index import DataDirIndex
+from data.range_analytics import RangeAnalytics
+from data.trade_cache import TradeCache
+from data.trade_processor import TradeProcessor
+from ui.range_summary import RangeSummaryComponents
+
+DAYS = ('2025-08-18', '2025-08-19', '2025-08-22', '2025-09-02')
+
+
+def _analytics(tmp_dir):
+    for seed, day in enumerate(DAYS):
+        generate_rithmic_csv(os.path.join(tmp_dir, f'{day}.csv'), date_str=day, seed=seed)
+    with open(os.path.join(tmp_dir, '2025-08-20.xlsx'), 'w') as f:
+        f.write('not a spreadsheet')
+    processor = TradeProcessor(ContractManager(), trade_cache=TradeCache(os.path.join(tmp_dir, 'cache')))
+    index = DataDirIndex(tmp_dir)
+    rollups = DailyRollupStore(processor, index, rollup_file=os.path.join(tmp_dir, 'cache', 'rollups.json'))
+    return processor, RangeAnalytics(processor, index, rollups)
+
+
+def test_aggregates_match_per_day_loop():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        processor, analytics = _analytics(tmp_dir)
+        report = analytics.compute('2025-08-01', '2025-08-31')
+
+        days = {day: processor.load_trades_file(os.path.join(tmp_dir, f'{day}.csv')) for day in DAYS[:3]}
+        assert list(report['equity'].index) == list(days)
+        assert abs(report['totals']['total_pnl'] - sum(df['pnl'].sum() for df in days.values())) < 1e-6
+        assert report['totals']['trade_count'] == sum(len(df) for df in days.values())
+        assert report['contracts']['trades'].sum() == report['totals']['trade_count']
+        assert report['heatmap_trades'].values.sum() == report['totals']['trade_count']
+        assert abs(report['weekday']['pnl'].sum() - report['totals']['total_pnl']) < 1e-6
+        assert abs(report['equity']['cumulative'].iloc[-1] - report['totals']['total_pnl']) < 1e-6
+        assert list(report['errors']) == ['2025-08-20'], "the unreadable export is reported, not fatal"
+        print("✓ Range aggregates match a per-day loop")
+
+
+def test_combined_frame_is_reused():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        _, analytics = _analytics(tmp_dir)
+        first, _ = analytics.load_trades('2025-08-01', '2025-09-30')
+        second, errors = analytics.load_trades('2025-08-01', '2025-09-30')
+        assert second is first and '2025-08-20' in errors
+        assert analytics.rollups.error_for('2025-08-20') is not None, "failures are recorded for later loads"
+        print("✓ Unchanged ranges reuse the combined trades frame")
+
+
+def test_presets():
+    from datetime import date
+    today = date(2025, 9, 4)
+    assert RangeSummaryComponents.resolve_range('ytd', today=today) == ('2025-01-01', '2025-09-04')
+    assert RangeSummaryComponents.resolve_range('last-30', today=today) == ('2025-08-05', '2025-09-04')
+    assert RangeSummaryComponents.resolve_range('custom', '2025-03-01T00:00:00', '2025-03-31', today=today) == \
+        ('2025-03-01', '2025-03-31')
+    print("✓ Range presets resolve to dates")
+
+
+if __name__ == "__main__":
+    test_aggregates_match_per_day_loop()
+    test_combined_frame_is_reused()
+    test_presets()
+    print("\n🎉 Range analytics checks passed")
@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+
+# Checks for the LRU cache of rendered daily dashboards
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from notes.trade_note_manager import TradeNoteManager
+from ui.render_cache import RenderCache
+
+
+def test_lru_bound_and_counters():
+    cache = RenderCache(max_entries=2)
+    for date_str in ('2025-08-20', '2025-08-21'):
+        cache.put((date_str, 'data', 'rev'), f'dashboard {date_str}')
+    assert cache.get(('2025-08-20', 'data', 'rev')) == 'dashboard 2025-08-20'
+    cache.put(('2025-08-22', 'data', 'rev'), 'dashboard 2025-08-22')
+
+    # 2025-08-21 was least recently used and is evicted
+    assert cache.get(('2025-08-21', 'data', 'rev')) is None
+    assert cache.get_or_render(('2025-08-22', 'data', 'rev'), lambda: 'rendered again') == 'dashboard 2025-08-22'
+    assert cache.stats() == {'hits': 2, 'misses': 1, 'entries': 2, 'max_entries': 2}
+    print("✓ Cache is size bounded and counts hits and misses")
+
+
+def test_saves_invalidate_their_dates():
+    cache = RenderCache()
+    cache.put(('2025-08-21', 'data', 'rev'), 'dashboard 2025-08-21')
+    cache.put(('2025-08-22', 'data', 'rev'), 'dashboard 2025-08-22')
+    TradeNoteManager.add_save_listener(cache.invalidate_dates)
+    try:
+        TradeNoteManager._notify_saved(['2025-08-22_ESU5_20250822T083005_20250822T083014'])
+    finally:
+        TradeNoteManager.remove_save_listener(cache.invalidate_dates)
+    assert cache.get(('2025-08-22', 'data', 'rev')) is None
+    assert cache.get(('2025-08-21', 'data', 'rev')) == 'dashboard 2025-08-21'
+    print("✓ Saving trade analysis drops that day's rendered dashboard")
+
+
+if __name__ == "__main__":
+    test_lru_bound_and_counters()
+    test_saves_invalidate_their_dates()
+    print("\n🎉 Render cache checks passed")
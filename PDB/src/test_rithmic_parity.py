@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+
+# Parity checks: fast (columnar) Rithmic CSV parser vs the legacy line-by-line parser
+import contextlib
+import io
+import os
+import subprocess
+import sys
+import tempfile
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import pandas as pd
+
+from benchmarks.synthetic_data import generate_rithmic_csv
+from config import DATA_DIR
+from contracts.contract_manager import ContractManager
+from data.trade_processor import TradeProcessor
+
+
+def _assert_parsers_agree(file_path, label):
+    legacy = TradeProcessor(ContractManager(), csv_parser='legacy')
+    fast = TradeProcessor(ContractManager(), csv_parser='fast')
+    with contextlib.redirect_stdout(io.StringIO()):
+        expected = legacy.calculate_trades_csv_rithmic(file_path)
+        actual = fast.calculate_trades_csv_rithmic(file_path)
+    pd.testing.assert_frame_equal(actual, expected, check_exact=True)
+    print(f"✓ {label}: {len(actual)} trades match")
+
+
+def test_trading_data_csv_parity():
+    csv_files = sorted(f for f in os.listdir(DATA_DIR) if f.endswith('.csv'))
+    assert csv_files, "No CSV fixtures found"
+    for filename in csv_files:
+        _assert_parsers_agree(os.path.join(DATA_DIR, filename), filename)
+
+
+def test_synthetic_export_parity():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        file_path = os.path.join(tmp_dir, '2025-08-22.csv')
+        generate_rithmic_csv(file_path, contracts=6, trades_per_contract=40, scale_out_depth=5, seed=7)
+        _assert_parsers_agree(file_path, 'synthetic multi-contract export')
+
+
+def test_unknown_parser_is_rejected():
+    try:
+        TradeProcessor(ContractManager(), csv_parser='fsat')
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("an unknown csv_parser is rejected")
+
+    env = dict(os.environ, PDB_RITHMIC_CSV_PARSER='fsat')
+    result = subprocess.run([sys.executable, '-c', 'import config'], cwd=os.path.dirname(os.path.abspath(__file__)),
+                            env=env, capture_output=True, text=True)
+    assert result.returncode != 0 and 'PDB_RITHMIC_CSV_PARSER' in result.stderr
+    print("✓ Unknown Rithmic parser names are rejected instead of falling back")
+
+
+if __name__ == "__main__":
+    test_trading_data_csv_parity()
+    test_synthetic_export_parity()
+    test_unknown_parser_is_rejected()
+    print("\n🎉 Rithmic parser parity checks passed")
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+
+# Checks for the optional SQLite journal backend
+import json
+import os
+import sys
+import tempfile
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from config import PDB_DIR
+from notes.json_store import JsonStore
+from storage.sqlite_journal import SqliteJournal
+
+
+def _load_json(file_name):
+    try:
+        with open(os.path.join(PDB_DIR, file_name)) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+
+def test_migration_and_export_round_trip():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        journal = SqliteJournal(os.path.join(tmp_dir, 'journal.db'))
+        journal.migrate_from_json()
+        assert journal.migrate_from_json() == {}, "migration should only run once"
+
+        colors = journal.trade_table('trade_colors')
+        assert colors.all() == _load_json('trade_colors.json')
+
+        out_dir = os.path.join(tmp_dir, 'export')
+        journal.export_to_json(out_dir)
+        for file_name in ('trading_notes.json', 'trade_notes.json', 'trade_colors.json'):
+            with open(os.path.join(out_dir, file_name)) as f:
+                assert json.load(f) == _load_json(file_name), file_name
+        print("✓ JSON files migrate into SQLite and export back unchanged")
+
+
+def test_trade_table_upserts_and_range_scans():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        journal = SqliteJournal(os.path.join(tmp_dir, 'journal.db'))
+        colors = journal.trade_table('trade_colors')
+        colors.update({'2025-08-29_ESU5_a': 'good', '2025-09-01_CLV5_b': 'bad'})
+        colors.update({'2025-08-29_ESU5_a': 'fantastic'})
+
+        assert colors.between('2025-08-01', '2025-08-31') == {'2025-08-29_ESU5_a': 'fantastic'}
+        assert colors.for_date('2025-09-01') == {'2025-09-01_CLV5_b': 'bad'}
+        assert colors.get_many(['2025-09-01_CLV5_b', 'missing'], 'none') == {
+            '2025-09-01_CLV5_b': 'bad', 'missing': 'none'}
+
+        colors.delete('2025-09-01_CLV5_b')
+        assert colors.get('2025-09-01_CLV5_b', 'none') == 'none'
+
+        journal.save_daily_note('2025-08-29', 'first')
+        journal.save_daily_note('2025-08-29', 'second')
+        assert journal.load_daily_note('2025-08-29') == 'second'
+        print("✓ Trade tables upsert single rows and scan date ranges")
+
+
+def test_rename_matches_the_json_store():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        colors = SqliteJournal(os.path.join(tmp_dir, 'journal.db')).trade_table('trade_colors')
+        store = JsonStore(os.path.join(tmp_dir, 'trade_colors.json'))
+        rows = {'a': 'keep', 'b': 'old', 'c': 'saved', 'd': 'first', 'e': 'second'}
+        mapping = {'a': 'a', 'b': 'c', 'd': 'f', 'e': 'f'}
+        for backend in (colors, store):
+            backend.update(rows)
+            backend.rename(mapping)
+            try:
+                backend.rename({'a': 'c', 'c': 'g'})
+            except ValueError:
+                pass
+            else:
+                raise AssertionError("chained renames are rejected")
+        assert colors.all() == store.all() == {'a': 'keep', 'c': 'saved', 'f': 'first'}
+        print("✓ SQLite renames agree with the JSON store")
+
+
+if __name__ == "__main__":
+    test_migration_and_export_round_trip()
+    test_trade_table_upserts_and_range_scans()
+    test_rename_matches_the_json_store()
+    print("\n🎉 SQLite journal checks passed")
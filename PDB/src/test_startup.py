@@ -0,0 +1,28 @@
+#!/usr/bin/env python3
+
+# Checks for dashboard cold start: lazy imports and the time-to-first-response budget
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from benchmarks.startup_bench import check_budget, import_breakdown, run_startup_bench
+
+
+def test_first_response_within_budget():
+    report = run_startup_bench(repeat=1, top=5)
+    assert report['eager_modules'] == [], f"loaded before the first response: {report['eager_modules']}"
+    assert check_budget(report) == [], check_budget(report)
+    print(f"✓ First response in {report['best_first_response_s']:.2f}s without pandas/plotly loaded")
+
+
+def test_import_breakdown():
+    imports = import_breakdown('data.trade_processor', top=10)
+    assert imports['total_s'] > 0 and len(imports['slowest_modules']) == 10
+    assert 'pandas' in dict(imports['by_package']), "the parser's pandas import shows up in its breakdown"
+    print("✓ Import-time breakdown is reported per package and module")
+
+
+if __name__ == "__main__":
+    test_first_response_within_budget()
+    test_import_breakdown()
+    print("\n🎉 Startup checks passed")
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+
+# Checks for the vectorized trade analytics (drawdown, expectancy, streaks, R-multiples)
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import numpy as np
+import pandas as pd
+
+from data.trade_analytics import compute_trade_metrics, rolling_metrics
+
+
+def _loop_reference(pnl):
+    """Straightforward per-trade loop the vectorized metrics must agree with."""
+    equity = peak = 0.0
+    max_drawdown = 0.0
+    win_streak = loss_streak = best_win = best_loss = 0
+    for value in pnl:
+        equity += value
+        peak = max(peak, equity)
+        max_drawdown = min(max_drawdown, equity - peak)
+        win_streak = win_streak + 1 if value > 0 else 0
+        loss_streak = loss_streak + 1 if value < 0 else 0
+        best_win = max(best_win, win_streak)
+        best_loss = max(best_loss, loss_streak)
+    wins = [value for value in pnl if value > 0]
+    losses = [-value for value in pnl if value < 0]
+    return {
+        'max_drawdown': max_drawdown,
+        'longest_win_streak': best_win,
+        'longest_loss_streak': best_loss,
+        'profit_factor': sum(wins) / sum(losses),
+        'expectancy': sum(pnl) / len(pnl),
+        'avg_win': sum(wins) / len(wins),
+        'avg_loss': sum(losses) / len(losses)
+    }
+
+
+def _random_trades(n, seed=0):
+    rng = np.random.default_rng(seed)
+    pnl = np.round(rng.normal(5, 60, n) / 12.5) * 12.5
+    entry_price = 5000 + rng.normal(0, 10, n)
+    return pd.DataFrame({
+        'exit_time': pd.date_range('2025-01-02 09:30', periods=n, freq='min'),
+        'pnl': pnl,
+        'entry_price': entry_price,
+        'exit_price': entry_price + pnl / 50,
+        'direction': 'Long'
+    })
+
+
+def test_metrics_match_loop():
+    trades_df = _random_trades(2000)
+    metrics = compute_trade_metrics(trades_df)
+    reference = _loop_reference(trades_df['pnl'].tolist())
+    for key, expected in reference.items():
+        assert abs(metrics[key] - expected) < 1e-6, (key, metrics[key], expected)
+    assert np.allclose(metrics['per_trade']['r_multiple'] * metrics['avg_loss'], trades_df['pnl'])
+    assert np.allclose(metrics['per_trade']['points'], trades_df['pnl'] / 50)
+    print("✓ Drawdown, profit factor, expectancy and streaks match a per-trade loop")
+
+
+def test_drawdown_duration_and_order():
+    trades_df = pd.DataFrame({
+        'exit_time': pd.to_datetime(['2025-01-02 10:00', '2025-01-02 09:00', '2025-01-02 11:00',
+                                     '2025-01-02 12:00', '2025-01-02 13:00']),
+        'pnl': [-50.0, 100.0, 25.0, -10.0, 80.0]
+    })
+    metrics = compute_trade_metrics(trades_df)
+    # Exit order: +100, -50, +25, -10, +80 -> underwater for 3 trades from 09:00 until 13:00
+    assert metrics['max_drawdown'] == -50.0
+    assert metrics['max_drawdown_trades'] == 3
+    assert metrics['max_drawdown_duration'] == pd.Timedelta(hours=4)
+    print("✓ Drawdown follows exit-time order and reports its duration")
+
+
+def test_rolling_window():
+    pnl = _random_trades(300, seed=1)['pnl'].to_numpy()
+    rolling = rolling_metrics(pnl, window=20)
+    expected = pd.Series(pnl).rolling(20, min_periods=1).mean()
+    assert np.allclose(rolling['expectancy'], expected)
+    expected_win_rate = pd.Series(pnl > 0).rolling(20, min_periods=1).mean() * 100
+    assert np.allclose(rolling['win_rate'], expected_win_rate)
+    print("✓ Rolling metrics match pandas rolling windows")
+
+
+if __name__ == "__main__":
+    test_metrics_match_loop()
+    test_drawdown_duration_and_order()
+    test_rolling_window()
+    print("\n🎉 Trade analytics checks passed")
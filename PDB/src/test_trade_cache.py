@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+
+# Checks for the on-disk parsed trades cache
+import os
+import sys
+import tempfile
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from benchmarks.synthetic_data import generate_excel_fills, generate_rithmic_csv
+from contracts.contract_manager import ContractManager
+from contracts.contract_registry import ContractRegistry
+from data.trade_cache import TradeCache
+from data.trade_processor import TradeProcessor
+
+
+class _Specs(ContractManager):
+    """Contract specs held in memory instead of contracts.json."""
+
+    def __init__(self, contracts):
+        super().__init__()
+        self.contracts = contracts
+
+    def load_contracts(self):
+        return dict(self.contracts)
+
+    def get_registry(self):
+        return ContractRegistry(self.contracts)
+
+
+def test_excel_entries_follow_contract_specs():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        excel_path = os.path.join(tmp_dir, 'trades_2025-02-07.xlsx')
+        generate_excel_fills(excel_path, date_str='2025-02-07', contracts=2, trades_per_contract=5)
+        csv_path = os.path.join(tmp_dir, '2025-02-07.csv')
+        generate_rithmic_csv(csv_path, date_str='2025-02-07', contracts=1, trades_per_contract=5)
+
+        specs = _Specs({'GC': {'tick_value': 10.0, 'tick_size': 0.1}})
+        cache = TradeCache(os.path.join(tmp_dir, 'cache'), contract_manager=specs)
+        processor = TradeProcessor(specs, trade_cache=cache)
+        unpriced = processor.load_trades_file(excel_path)
+        csv_key = cache.cache_key(csv_path)
+
+        # The Contract Manager tab adds the missing ES specs
+        specs.contracts = dict(specs.contracts, ES={'tick_value': 12.5, 'tick_size': 0.25})
+        assert cache.get(excel_path) is None, "an Excel entry priced with the old specs misses"
+        repriced = processor.load_trades_file(excel_path)
+        assert repriced['pnl'].sum() != unpriced['pnl'].sum()
+        assert repriced.equals(processor.parse_trades_file(excel_path))
+        assert cache.cache_key(csv_path) == csv_key, "Rithmic exports carry their own P&L"
+        print("✓ Cached Excel trades are re-priced when the contract specs change")
+
+
+if __name__ == "__main__":
+    test_excel_entries_follow_contract_specs()
+    print("\n🎉 Trade cache checks passed")
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+
+# Checks for paginated trade-card rendering in the daily view
+import json
+import os
+import sys
+import tempfile
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import plotly.utils
+
+from benchmarks.synthetic_data import generate_rithmic_csv
+from contracts.contract_manager import ContractManager
+from data.trade_cache import TradeCache
+from data.trade_processor import TradeProcessor
+from ui.dashboard_components import DashboardComponents
+
+
+def _components(component, id_type):
+    """Every component in the tree whose pattern-matching id has the given type."""
+    found = []
+    component_id = getattr(component, 'id', None)
+    if isinstance(component_id, dict) and component_id.get('type') == id_type:
+        found.append(component)
+    children = getattr(component, 'children', None)
+    if not isinstance(children, (list, tuple)):
+        children = [children]
+    for child in children:
+        if hasattr(child, 'to_plotly_json'):
+            found.extend(_components(child, id_type))
+    return found
+
+
+def _find_ids(component, id_type):
+    return len(_components(component, id_type))
+
+
+def _synthetic_trades(tmp_dir):
+    file_path = os.path.join(tmp_dir, '2025-08-22.csv')
+    generate_rithmic_csv(file_path, contracts=2, trades_per_contract=25)
+    processor = TradeProcessor(ContractManager(), trade_cache=TradeCache(os.path.join(tmp_dir, 'cache')))
+    return processor.load_trades_file(file_path)
+
+
+def test_dashboard_defers_cards_and_pages_them():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        trades_df = _synthetic_trades(tmp_dir)
+        dashboard = DashboardComponents.create_dashboard(trades_df, '', '2025-08-22')
+        assert _find_ids(dashboard, 'trade-card') == 0, "cards load after the summary and charts"
+
+        cards, label, page = DashboardComponents.create_trade_cards_page(trades_df, '2025-08-22', 0, page_size=20)
+        assert _find_ids(cards, 'trade-card') == 20
+        assert label == f"Trades 1–20 of {len(trades_df)}"
+
+        last_page = DashboardComponents.trade_card_page_count(len(trades_df), 20) - 1
+        cards, label, page = DashboardComponents.create_trade_cards_page(trades_df, '2025-08-22', 99, page_size=20)
+        assert page == last_page
+        assert _find_ids(cards, 'trade-card') == len(trades_df) - 20 * last_page
+        print("✓ Trade cards are rendered one page at a time")
+
+
+def test_drafts_prefill_cards():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        trades_df = _synthetic_trades(tmp_dir)
+        cards, _, _ = DashboardComponents.create_trade_cards_page(trades_df, '2025-08-22', 0, page_size=5)
+        trade_id = _components(cards, 'trade-id')[0].children
+
+        drafts = {trade_id: {'note': 'unsaved thought', 'color': 'good'}}
+        cards, _, _ = DashboardComponents.create_trade_cards_page(trades_df, '2025-08-22', 0, page_size=5,
+                                                                  drafts=drafts)
+        assert 'unsaved thought' in json.dumps(cards, cls=plotly.utils.PlotlyJSONEncoder)
+        print("✓ Unsaved edits from other pages are shown when paging back")
+
+
+def _update(client, output_key, outputs, inputs, state):
+    response = client.post('/_dash-update-component', json={
+        'output': output_key, 'outputs': outputs, 'inputs': inputs, 'state': state,
+        'changedPropIds': [f"{inputs[0]['id']}.{inputs[0]['property']}"]})
+    return response.get_json()['response']
+
+
+def test_drafts_stay_with_their_day():
+    import app
+    from notes.trade_note_manager import TradeNoteManager
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        dashboard = app.TradingDashboard()
+        dashboard._components['trade_note_manager'] = TradeNoteManager(journal_dir=tmp_dir)
+        client = dashboard.app.server.test_client()
+        keys = {key.split('@')[0]: key for key in dashboard.app.callback_map if 'trade-analysis-drafts' in key}
+
+        # Moving to another day clears the drafts
+        cleared = _update(client, keys['trade-analysis-drafts.data'],
+                          {'id': 'trade-analysis-drafts', 'property': 'data'},
+                          [{'id': 'current-date', 'property': 'data', 'value': '2025-08-22'}], [])
+        assert cleared['trade-analysis-drafts']['data'] == {}
+
+        # A save on one day never writes drafts made on another (notes only: colors also feed the quality index)
+        drafts = {'2025-08-22_ESU5_a': {'note': 'kept', 'color': None},
+                  '2025-08-21_ESU5_b': {'note': 'left behind', 'color': None}}
+        _update(client, keys['..save-note.n_clicks...trade-analysis-drafts.data'],
+                [{'id': 'save-note', 'property': 'n_clicks'}, {'id': 'trade-analysis-drafts', 'property': 'data'}],
+                [{'id': 'save-note', 'property': 'n_clicks', 'value': 1}],
+                [{'id': 'current-date', 'property': 'data', 'value': '2025-08-22'}, [], [], [],
+                 {'id': 'trade-analysis-drafts', 'property': 'data', 'value': drafts}])
+        manager = dashboard.trade_note_manager
+        assert manager.load_trade_notes() == {'2025-08-22_ESU5_a': 'kept'}
+        print("✓ Unsaved trade drafts stay with the day they were made on")
+
+
+if __name__ == "__main__":
+    test_dashboard_defers_cards_and_pages_them()
+    test_drafts_prefill_cards()
+    test_drafts_stay_with_their_day()
+    print("\n🎉 Trade card pagination checks passed")
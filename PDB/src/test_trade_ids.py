@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+
+# Checks for canonical trade IDs, the notes/colors join and the legacy ID migration
+import os
+import sys
+import tempfile
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from benchmarks.synthetic_data import generate_rithmic_csv
+from contracts.contract_manager import ContractManager
+from data.trade_processor import TradeProcessor
+from notes.json_store import JsonStore
+from notes.trade_note_manager import TradeNoteManager, legacy_id_mapping, legacy_trade_ids, migrate_trade_id
+from storage.sqlite_journal import SqliteJournal
+
+
+def _trades(tmp_dir, file_name='2025-08-22.csv', date_str='2025-08-22'):
+    file_path = os.path.join(tmp_dir, file_name)
+    generate_rithmic_csv(file_path, date_str=date_str, contracts=2, trades_per_contract=20)
+    return TradeProcessor(ContractManager()).load_trades_file(file_path)
+
+
+def test_vectorized_ids_match_scalar():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        trades_df = _trades(tmp_dir)
+        manager = TradeNoteManager(journal_dir=tmp_dir)
+        trade_ids = manager.trade_ids(trades_df, '2025-08-22')
+        expected = [manager.generate_trade_id('2025-08-22', row.contract, row.entry_time, row.exit_time)
+                    for row in trades_df.itertuples()]
+        assert list(trade_ids) == expected
+        assert list(trade_ids.index) == list(trades_df.index)
+        assert '"' not in expected[0] and expected[0].count('_') == 3
+        print("✓ Vectorized trade IDs match the per-trade ones")
+
+
+def test_annotate_joins_notes_and_colors():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        trades_df = _trades(tmp_dir)
+        manager = TradeNoteManager(journal_dir=tmp_dir)
+        trade_ids = manager.trade_ids(trades_df, '2025-08-22')
+        notes = {trade_ids.iloc[3]: 'chased it'}
+        colors = {trade_ids.iloc[3]: 'bad', trade_ids.iloc[5]: 'good', '2025-08-22_XX_1_2': 'good'}
+        annotated = manager.annotate(trades_df, '2025-08-22', notes, colors)
+        assert list(annotated['note']) == ['chased it' if i == 3 else '' for i in range(len(trades_df))]
+        assert annotated['color'].iloc[5] == 'good' and (annotated['color'] != 'none').sum() == 2
+        assert 'trade_id' not in trades_df.columns, "the input frame is not modified"
+        print("✓ Notes and colors are joined onto the trades frame")
+
+
+def test_legacy_ids():
+    assert migrate_trade_id('2025-08-22_"CLV5"_08-00-00_AM_08-00-29_AM') == '2025-08-22_CLV5_20250822T080000_20250822T080029'
+    assert migrate_trade_id('2025-08-22_"ESU5"_12-59-58_PM_01-00-03_PM') == '2025-08-22_ESU5_20250822T125958_20250822T130003'
+    assert migrate_trade_id('2025-08-22_"GCZ5"_11-59-00_PM_12-01-00_AM') == '2025-08-22_GCZ5_20250822T235900_20250823T000100'
+    assert migrate_trade_id('2025-08-22_CLV5_20250822T080000_20250822T080029') is None
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        store = JsonStore(os.path.join(tmp_dir, 'trade_colors.json'))
+        store.update({
+            '2025-08-22_"CLV5"_08-00-00_AM_08-00-29_AM': 'attention',
+            '2025-08-22_"ESU5"_08-30-05_AM_08-30-14_AM': 'bad',
+            '2025-08-22_ESU5_20250822T083005_20250822T083014': 'good'
+        })
+        TradeNoteManager._migrate_legacy_ids(store, load_trades=lambda date_str: None)
+        assert JsonStore(store.file_path).all() == {
+            '2025-08-22_CLV5_20250822T080000_20250822T080029': 'attention',
+            '2025-08-22_ESU5_20250822T083005_20250822T083014': 'good'
+        }, "a value saved under the new ID wins"
+        assert list(store.for_date('2025-08-22')) == list(store.all())
+
+        colors = SqliteJournal(os.path.join(tmp_dir, 'journal.db')).trade_table('trade_colors')
+        colors.update({'2025-08-22_"CLV5"_08-00-00_AM_08-00-29_AM': 'attention'})
+        TradeNoteManager._migrate_legacy_ids(colors, load_trades=lambda date_str: None)
+        assert colors.for_date('2025-08-22') == {'2025-08-22_CLV5_20250822T080000_20250822T080029': 'attention'}
+    print("✓ Legacy trade IDs are migrated once to the canonical format")
+
+
+def test_overnight_legacy_ids_follow_the_export():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        # Overnight session: the 2025-09-04 export holds trades entered on 2025-09-03
+        trades_df = _trades(tmp_dir, '2025-09-04.csv', date_str='2025-09-03')
+        assert (trades_df['entry_time'].dt.strftime('%Y-%m-%d') == '2025-09-03').all()
+        legacy_ids = legacy_trade_ids(trades_df, '2025-09-04')
+        assert legacy_ids.iloc[0].startswith('2025-09-04_"') and legacy_ids.iloc[0].endswith('M')
+
+        manager = TradeNoteManager(journal_dir=tmp_dir)
+        store = JsonStore(os.path.join(tmp_dir, 'legacy_colors.json'))
+        gone = '2025-09-04_"CLV5"_11-59-00_PM_12-01-00_AM'
+        store.update({legacy_ids.iloc[0]: 'good', legacy_ids.iloc[7]: 'bad', gone: 'attention'})
+        TradeNoteManager._migrate_legacy_ids(store, load_trades=lambda date_str: trades_df)
+
+        current_ids = manager.trade_ids(trades_df, '2025-09-04')
+        assert store.all() == {current_ids.iloc[0]: 'good', current_ids.iloc[7]: 'bad',
+                               migrate_trade_id(gone): 'attention'}
+        assert '20250903T' in current_ids.iloc[0], "the real entry date is kept"
+        assert legacy_id_mapping([current_ids.iloc[0]], lambda date_str: trades_df) == {}
+        print("✓ Overnight legacy IDs map to the trades in their export")
+
+
+if __name__ == "__main__":
+    test_vectorized_ids_match_scalar()
+    test_annotate_joins_notes_and_colors()
+    test_legacy_ids()
+    test_overnight_legacy_ids_follow_the_export()
+    print("\n🎉 Trade ID checks passed")
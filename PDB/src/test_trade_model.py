@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+
+# Checks for the slotted / column-wise trade model in classes/
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import numpy as np
+
+from classes.AT import AggregatedTrade
+from classes.TD import TradeDate
+
+
+def test_slotted_trade():
+    trade = AggregatedTrade('93880029', 16.0, 50.0, 4)
+    assert not hasattr(trade, '__dict__')
+    assert trade.to_dict() == {'entry_order_number': '93880029', 'commission_fees': 16.0,
+                               'trade_pnl': 50.0, 'fill_size': 4}
+    same = AggregatedTrade('93880029', 16.0, 50.0, 4)
+    assert trade == same and hash(trade) == hash(same) and len({trade, same}) == 1
+    print("✓ AggregatedTrade has no per-instance dict and hashes like it compares")
+
+
+def test_trade_date_columns():
+    trade_date = TradeDate('2025-08-22')
+    trade_date.add_trade('"ESU5"', AggregatedTrade('1', 8.0, -12.5, 2))
+    trade_date.add_trade('"ESU5"', AggregatedTrade('2', 8.0, 100.0, 2))
+    assert trade_date.get_trades('"ESU5"') == [AggregatedTrade('1', 8.0, -12.5, 2),
+                                               AggregatedTrade('2', 8.0, 100.0, 2)]
+    assert isinstance(trade_date.contracts['"ESU5"']['trade_pnl'], np.ndarray)
+
+    # Trades added after a read are appended to the existing columns
+    trade_date.add_trade('"ESU5"', AggregatedTrade('4', 4.0, 37.5, 1))
+    trade_date.add_trade('"CLV5"', AggregatedTrade('9', 4.0, -10.0, 1))
+    assert [trade.entry_order_number for trade in trade_date.get_trades('"ESU5"')] == ['1', '2', '4']
+    assert trade_date.get_trades('"NQU5"') == []
+    assert trade_date.trade_count() == 4
+
+    df = trade_date.trades_to_dataframe()
+    assert list(df.columns) == ['entry_order_number', 'commission_fees', 'trade_pnl', 'fill_size', 'contract']
+    assert df['contract'].tolist() == ['"ESU5"'] * 3 + ['"CLV5"']
+    assert df['trade_pnl'].sum() == 115.0
+    print("✓ TradeDate keeps trades column-wise per contract")
+
+
+if __name__ == "__main__":
+    test_slotted_trade()
+    test_trade_date_columns()
+    print("\n🎉 Trade model checks passed")
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+
+# Parity checks: vectorized calculate_trades vs the row-by-row reference implementation
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import pandas as pd
+
+from config import DATA_DIR
+from contracts.contract_manager import ContractManager
+from data.trade_processor import TradeProcessor, EXCEL_COLUMNS
+
+
+def _assert_same_trades(processor, processed_df, label):
+    expected = processor._calculate_trades_iterrows(processed_df)
+    actual = processor.calculate_trades(processed_df)
+    pd.testing.assert_frame_equal(actual, expected, check_exact=True)
+    print(f"✓ {label}: {len(actual)} trades match")
+
+
+def _synthetic_fills(rows):
+    df = pd.DataFrame(rows, columns=['date', 'time', 'contract', 'B/S', 'Size', 'Price'])
+    df['exchange'] = 'CME'
+    df['F'] = 'F'
+    df['Direct'] = 'Direct'
+    return df[EXCEL_COLUMNS]
+
+
+def test_excel_fixtures_parity():
+    processor = TradeProcessor(ContractManager())
+    checked = 0
+    for filename in sorted(os.listdir(DATA_DIR)):
+        if not filename.endswith(('.xls', '.xlsx')):
+            continue
+        df = pd.read_excel(os.path.join(DATA_DIR, filename), header=None)
+        if len(df.columns) != len(EXCEL_COLUMNS):
+            print(f"- {filename}: not a 9-column fills export, skipped")
+            continue
+        df.columns = EXCEL_COLUMNS
+        try:
+            processed_df = processor.process_raw_data(df)
+        except ValueError as e:
+            print(f"- {filename}: not a fills export ({e.__class__.__name__}), skipped")
+            continue
+        _assert_same_trades(processor, processed_df, filename)
+        checked += 1
+    assert checked > 0, "No Excel fills fixtures found"
+
+
+def test_synthetic_parity():
+    processor = TradeProcessor(ContractManager())
+    fills = _synthetic_fills([
+        # Scale in, scale out
+        ('05Feb25', '09:30:00.100', 'ES Mar25', 'B', 1, 6000.00),
+        ('05Feb25', '09:30:05.200', 'ES Mar25', 'B', 2, 6001.25),
+        ('05Feb25', '09:31:00.000', 'ES Mar25', 'S', 1, 6003.00),
+        # Interleaved second contract, short
+        ('05Feb25', '09:31:10.000', 'GC Apr25', 'S', 2, 2870.0),
+        ('05Feb25', '09:32:00.000', 'ES Mar25', 'S', 2, 6004.50),
+        ('05Feb25', '09:33:00.000', 'GC Apr25', 'B', 2, 2868.4),
+        # Flip through zero without touching it, then flatten
+        ('05Feb25', '09:40:00.000', 'ES Mar25', 'S', 2, 6010.00),
+        ('05Feb25', '09:41:00.000', 'ES Mar25', 'B', 3, 6008.00),
+        ('05Feb25', '09:42:00.000', 'ES Mar25', 'S', 1, 6009.75),
+        # Contract without specs
+        ('05Feb25', '09:50:00.000', 'ZZ Mar25', 'B', 1, 10.0),
+        ('05Feb25', '09:51:00.000', 'ZZ Mar25', 'S', 1, 11.0),
+        # Left open at the end of the session
+        ('05Feb25', '15:00:00.000', 'GC Apr25', 'B', 1, 2880.0),
+    ])
+    _assert_same_trades(processor, processor.process_raw_data(fills), 'synthetic fills')
+
+    unknown_only = _synthetic_fills([
+        ('05Feb25', '09:50:00.000', 'ZZ Mar25', 'B', 1, 10.0),
+        ('05Feb25', '09:51:00.000', 'ZZ Mar25', 'S', 1, 11.0),
+    ])
+    _assert_same_trades(processor, processor.process_raw_data(unknown_only), 'unknown contract only')
+
+    never_closed = _synthetic_fills([
+        ('05Feb25', '09:50:00.000', 'ES Mar25', 'B', 1, 6000.0),
+    ])
+    _assert_same_trades(processor, processor.process_raw_data(never_closed), 'no closed positions')
+
+
+if __name__ == "__main__":
+    test_excel_fixtures_parity()
+    test_synthetic_parity()
+    print("\n🎉 calculate_trades parity checks passed")
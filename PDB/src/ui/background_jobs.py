@@ -0,0 +1,126 @@
+import itertools
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from dash import DiskcacheManager
+from dash.background_callback.managers import BaseBackgroundCallbackManager
+from dash.background_callback.managers.diskcache_manager import _make_job_fn
+
+logger = logging.getLogger(__name__)
+
+# Cancel flags outlive their job only if it finished as it was cancelled
+CANCEL_FLAG_EXPIRE_SECONDS = 3600
+
+
+class JobCancelled(BaseException):
+    """Raised inside a job thread when it writes to the cache after being cancelled.
+
+    A BaseException, like KeyboardInterrupt, so the views' own error handling
+    does not catch it and render an error for a job nobody is waiting on.
+    """
+
+
+class _JobCache:
+    """The result cache as one job thread sees it: every write checks the job's cancel flag."""
+
+    def __init__(self, manager):
+        self.manager = manager
+
+    def set(self, key, value, **kwargs):
+        if self.manager.current_job_cancelled():
+            raise JobCancelled()
+        return self.manager.handle.set(key, value, **kwargs)
+
+
+class ThreadJobManager(DiskcacheManager):
+    """DiskcacheManager that runs background callbacks on a thread pool in the server process.
+
+    Dash's DiskcacheManager forks the threaded server for every job; a lock
+    held by another thread at that moment (a store's RLock, a logging handler)
+    stays locked in the child forever, and the child's rollup rows and range
+    frame are thrown away with it. Jobs here share the process's warm caches.
+
+    Results, progress and job state live in the diskcache, so any worker
+    process can answer the polls for a job. Threads cannot be killed, so
+    cancelling is cooperative: the job stops at its next progress report and
+    its result is never written.
+    """
+
+    def __init__(self, cache, max_workers=2):
+        # Skip DiskcacheManager.__init__: it insists on psutil and multiprocess, used only to fork and kill jobs
+        BaseBackgroundCallbackManager.__init__(self, None)
+        self.handle = cache
+        self.expire = None
+        self._executor = ThreadPoolExecutor(max_workers, thread_name_prefix='dash-job')
+        self._job_numbers = itertools.count(1)
+        self._local = threading.local()
+
+    @staticmethod
+    def _owner_key(job):
+        return f'job-owner-{job}'
+
+    @staticmethod
+    def _cancel_key(job):
+        return f'job-cancel-{job}'
+
+    def make_job_fn(self, fn, progress, key=None):
+        return _make_job_fn(fn, _JobCache(self), progress)
+
+    def call_job_fn(self, key, job_fn, args, context):
+        # Unique across the worker processes sharing the cache
+        job = os.getpid() * 1_000_000 + next(self._job_numbers)
+        self.handle.set(self._owner_key(job), os.getpid())
+        self._executor.submit(self._run, job, job_fn, key, args, context)
+        return job
+
+    def _run(self, job, job_fn, key, args, context):
+        self._local.job = job
+        try:
+            job_fn(key, self._make_progress_key(key), args, context)
+        except JobCancelled:
+            logger.debug('Background job %s cancelled', job)
+        except Exception:
+            logger.exception('Background job %s failed', job)
+        finally:
+            self._local.job = None
+            self.handle.delete(self._owner_key(job))
+            self.handle.delete(self._cancel_key(job))
+
+    def current_job_cancelled(self):
+        job = getattr(self._local, 'job', None)
+        return job is not None and self.handle.get(self._cancel_key(job)) is not None
+
+    def terminate_job(self, job):
+        if job is None:
+            return
+        job = int(job)
+        if self.handle.get(self._owner_key(job)) is not None:
+            self.handle.set(self._cancel_key(job), True, expire=CANCEL_FLAG_EXPIRE_SECONDS)
+
+    def job_running(self, job):
+        owner = self.handle.get(self._owner_key(int(job)))
+        if owner is None:
+            return False
+        if owner == os.getpid():
+            return True
+        try:
+            os.kill(owner, 0)
+        except ProcessLookupError:
+            # The worker that ran it exited without finishing the job
+            return False
+        except PermissionError:
+            pass
+        return True
+
+    def terminate_unhealthy_job(self, job):
+        job = int(job)
+        if self.handle.get(self._owner_key(job)) is not None and not self.job_running(job):
+            self.handle.delete(self._owner_key(job))
+            return True
+        return False
+
+    def shutdown(self, wait=False):
+        """Stop taking jobs (running ones finish unless cancelled)."""
+        self._executor.shutdown(wait=wait, cancel_futures=True)
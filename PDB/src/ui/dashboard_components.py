@@ -1,11 +1,16 @@
 import plotly.express as px
 from dash import html, dcc, dash_table
+from config import TRADE_CARDS_PAGE_SIZE
+from contracts.contract_manager import ContractManager
+from data.trade_analytics import compute_trade_metrics
+from monitoring.timing import timed
 from notes.trade_note_manager import TradeNoteManager
 
 
 class DashboardComponents:
     @staticmethod
-    def create_dashboard(trades_df, note='', date_str=''):
+    @timed('dashboard.create_dashboard')
+    def create_dashboard(trades_df, note='', date_str='', trade_note_manager=None):
         # Handle empty DataFrame case
         if trades_df.empty:
             return html.Div([
@@ -15,6 +20,51 @@ class DashboardComponents:
                        style={'textAlign': 'center', 'color': '#95a5a6'})
             ])
 
+        trades_df = DashboardComponents._prepare_trades(trades_df)
+
+        # Trade cards are filled in page by page by the trade-cards-page callback,
+        # so the charts and summary don't wait for (or carry) every card
+        return html.Div([
+            DashboardComponents._create_pnl_chart(trades_df),
+            DashboardComponents._create_timeline_chart(trades_df),
+            DashboardComponents._create_summary_section(trades_df),
+            DashboardComponents._create_trade_cards_container(len(trades_df))
+        ])
+
+    @staticmethod
+    @timed('dashboard.create_dashboard_shell')
+    def create_dashboard_shell(trades_df, date_str=''):
+        """Daily view with the summary filled in and placeholders for the charts and trade cards.
+
+        The daily-charts callback and the trade-cards-page callback fill the
+        placeholders afterwards, so the cheap aggregates show up first.
+        """
+        if trades_df.empty:
+            return DashboardComponents.create_dashboard(trades_df, date_str=date_str)
+
+        trades_df = DashboardComponents._prepare_trades(trades_df)
+        return html.Div([
+            dcc.Store(id='daily-view-date', data=date_str),
+            dcc.Loading(html.Div(id='daily-charts', style={'minHeight': '450px'}), type='dot'),
+            DashboardComponents._create_summary_section(trades_df),
+            DashboardComponents._create_trade_cards_container(len(trades_df))
+        ])
+
+    @staticmethod
+    @timed('dashboard.create_charts')
+    def create_charts(trades_df):
+        """P&L and timeline charts for the daily-charts placeholder."""
+        if trades_df.empty:
+            return []
+        trades_df = DashboardComponents._prepare_trades(trades_df)
+        return [
+            DashboardComponents._create_pnl_chart(trades_df),
+            DashboardComponents._create_timeline_chart(trades_df)
+        ]
+
+    @staticmethod
+    def _prepare_trades(trades_df):
+        """Sort trades by exit time and add the display/sort helper columns."""
         trades_df = trades_df.copy()
         
         # Store original datetime columns for sorting
@@ -37,11 +87,47 @@ class DashboardComponents:
         if 'exit_time' in trades_df.columns:
             trades_df['exit_time_display'] = trades_df['exit_time'].dt.strftime('%I:%M:%S %p')
 
+        return trades_df
+
+    @staticmethod
+    @timed('dashboard.create_trade_cards_page')
+    def create_trade_cards_page(trades_df, date_str, page, page_size=TRADE_CARDS_PAGE_SIZE,
+                                trade_note_manager=None, drafts=None):
+        """Render one page of trade cards. Returns (cards, page label, clamped page)."""
+        page_count = DashboardComponents.trade_card_page_count(len(trades_df), page_size)
+        page = max(0, min(page or 0, page_count - 1))
+        start = page * page_size
+        stop = min(start + page_size, len(trades_df))
+        cards = DashboardComponents._create_trade_cards(
+            DashboardComponents._prepare_trades(trades_df), date_str, trade_note_manager,
+            start=start, stop=stop, drafts=drafts
+        )
+        label = f"Trades {start + 1}–{stop} of {len(trades_df)}" if len(trades_df) else ""
+        return cards, label, page
+
+    @staticmethod
+    def trade_card_page_count(trade_count, page_size=TRADE_CARDS_PAGE_SIZE):
+        return max(1, -(-trade_count // page_size))
+
+    @staticmethod
+    def _create_trade_cards_container(trade_count, page_size=TRADE_CARDS_PAGE_SIZE):
+        page_count = DashboardComponents.trade_card_page_count(trade_count, page_size)
+        pager_style = {'display': 'flex', 'alignItems': 'center', 'justifyContent': 'center', 'gap': '16px',
+                       'marginBottom': '16px'}
+        if page_count <= 1:
+            pager_style['display'] = 'none'
         return html.Div([
-            DashboardComponents._create_pnl_chart(trades_df),
-            DashboardComponents._create_timeline_chart(trades_df),
-            DashboardComponents._create_summary_section(trades_df),
-            DashboardComponents._create_trade_cards(trades_df, date_str)
+            html.H3("🔍 Individual Trade Analysis", 
+                   className='fade-in',
+                   style={'marginBottom': '24px', 'color': 'var(--text-primary)'}),
+            dcc.Store(id='trade-cards-page', data=0),
+            dcc.Store(id='trade-cards-page-count', data=page_count),
+            html.Div([
+                html.Button('‹ Previous', id='trade-cards-prev', n_clicks=0),
+                html.Span(id='trade-cards-page-label', style={'color': 'var(--text-secondary)'}),
+                html.Button('Next ›', id='trade-cards-next', n_clicks=0)
+            ], style=pager_style),
+            dcc.Loading(html.Div(id='trade-cards-page-content'), type='dot')
         ])
 
     @staticmethod
@@ -149,10 +235,11 @@ class DashboardComponents:
                       style={'fontSize': '16px', 'color': 'var(--text-tertiary)'})
             ], className='trading-card')
 
-        total_pnl = trades_df['pnl'].sum()
-        winning_trades = len(trades_df[trades_df['pnl'] > 0]) if 'pnl' in trades_df.columns else 0
-        losing_trades = len(trades_df[trades_df['pnl'] < 0]) if 'pnl' in trades_df.columns else 0
-        win_rate = (winning_trades / len(trades_df) * 100) if len(trades_df) > 0 else 0
+        metrics = compute_trade_metrics(trades_df)
+        total_pnl = metrics['total_pnl']
+        winning_trades = metrics['wins']
+        losing_trades = metrics['losses']
+        win_rate = metrics['win_rate']
         
         # Create modern stats cards
         stats_cards = [
@@ -186,14 +273,14 @@ class DashboardComponents:
                 ], className='stats-card')
             ], className='col-md-3')
         ]
+        edge_cards = DashboardComponents._create_edge_cards(metrics)
 
         # Add per-contract breakdown if available
         contract_breakdown = []
         if 'contract' in trades_df.columns:
             try:
-                for contract in trades_df['contract'].str.split().str[0].unique():
-                    contract_trades = trades_df[trades_df['contract'].str.startswith(contract)]
-                    contract_pnl = contract_trades['pnl'].sum()
+                roots = ContractManager().get_registry().resolve_roots(trades_df['contract'])
+                for contract, contract_pnl in trades_df['pnl'].groupby(roots, sort=False).sum().items():
                     contract_breakdown.append(
                         html.Div([
                             html.Span(f"{contract}: ", 
@@ -209,6 +296,7 @@ class DashboardComponents:
             html.H3("📊 Daily Performance", className='fade-in', 
                    style={'marginBottom': '24px'}),
             html.Div(stats_cards, className='row fade-in'),
+            html.Div(edge_cards, className='row fade-in', style={'marginTop': '16px'}),
             html.Div([
                 html.H5("📈 Contract Breakdown", style={'marginTop': '24px', 'marginBottom': '16px'}),
                 html.Div(contract_breakdown)
@@ -216,15 +304,45 @@ class DashboardComponents:
         ], className='trading-card')
 
     @staticmethod
-    def _create_trade_cards(trades_df, date_str=''):
+    def _create_edge_cards(metrics):
+        """Profit factor, expectancy, drawdown and streak cards for the summary section."""
+        profit_factor = metrics['profit_factor']
+        expectancy = metrics['expectancy']
+        stats = [
+            ("Profit Factor", "∞" if profit_factor == float('inf') else f"{profit_factor:.2f}",
+             "profit" if profit_factor >= 1 else "loss"),
+            ("Expectancy", f"${expectancy:.2f}", "profit" if expectancy >= 0 else "loss"),
+            ("Avg Win / Loss", f"${metrics['avg_win']:.0f} / ${metrics['avg_loss']:.0f}", "neutral"),
+            ("Max Drawdown", f"${metrics['max_drawdown']:.2f}", "loss" if metrics['max_drawdown'] < 0 else "neutral"),
+            ("Streaks (W/L)", f"{metrics['longest_win_streak']}/{metrics['longest_loss_streak']}", "neutral")
+        ]
+        return [
+            html.Div([
+                html.Div([
+                    html.Div(label, className='stats-label'),
+                    html.Div(value, className=f'stats-value {tone}')
+                ], className='stats-card')
+            ], style={'flex': '1', 'padding': '0 8px'})
+            for label, value, tone in stats
+        ]
+
+    @staticmethod
+    def _create_trade_cards(trades_df, date_str='', trade_note_manager=None, start=0, stop=None, drafts=None):
         if trades_df.empty:
             return html.Div([
                 html.H4("Individual Trade Analysis", style={'color': '#2c3e50', 'marginBottom': '20px'}),
                 html.P("No trade data to display", style={'color': '#7f8c8d', 'fontStyle': 'italic'})
             ])
 
-        # Create display version of DataFrame with formatted times
-        display_df = trades_df.copy()
+        # Only build the requested page of cards; row labels keep the day-wide trade numbers
+        page_df = trades_df.iloc[start:stop]
+
+        # Initialize trade note manager
+        if trade_note_manager is None:
+            trade_note_manager = TradeNoteManager()
+        
+        # Trade IDs, saved notes and colors for the whole page in one pass
+        display_df = trade_note_manager.annotate(page_df, date_str)
         
         # Replace datetime columns with formatted versions for display
         if 'entry_time_display' in display_df.columns:
@@ -236,25 +354,16 @@ class DashboardComponents:
         
         # Remove sorting helper columns
         display_df = display_df.drop([col for col in display_df.columns if col.endswith('_sort')], axis=1)
-
-        # Initialize trade note manager
-        trade_note_manager = TradeNoteManager()
         
         # Create individual trade cards
         trade_cards = []
         
         for idx, row in display_df.iterrows():
-            # Create unique trade ID
-            trade_id = trade_note_manager.generate_trade_id(
-                date_str, 
-                str(row.get('contract', '')), 
-                str(row.get('entry_time', '')), 
-                str(row.get('exit_time', ''))
-            )
-            
-            # Load existing note and color for this trade
-            existing_note = trade_note_manager.get_trade_note(trade_id)
-            existing_color = trade_note_manager.get_trade_color(trade_id)
+            # Existing note and color for this trade, or unsaved edits from another page
+            trade_id, existing_note, existing_color = row['trade_id'], row['note'], row['color']
+            if drafts and trade_id in drafts:
+                existing_note = drafts[trade_id].get('note') or existing_note
+                existing_color = drafts[trade_id].get('color') or existing_color
             
             # Define color scheme with better contrast
             color_options = [
@@ -408,9 +517,4 @@ class DashboardComponents:
             
             trade_cards.append(trade_card)
         
-        return html.Div([
-            html.H3("🔍 Individual Trade Analysis", 
-                   className='fade-in',
-                   style={'marginBottom': '24px', 'color': 'var(--text-primary)'}),
-            html.Div(trade_cards, className='slide-in')
-        ])
\ No newline at end of file
+        return html.Div(trade_cards, className='slide-in')
\ No newline at end of file
@@ -1,13 +1,13 @@
 import calendar
 import os
 from datetime import datetime
-from config import DATA_DIR
+from data.data_index import get_data_index
 from dash import html
 
 class MonthlyFallback:
     """Fallback monthly summary that works without pandas/plotly but still uses dash html"""
     
-    def create_monthly_summary(self, year=None, month=None):
+    def create_monthly_summary(self, year=None, month=None, progress=None):
         """Create a simple monthly summary using dash html components"""
         if year is None or month is None:
             current_date = datetime.now()
@@ -100,30 +100,13 @@ class MonthlyFallback:
         """Simple version without pandas/processing"""
         monthly_data = {}
         
-        # Get all days in the month
-        num_days = calendar.monthrange(year, month)[1]
-        
-        for day in range(1, num_days + 1):
-            date_str = f"{year}-{month:02d}-{day:02d}"
-            
-            # Try multiple file patterns
-            possible_files = [
-                f'{date_str}.csv',
-                f'trades_{date_str}.csv', 
-                f'{date_str}.xls',
-                f'trades_{date_str}.xls',
-                f'{date_str}.xlsx',
-                f'trades_{date_str}.xlsx'
-            ]
-            
-            for filename in possible_files:
-                file_path = os.path.join(DATA_DIR, filename)
-                if os.path.exists(file_path):
-                    monthly_data[date_str] = {
-                        'file': filename,
-                        'path': file_path
-                    }
-                    break
+        index = get_data_index()
+        for date_str in index.dates_in_month(year, month):
+            file_path = index.find(date_str)
+            monthly_data[date_str] = {
+                'file': os.path.basename(file_path),
+                'path': file_path
+            }
         
         return monthly_data
     
@@ -1,32 +1,44 @@
 import calendar
-import pandas as pd
-import os
+import logging
 from datetime import datetime, timedelta
 from dash import html, dcc, callback, Input, Output, State
 import plotly.graph_objects as go
 import plotly.express as px
+from data.daily_rollup import get_daily_rollups
+from data.data_index import get_data_index
+from data.quality_index import QUALITIES, get_quality_index
 from data.trade_processor import TradeProcessor
 from contracts.contract_manager import ContractManager
-from config import DATA_DIR
+from monitoring.timing import timed
+
+logger = logging.getLogger(__name__)
 
 class MonthlySummaryComponents:
     def __init__(self):
-        self.trade_processor = TradeProcessor(ContractManager())
+        self.contract_manager = ContractManager()
+        self.trade_processor = TradeProcessor(self.contract_manager)
+        self.data_index = get_data_index()
+        self.rollups = get_daily_rollups()
+        self.quality_index = get_quality_index()
     
-    def create_monthly_summary(self, year=None, month=None):
-        """Create monthly summary tab with calendar view"""
-        print(f"DEBUG: create_monthly_summary called with year={year}, month={month}")
+    @timed('monthly_summary.create_monthly_summary')
+    def create_monthly_summary(self, year=None, month=None, progress=None):
+        """Create monthly summary tab with calendar view
+
+        progress, if given, is called as progress(days done, days in month with exports).
+        """
+        logger.debug('create_monthly_summary called with year=%s, month=%s', year, month)
         
         if year is None or month is None:
             current_date = datetime.now()
             year = current_date.year
             month = current_date.month
-            print(f"DEBUG: Using current date - year={year}, month={month}")
+            logger.debug('Using current date - year=%s, month=%s', year, month)
         
-        # Get month data
-        print(f"DEBUG: Getting monthly data for {year}-{month}")
-        monthly_data = self._get_monthly_data(year, month)
-        print(f"DEBUG: Found {len(monthly_data)} days with data: {list(monthly_data.keys())}")
+        # Per-day totals come from the rollup store and rated trades from the quality index
+        logger.debug('Getting monthly data for %s-%s', year, month)
+        monthly_data = self._get_monthly_data(year, month, progress=progress)
+        logger.debug('Found %s days with data: %s', len(monthly_data), list(monthly_data.keys()))
         
         return html.Div([
             # Month navigation
@@ -337,79 +349,10 @@ class MonthlySummaryComponents:
             html.Div([cumulative_chart], className='col-md-6')
         ], className='row trading-card', style={'margin': '20px'})
     
-    def _get_monthly_data(self, year, month):
-        """Get all trading data for a specific month"""
-        print(f"DEBUG: _get_monthly_data called for {year}-{month}")
-        print(f"DEBUG: DATA_DIR = {DATA_DIR}")
-        
-        monthly_data = {}
-        
-        # Get all days in the month
-        num_days = calendar.monthrange(year, month)[1]
-        print(f"DEBUG: Month has {num_days} days")
-        
-        for day in range(1, num_days + 1):
-            date_str = f"{year}-{month:02d}-{day:02d}"
-            
-            # Try multiple file patterns and formats
-            possible_files = [
-                f'{date_str}.csv',
-                f'trades_{date_str}.csv', 
-                f'{date_str}.xls',
-                f'trades_{date_str}.xls',
-                f'{date_str}.xlsx',
-                f'trades_{date_str}.xlsx'
-            ]
-            
-            file_found = None
-            for filename in possible_files:
-                file_path = os.path.join(DATA_DIR, filename)
-                if os.path.exists(file_path):
-                    file_found = file_path
-                    print(f"DEBUG: Found file: {filename}")
-                    break
-            
-            if not file_found:
-                continue
-                
-            try:
-                # Determine file type and process accordingly
-                if file_found.endswith('.csv'):
-                    trades_df = self.trade_processor.calculate_trades_csv_rithmic(file_found)
-                else:
-                    # For .xls/.xlsx files, use the original Excel processing method
-                    print(f"DEBUG: Processing Excel file: {file_found}")
-                    import pandas as pd
-                    df = pd.read_excel(file_found, header=None)
-                    df.columns = ["date", "time", "exchange", "contract", "B/S", "Size", "Price", "F", "Direct"]
-                    processed_df = self.trade_processor.process_raw_data(df)
-                    trades_df = self.trade_processor.calculate_trades(processed_df)
-                
-                print(f"DEBUG: Processed {file_found}, got {len(trades_df)} trades")
-                if not trades_df.empty and 'pnl' in trades_df.columns:
-                    total_pnl = trades_df['pnl'].sum()
-                    trade_count = len(trades_df)
-                    
-                    # Get per-contract breakdown
-                    contract_summary = {}
-                    if 'contract' in trades_df.columns:
-                        for contract in trades_df['contract'].str.split().str[0].unique():
-                            contract_trades = trades_df[trades_df['contract'].str.startswith(contract)]
-                            contract_summary[contract] = {
-                                'pnl': contract_trades['pnl'].sum(),
-                                'trades': len(contract_trades)
-                            }
-                    
-                    monthly_data[date_str] = {
-                        'total_pnl': total_pnl,
-                        'trade_count': trade_count,
-                        'contracts': contract_summary
-                    }
-            except Exception as e:
-                print(f"Error processing {date_str}: {e}")
-                continue
-        
-        return monthly_data
+    @timed('monthly_summary.get_monthly_data')
+    def _get_monthly_data(self, year, month, progress=None):
+        """Get all trading data for a specific month, served from the daily rollup store."""
+        return self.rollups.month(year, month, progress)
     
     def _create_trade_quality_analysis(self, monthly_data, year, month):
         """Create trade quality analysis section"""
@@ -541,137 +484,37 @@ class MonthlySummaryComponents:
             html.Div(quality_sections)
         ], className='trading-card', style={'margin': '20px'})
     
+    @timed('monthly_summary.get_trade_quality_data')
     def _get_trade_quality_data(self, year, month):
-        """Get trade quality data for all days in the month"""
+        """Get trade quality data for all days in the month, served from the quality index."""
         from notes.trade_note_manager import TradeNoteManager
         
         trade_note_manager = TradeNoteManager()
-        print(f"DEBUG: Looking for trade quality data for {year}-{month}")
+        logger.debug('Looking for trade quality data for %s-%s', year, month)
         
-        # Check if any trade colors exist at all
-        all_colors = trade_note_manager.load_trade_colors()
-        print(f"DEBUG: Total trade colors saved: {len(all_colors)}")
-        if all_colors:
-            print(f"DEBUG: Sample trade IDs with colors: {list(all_colors.items())[:5]}")
-        quality_data = {
-            'fantastic': {'trades': [], 'total_pnl': 0},
-            'good': {'trades': [], 'total_pnl': 0},
-            'attention': {'trades': [], 'total_pnl': 0},
-            'uncertain': {'trades': [], 'total_pnl': 0},
-            'bad': {'trades': [], 'total_pnl': 0}
-        }
+        # Notes can change after a trade is rated, so they are joined at read time
+        all_notes = trade_note_manager.load_trade_notes_for_month(year, month)
+        quality_data = {quality: {'trades': [], 'total_pnl': 0} for quality in QUALITIES}
         
-        # Get all days in the month
-        num_days = calendar.monthrange(year, month)[1]
+        rated_trades = self.quality_index.month(year, month)
+        logger.debug('Rated trades this month: %s', len(rated_trades))
         
-        for day in range(1, num_days + 1):
-            date_str = f"{year}-{month:02d}-{day:02d}"
-            
-            # Try to find and process the trading file for this day
-            possible_files = [
-                f'{date_str}.csv',
-                f'trades_{date_str}.csv', 
-                f'{date_str}.xls',
-                f'trades_{date_str}.xls',
-                f'{date_str}.xlsx',
-                f'trades_{date_str}.xlsx'
-            ]
-            
-            file_found = None
-            for filename in possible_files:
-                file_path = os.path.join(DATA_DIR, filename)
-                if os.path.exists(file_path):
-                    file_found = file_path
-                    break
-            
-            if not file_found:
-                continue
-                
-            try:
-                print(f"DEBUG: Processing file {file_found} for {date_str}")
-                import pandas as pd
-                
-                # Process the trades file to get individual trades using the same method as app.py
-                if file_found.endswith('.csv'):
-                    trades_df = self.trade_processor.calculate_trades_csv_rithmic(file_found)
-                else:
-                    # For .xls/.xlsx files, use the original Excel processing method
-                    df = pd.read_excel(file_found, header=None)
-                    df.columns = ["date", "time", "exchange", "contract", "B/S", "Size", "Price", "F", "Direct"]
-                    processed_df = self.trade_processor.process_raw_data(df)
-                    trades_df = self.trade_processor.calculate_trades(processed_df)
-                
-                print(f"DEBUG: Found {len(trades_df)} trades in {date_str}")
-                print(f"DEBUG: Trades DataFrame columns: {list(trades_df.columns)}")
-                if not trades_df.empty:
-                    print(f"DEBUG: First trade sample: {trades_df.iloc[0].to_dict()}")
-                
-                # Format times for display (same as dashboard_components)
-                if 'entry_time' in trades_df.columns:
-                    trades_df['entry_time_display'] = trades_df['entry_time'].dt.strftime('%I:%M:%S %p')
-                if 'exit_time' in trades_df.columns:
-                    trades_df['exit_time_display'] = trades_df['exit_time'].dt.strftime('%I:%M:%S %p')
-                
-                # Get trade qualities and notes for each trade
-                trades_with_ratings = 0
-                for index, trade_row in trades_df.iterrows():
-                    if 'pnl' not in trade_row or pd.isna(trade_row['pnl']):
-                        print(f"DEBUG: Skipping trade {index} - no P&L data")
-                        continue
-                    
-                    # Generate trade ID using the same method as dashboard_components
-                    # Use the display formatted times (same as dashboard)
-                    entry_time_str = trade_row.get('entry_time_display', str(trade_row.get('entry_time', '')))
-                    exit_time_str = trade_row.get('exit_time_display', str(trade_row.get('exit_time', '')))
-                    
-                    trade_id = trade_note_manager.generate_trade_id(
-                        date_str, 
-                        str(trade_row.get('contract', '')), 
-                        entry_time_str, 
-                        exit_time_str
-                    )
-                    trade_color = trade_note_manager.get_trade_color(trade_id)
-                    trade_note = trade_note_manager.get_trade_note(trade_id)
-                    
-                    print(f"DEBUG: Trade {index} - ID: {trade_id}")
-                    print(f"DEBUG: Trade {index} - P&L: {trade_row['pnl']}, Contract: {trade_row.get('contract', 'N/A')}")
-                    print(f"DEBUG: Trade {index} - Color: {trade_color}, Note: {trade_note}")
-                    
-                    if trade_color and trade_color != 'none' and trade_color in quality_data:
-                        print(f"DEBUG: ✅ Adding trade to {trade_color} category")
-                        trades_with_ratings += 1
-                        quality_data[trade_color]['trades'].append({
-                            'date': date_str,
-                            'pnl': float(trade_row['pnl']),
-                            'note': trade_note or '',
-                            'trade_id': trade_id,
-                            'contract': str(trade_row.get('contract', 'N/A')),
-                            'quantity': trade_row.get('quantity', 0),
-                            'entry_time': entry_time_str,
-                            'exit_time': exit_time_str,
-                            'direction': trade_row.get('direction', 'N/A')
-                        })
-                        quality_data[trade_color]['total_pnl'] += float(trade_row['pnl'])
-                    else:
-                        print(f"DEBUG: ❌ Trade not added - Color: {trade_color}, Valid: {trade_color in quality_data if trade_color else False}")
-                
-                print(f"DEBUG: Found {trades_with_ratings} trades with ratings for {date_str}")
-                        
-            except Exception as e:
-                print(f"Error processing trade quality for {date_str}: {e}")
-                continue
+        for trade_id, record in rated_trades.items():
+            trade = dict(record, trade_id=trade_id, note=all_notes.get(trade_id, ''))
+            quality_data[trade.pop('quality')]['trades'].append(trade)
+            quality_data[record['quality']]['total_pnl'] += record['pnl']
         
         # Debug: Show final results
         total_rated_trades = sum(len(data['trades']) for data in quality_data.values())
-        print(f"DEBUG: FINAL SUMMARY - Total rated trades found: {total_rated_trades}")
+        logger.debug('FINAL SUMMARY - Total rated trades found: %s', total_rated_trades)
         for category, data in quality_data.items():
             if data['trades']:
-                print(f"DEBUG: Found {len(data['trades'])} {category} trades with total P&L: ${data['total_pnl']:.2f}")
+                logger.debug('Found %s %s trades with total P&L: $%.2f', len(data['trades']), category, data['total_pnl'])
         
         if total_rated_trades == 0:
-            print("DEBUG: ⚠️ No rated trades found! Possible reasons:")
-            print("DEBUG: 1. No trades have quality ratings assigned")
-            print("DEBUG: 2. Trade IDs don't match between saving and loading")
-            print("DEBUG: 3. All trades have 'none' quality rating")
+            logger.debug('⚠️ No rated trades found! Possible reasons:')
+            logger.debug('1. No trades have quality ratings assigned')
+            logger.debug("2. Trade IDs don't match between saving and loading")
+            logger.debug("3. All trades have 'none' quality rating")
         
         return quality_data
\ No newline at end of file
@@ -0,0 +1,199 @@
+import logging
+from datetime import date, timedelta
+
+import plotly.express as px
+import plotly.graph_objects as go
+from dash import html, dcc
+
+from data.range_analytics import get_range_analytics
+
+logger = logging.getLogger(__name__)
+
+RANGE_PRESETS = [
+    {'label': 'Year to Date', 'value': 'ytd'},
+    {'label': 'Last 30 Days', 'value': 'last-30'},
+    {'label': 'Last 90 Days', 'value': 'last-90'},
+    {'label': 'Last 12 Months', 'value': 'last-365'},
+    {'label': 'Custom Range', 'value': 'custom'}
+]
+
+CHART_LAYOUT = dict(
+    plot_bgcolor='#2c2c2e',
+    paper_bgcolor='#2c2c2e',
+    font=dict(color='#ffffff'),
+    title_font_color='#ffffff',
+    xaxis=dict(gridcolor='#48484a', color='#ffffff'),
+    yaxis=dict(gridcolor='#48484a', color='#ffffff')
+)
+
+
+class RangeSummaryComponents:
+    def __init__(self):
+        self.analytics = get_range_analytics()
+
+    @staticmethod
+    def resolve_range(preset, start_date=None, end_date=None, today=None):
+        """(start_date, end_date) strings for a preset, or the picker dates for 'custom'."""
+        today = today or date.today()
+        if preset == 'custom' and start_date and end_date:
+            return start_date[:10], end_date[:10]
+        days_back = {'last-30': 30, 'last-90': 90, 'last-365': 365}.get(preset)
+        start = today - timedelta(days=days_back) if days_back else date(today.year, 1, 1)
+        return start.strftime('%Y-%m-%d'), today.strftime('%Y-%m-%d')
+
+    @staticmethod
+    def create_range_controls():
+        """Preset selector and date picker shown above the range summary"""
+        today = date.today()
+        return html.Div([
+            dcc.Dropdown(
+                id='range-preset',
+                options=RANGE_PRESETS,
+                value='ytd',
+                clearable=False,
+                style={'width': '200px', 'display': 'inline-block', 'margin': '0 10px', 'verticalAlign': 'middle'}
+            ),
+            dcc.DatePickerRange(
+                id='range-dates',
+                start_date=date(today.year, 1, 1),
+                end_date=today,
+                display_format='YYYY-MM-DD',
+                style={'display': 'inline-block', 'margin': '0 10px', 'verticalAlign': 'middle'}
+            )
+        ], style={'textAlign': 'center', 'margin': '20px', 'backgroundColor': 'var(--bg-secondary)',
+                  'padding': '16px', 'borderRadius': 'var(--radius-large)', 'border': '1px solid var(--border-color)'})
+
+    def create_range_summary(self, preset='ytd', start_date=None, end_date=None, progress=None):
+        """Create the performance view for a date range (progress(done, total) over its trading days)"""
+        start_date, end_date = self.resolve_range(preset, start_date, end_date)
+        logger.debug('create_range_summary for %s..%s', start_date, end_date)
+        report = self.analytics.compute(start_date, end_date, progress)
+
+        if report['totals'] is None:
+            return html.Div([
+                html.H4("Performance", style={'color': 'var(--text-primary)'}),
+                html.P(f"No trading data between {start_date} and {end_date}", style={'color': 'var(--text-secondary)'})
+            ], className='trading-card', style={'margin': '20px'})
+
+        return html.Div([
+            self._create_range_stats(report),
+            self._create_equity_chart(report),
+            self._create_contract_charts(report),
+            self._create_time_heatmaps(report),
+            self._create_skipped_days(report)
+        ])
+
+    def _create_range_stats(self, report):
+        totals = report['totals']
+        equity = report['equity']
+        trading_days = totals['trading_days']
+        winning_days = int((equity['pnl'] > 0).sum())
+        avg_daily_pnl = totals['total_pnl'] / trading_days
+        metrics = report['metrics']
+        profit_factor = metrics['profit_factor']
+        drawdown_detail = f"longest underwater {metrics['max_drawdown_trades']} trades"
+        if metrics['max_drawdown_duration'] is not None:
+            drawdown_detail += f" ({metrics['max_drawdown_duration'].days} days)"
+
+        def stat(title, value, color='var(--text-primary)', detail=None):
+            children = [
+                html.H5(title, style={'margin': '0', 'color': 'var(--text-secondary)'}),
+                html.H3(value, style={'margin': '5px 0', 'color': color})
+            ]
+            if detail:
+                children.append(html.P(detail, style={'margin': '0', 'fontSize': '12px', 'color': 'var(--text-tertiary)'}))
+            return html.Div(children, className='col-md-3', style={'textAlign': 'center', 'padding': '10px'})
+
+        def pnl_color(value):
+            return 'var(--profit-color)' if value >= 0 else 'var(--loss-color)'
+
+        return html.Div([
+            html.H4(f"Performance {report['start_date']} to {report['end_date']}",
+                    style={'color': 'var(--text-primary)', 'marginBottom': '15px'}),
+            html.Div([
+                stat("Total P&L", f"${totals['total_pnl']:,.2f}", pnl_color(totals['total_pnl'])),
+                stat("Trading Days", f"{trading_days}", detail=f"{winning_days} green days"),
+                stat("Trade Win Rate", f"{totals['win_rate']:.1f}%",
+                     detail=f"{totals['wins']}W / {totals['losses']}L of {totals['trade_count']}"),
+                stat("Avg Daily P&L", f"${avg_daily_pnl:,.2f}", pnl_color(avg_daily_pnl))
+            ], className='row'),
+            html.Hr(style={'margin': '15px 0', 'borderColor': 'var(--border-color)'}),
+            html.Div([
+                stat("Profit Factor", "∞" if profit_factor == float('inf') else f"{profit_factor:.2f}",
+                     pnl_color(profit_factor - 1), detail=f"payoff {metrics['payoff_ratio']:.2f}"),
+                stat("Expectancy", f"${metrics['expectancy']:,.2f}", pnl_color(metrics['expectancy']),
+                     detail=f"avg win ${metrics['avg_win']:,.0f} / loss ${metrics['avg_loss']:,.0f}"),
+                stat("Max Drawdown", f"${metrics['max_drawdown']:,.2f}", 'var(--loss-color)',
+                     detail=drawdown_detail),
+                stat("Longest Streaks", f"{metrics['longest_win_streak']}W / {metrics['longest_loss_streak']}L")
+            ], className='row')
+        ], className='trading-card', style={'margin': '20px'})
+
+    def _create_equity_chart(self, report):
+        equity = report['equity']
+        fig = px.line(
+            x=equity.index,
+            y=equity['cumulative'],
+            title="Cumulative P&L",
+            labels={'x': 'Date', 'y': 'Cumulative P&L ($)'},
+            markers=True
+        )
+        fig.update_traces(line_color='#007aff')
+        fig.update_layout(**CHART_LAYOUT)
+        return html.Div([dcc.Graph(figure=fig)], className='trading-card', style={'margin': '20px'})
+
+    def _create_contract_charts(self, report):
+        contracts = report['contracts']
+        pnl_fig = px.bar(
+            x=contracts.index,
+            y=contracts['pnl'],
+            title="P&L by Contract",
+            labels={'x': 'Contract', 'y': 'P&L ($)'},
+            color=contracts['pnl'],
+            color_continuous_scale=['#ff453a', '#48484a', '#30d158']
+        )
+        pnl_fig.update_layout(showlegend=False, coloraxis_showscale=False, **CHART_LAYOUT)
+
+        win_fig = px.bar(
+            x=contracts.index,
+            y=contracts['win_rate'],
+            title="Win Rate by Contract",
+            labels={'x': 'Contract', 'y': 'Win Rate (%)'},
+            text=[f"{trades} trades" for trades in contracts['trades']]
+        )
+        win_fig.update_traces(marker_color='#007aff')
+        win_fig.update_layout(**CHART_LAYOUT)
+        win_fig.update_yaxes(range=[0, 100])
+
+        return html.Div([
+            html.Div([dcc.Graph(figure=pnl_fig)], className='col-md-6'),
+            html.Div([dcc.Graph(figure=win_fig)], className='col-md-6')
+        ], className='row trading-card', style={'margin': '20px'})
+
+    def _create_time_heatmaps(self, report):
+        heatmaps = []
+        for title, frame, fmt, colorscale, zmid in (
+                ("P&L by Weekday and Entry Hour", report['heatmap_pnl'], '$%{z:,.2f}',
+                 ['#ff453a', '#48484a', '#30d158'], 0),
+                ("Trades by Weekday and Entry Hour", report['heatmap_trades'], '%{z}', 'Blues', None)):
+            fig = go.Figure(go.Heatmap(
+                z=frame.values,
+                x=[f"{hour:02d}:00" for hour in frame.columns],
+                y=list(frame.index),
+                colorscale=colorscale,
+                zmid=zmid,
+                hovertemplate=f'%{{y}} %{{x}}: {fmt}<extra></extra>'
+            ))
+            fig.update_layout(title=title, **CHART_LAYOUT)
+            fig.update_yaxes(autorange='reversed')
+            heatmaps.append(html.Div([dcc.Graph(figure=fig)], className='col-md-6'))
+        return html.Div(heatmaps, className='row trading-card', style={'margin': '20px'})
+
+    def _create_skipped_days(self, report):
+        if not report['errors']:
+            return html.Div()
+        return html.Div([
+            html.P(f"{len(report['errors'])} day(s) skipped because their export could not be read: "
+                   + ', '.join(sorted(report['errors'])),
+                   style={'color': 'var(--text-tertiary)', 'fontSize': '12px'})
+        ], style={'margin': '20px'})
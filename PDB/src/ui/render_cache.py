@@ -0,0 +1,74 @@
+import logging
+import threading
+from collections import OrderedDict
+
+from config import RENDER_CACHE_SIZE
+
+logger = logging.getLogger(__name__)
+
+
+class RenderCache:
+    """Size-bounded LRU cache of rendered dashboard component trees.
+
+    Keys are (date_str, data fingerprint, notes/colors revision) tuples, so a
+    changed export or a new rating simply misses. invalidate_dates() drops
+    every entry for the given dates, e.g. after a save.
+    """
+
+    def __init__(self, max_entries=RENDER_CACHE_SIZE):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        """Return the cached components for key, or None on a miss."""
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            self.misses += 1
+            return None
+
+    def put(self, key, components):
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[key] = components
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def get_or_render(self, key, render):
+        """Return the cached components for key, calling render() on a miss."""
+        components = self.get(key)
+        if components is not None:
+            logger.debug('Render cache hit for %s', key[0])
+            return components
+        components = render()
+        self.put(key, components)
+        logger.debug('Render cache miss for %s (%s)', key[0], self.stats())
+        return components
+
+    def invalidate_dates(self, date_strs):
+        """Drop every entry whose date is in date_strs."""
+        date_strs = set(date_strs)
+        with self._lock:
+            for key in [key for key in self._entries if key[0] in date_strs]:
+                del self._entries[key]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        """Hit/miss counters and current size."""
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'entries': len(self._entries),
+                'max_entries': self.max_entries
+            }
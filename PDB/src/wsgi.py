@@ -0,0 +1,26 @@
+"""Production entry point: the dashboard's WSGI server for a multi-process pre-fork server.
+
+    gunicorn -c gunicorn.conf.py wsgi:server
+
+Importing this module builds the dashboard and warms its state, so with
+preload_app the work is done once in the parent and shared copy-on-write by
+every worker. Running it directly serves with the single-process threaded
+Werkzeug server instead (for machines without gunicorn, e.g. Windows).
+"""
+import logging
+
+from app import TradingDashboard
+from config import SERVER_BIND
+
+logger = logging.getLogger(__name__)
+
+dashboard = TradingDashboard()
+dashboard.warm_up()
+server = dashboard.app.server
+
+
+if __name__ == '__main__':
+    host, _, port = SERVER_BIND.rpartition(':')
+    logger.info('Serving on %s without a pre-fork server', SERVER_BIND)
+    dashboard.start_ingest_watcher()
+    dashboard.app.run(host=host or '127.0.0.1', port=int(port), debug=False, threaded=True)